@@ -1,3 +1,7 @@
-from suffix_config import *
-from texture_config import *
-from type_define import *
\ No newline at end of file
+"""
+TexNamingImporter の Python 側。
+
+各モジュールは Content/Python を sys.path に置いた状態でトップレベルとして import される
+（C++ モジュールが追加する）。ここでは何も import しない: パッケージとして読み込まれても
+unreal や重いモジュールを巻き込まず、テストランナーの収集も軽く保つため。
+"""
@@ -0,0 +1,90 @@
+"""
+テクスチャ 1 枚あたりの処理時間を、従来の exec 経路と常駐サービス経路で比較するベンチマーク。
+
+- exec    : C++ の ExecPythonFile_NoCwdChange と同様に sys.argv を差し替えて
+            texture_configurator.py を runpy.run_path で毎回実行する
+- service : texture_configurator_service.configure() を直接呼び出す
+
+unreal モジュールは tests/unreal_stub.py のスタブを使うため、Editor 外で実行できる。
+
+実行例（Content/Python 直下で）:
+    python benchmarks/bench_configurator_service.py --count 500
+"""
+import argparse
+import contextlib
+import io
+import runpy
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+PYTHON_DIR = Path(__file__).resolve().parents[1]
+TESTS_DIR = PYTHON_DIR / "tests"
+for _p in (str(PYTHON_DIR), str(TESTS_DIR)):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
+
+import unreal_stub  # noqa: E402
+
+DEFAULT_CONFIG = TESTS_DIR / "assets" / "Config.json"
+SCRIPT_PATH = PYTHON_DIR / "texture_configurator.py"
+
+
+def make_texture_paths(count: int) -> List[str]:
+    suffixes = ["col_ww", "msk_cc", "nml_wm", "mat_cw", "flw_mm"]
+    paths = []
+    for i in range(count):
+        name = f"T_Bench{i:05d}_{suffixes[i % len(suffixes)]}"
+        paths.append(f"/Game/VFX/Bench/{name}.{name}")
+    return paths
+
+
+def run_exec_path(config_path: Path, texture_path: str) -> None:
+    argv_backup = list(sys.argv)
+    try:
+        sys.argv = [str(SCRIPT_PATH), str(config_path), texture_path]
+        runpy.run_path(str(SCRIPT_PATH), run_name="__main__")
+    except SystemExit:
+        pass
+    finally:
+        sys.argv = argv_backup
+
+
+def measure(label: str, fn: Callable[[str], None], paths: List[str]) -> float:
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for p in paths:
+            fn(p)
+        elapsed = time.perf_counter() - start
+    per_texture_ms = elapsed * 1000.0 / max(1, len(paths))
+    print(f"{label:<8} total={elapsed:8.3f}s  per_texture={per_texture_ms:8.3f}ms")
+    return per_texture_ms
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--count", type=int, default=200, help="計測するテクスチャ数")
+    parser.add_argument("--config", default=str(DEFAULT_CONFIG), help="使用する Config.json")
+    args = parser.parse_args(argv)
+
+    config_path = Path(args.config).resolve()
+    paths = make_texture_paths(args.count)
+    unreal_stub.install(paths)
+
+    import texture_configurator_service
+
+    exec_ms = measure("exec", lambda p: run_exec_path(config_path, p), paths)
+    texture_configurator_service.clear_cache()
+    service_ms = measure(
+        "service",
+        lambda p: texture_configurator_service.configure(p, config_path=config_path),
+        paths,
+    )
+    if service_ms > 0:
+        print(f"speedup  x{exec_ms / service_ms:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,136 @@
+"""
+ベンチマーク結果の保存（ベースライン JSON）と、回帰の判定。
+
+結果は段階ごとの「1 件あたりの時間（マイクロ秒）」で持つため、件数を変えて実行しても比較できる。
+現在値がベースラインの (1 + threshold) 倍を超えた段階を回帰とみなす。ベースラインに無い段階は
+新規として扱い、判定しない。
+
+ベースラインは計測したマシンに依存する。CI など別のマシンで判定する場合は、そのマシンで
+``bench_suite.py --save-baseline`` を実行して作り直すこと。
+
+ファイル形式:
+    {
+      "version": 1,
+      "environment": {"python": "3.11.7", "platform": "..."},
+      "stages": {"suffix_match": {"per_item_us": 1.23, "items": 100000, "repeat": 3}, ...}
+    }
+"""
+from __future__ import annotations
+
+import json
+import platform
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+BASELINE_VERSION = 1
+DEFAULT_THRESHOLD = 0.25
+
+
+@dataclass(frozen=True)
+class StageResult:
+    stage: str
+    # 1 件あたりの時間（マイクロ秒）。繰り返しのうち最短のもの
+    per_item_us: float
+    items: int
+    repeat: int = 1
+
+    def to_dict(self) -> dict:
+        return {"per_item_us": round(self.per_item_us, 4), "items": self.items, "repeat": self.repeat}
+
+    @classmethod
+    def from_dict(cls, stage: str, data: dict) -> "StageResult":
+        return cls(stage, float(data["per_item_us"]), int(data.get("items", 0)), int(data.get("repeat", 1)))
+
+
+@dataclass(frozen=True)
+class StageComparison:
+    stage: str
+    current_us: float
+    baseline_us: Optional[float]
+    threshold: float
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if self.baseline_us is None or self.baseline_us <= 0:
+            return None
+        return self.current_us / self.baseline_us
+
+    @property
+    def regressed(self) -> bool:
+        ratio = self.ratio
+        return ratio is not None and ratio > 1.0 + self.threshold
+
+    def format(self) -> str:
+        if self.ratio is None:
+            return f"{self.stage:<20} {self.current_us:12.3f} us/item  (no baseline)"
+        status = "REGRESSED" if self.regressed else "ok"
+        return (f"{self.stage:<20} {self.current_us:12.3f} us/item  baseline {self.baseline_us:12.3f}  "
+                f"x{self.ratio:5.2f} (limit x{1.0 + self.threshold:.2f})  {status}")
+
+
+def save_baseline(results: List[StageResult], file_path: Union[str, Path]) -> None:
+    p = Path(file_path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "version": BASELINE_VERSION,
+        "environment": {"python": platform.python_version(), "platform": platform.platform()},
+        "stages": {r.stage: r.to_dict() for r in results},
+    }
+    with p.open("w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def load_baseline(file_path: Union[str, Path]) -> Dict[str, StageResult]:
+    """ベースラインを読み込む。形式が違う場合は ValueError。"""
+    with Path(file_path).open("r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or data.get("version") != BASELINE_VERSION or not isinstance(data.get("stages"), dict):
+        raise ValueError(f"unsupported baseline file: {file_path}")
+    return {stage: StageResult.from_dict(stage, v) for stage, v in data["stages"].items()}
+
+
+def compare(
+    results: List[StageResult],
+    baseline: Dict[str, StageResult],
+    threshold: float = DEFAULT_THRESHOLD,
+    stage_thresholds: Optional[Dict[str, float]] = None,
+) -> List[StageComparison]:
+    """results をベースラインと比較する（stage_thresholds で段階ごとの許容幅を上書きできる）。"""
+    if threshold < 0:
+        raise ValueError("threshold must not be negative")
+    stage_thresholds = stage_thresholds or {}
+    comparisons = []
+    for r in results:
+        base = baseline.get(r.stage)
+        comparisons.append(StageComparison(
+            stage=r.stage,
+            current_us=r.per_item_us,
+            baseline_us=None if base is None else base.per_item_us,
+            threshold=stage_thresholds.get(r.stage, threshold),
+        ))
+    return comparisons
+
+
+def parse_stage_thresholds(values: List[str]) -> Dict[str, float]:
+    """["resolve=0.5", ...] を {"resolve": 0.5} にする。"""
+    out: Dict[str, float] = {}
+    for value in values:
+        stage, sep, number = value.partition("=")
+        if not sep or not stage:
+            raise ValueError(f"expected STAGE=RATIO: {value!r}")
+        out[stage.strip()] = float(number)
+    return out
+
+
+def report(comparisons: List[StageComparison], stream=None) -> bool:
+    """比較結果を表示し、回帰が無ければ True を返す。"""
+    stream = stream or sys.stdout
+    for c in comparisons:
+        print(c.format(), file=stream)
+    regressed = [c.stage for c in comparisons if c.regressed]
+    if regressed:
+        print(f"Performance regression in: {', '.join(regressed)}", file=stream)
+    return not regressed
@@ -0,0 +1,84 @@
+"""
+サフィックス抽出＋検証のマイクロベンチマーク。
+
+従来の処理（テクスチャごとに all_suffixes を作り直し、collect_suffixes_from_path と
+validate_suffixes を順に呼ぶ）と、事前構築済みの SuffixMatcher.match() を比較する。
+
+実行例（Content/Python 直下で）:
+    python benchmarks/bench_suffix_matcher.py --count 1000000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+PYTHON_DIR = Path(__file__).resolve().parents[1]
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+from config import Config  # noqa: E402
+from path_utils.path_functions import collect_suffixes_from_path  # noqa: E402
+from suffix_matcher import SuffixMatcher  # noqa: E402
+from validator import validate_suffixes  # noqa: E402
+
+DEFAULT_CONFIG = PYTHON_DIR / "tests" / "assets" / "Config.json"
+
+
+def make_names(count: int, suffix_grid: List[List[str]]) -> List[str]:
+    """有効な名前と、よくある誤り（順序違い・数不足・未知トークン）を混ぜた合成名を作る。"""
+    types = suffix_grid[0]
+    addrs = suffix_grid[1] if len(suffix_grid) > 1 else ["ww"]
+    names = []
+    for i in range(count):
+        t = types[i % len(types)]
+        a = addrs[(i // len(types)) % len(addrs)]
+        kind = i % 10
+        if kind == 7:
+            stem = f"T_Bench{i}_{a}_{t}"
+        elif kind == 8:
+            stem = f"T_Bench{i}_{t}"
+        elif kind == 9:
+            stem = f"T_Bench{i}_{t}_v2"
+        else:
+            stem = f"T_Bench{i}_8x8_{t}_{a}"
+        names.append(f"/Game/VFX/Bench/{stem}.{stem}")
+    return names
+
+
+def measure(label: str, fn: Callable[[str], object], names: List[str]) -> float:
+    start = time.perf_counter()
+    for n in names:
+        fn(n)
+    elapsed = time.perf_counter() - start
+    rate = len(names) / elapsed if elapsed > 0 else float("inf")
+    print(f"{label:<8} total={elapsed:8.3f}s  throughput={rate:12,.0f} names/s")
+    return elapsed
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--count", type=int, default=1_000_000, help="合成するファイル名の数")
+    parser.add_argument("--config", default=str(DEFAULT_CONFIG), help="使用する Config.json")
+    args = parser.parse_args(argv)
+
+    config = Config.load(args.config)
+    grid = config.build_suffix_grid()
+    names = make_names(args.count, grid)
+
+    def legacy(name: str):
+        all_suffixes = [suf for row in grid for suf in row]
+        suffixes, _tokens = collect_suffixes_from_path(name, all_suffixes)
+        return validate_suffixes(suffixes, grid)
+
+    matcher = SuffixMatcher(grid)
+
+    legacy_s = measure("legacy", legacy, names)
+    matcher_s = measure("matcher", matcher.match, names)
+    if matcher_s > 0:
+        print(f"speedup  x{legacy_s / matcher_s:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,219 @@
+"""
+主要な段階をまとめて計測し、保存済みのベースラインと比較して回帰を検出するベンチマーク。
+
+段階:
+    config_load    Config.json の読み込みと CompiledConfig の構築（1 回あたり）
+    suffix_match   合成名のサフィックス抽出＋検証（SuffixMatcher.match）
+    suffix_legacy  同じ名前を collect_suffixes_from_path + validate_suffixes で処理する従来経路
+    param_resolve  検証済みの名前の最終設定とトークン規則の解決（CompiledConfig.resolve）
+    apply_e2e      apply_texture_property_from_config で合成ディレクトリ全体に設定を反映する
+
+unreal モジュールは tests/unreal_stub.py のスタブを使うため、Editor 外で実行できる。
+各段階は --repeat 回実行し、最短の時間を 1 件あたりのマイクロ秒で記録する。
+比較・保存の形式は bench_gate.py を参照。
+
+実行例（Content/Python 直下で）:
+    # ベースラインを作る（計測するマシンで実行する）
+    python benchmarks/bench_suite.py --save-baseline
+    # ベースラインと比較し、30% を超えて遅くなった段階があれば終了コード 1
+    python benchmarks/bench_suite.py --threshold 0.3
+    # 段階を絞り、件数を増やす
+    python benchmarks/bench_suite.py --stages suffix_match param_resolve --names 1000000
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+BENCH_DIR = Path(__file__).resolve().parent
+PYTHON_DIR = BENCH_DIR.parent
+TESTS_DIR = PYTHON_DIR / "tests"
+for _p in (str(PYTHON_DIR), str(TESTS_DIR), str(BENCH_DIR)):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
+
+import unreal_stub  # noqa: E402
+
+unreal_stub.install()
+
+import texture_logging  # noqa: E402
+from bench_gate import (  # noqa: E402
+    DEFAULT_THRESHOLD,
+    StageResult,
+    compare,
+    load_baseline,
+    parse_stage_thresholds,
+    report,
+    save_baseline,
+)
+from bench_suffix_matcher import make_names  # noqa: E402
+from config import CompiledConfig, Config  # noqa: E402
+from path_utils.path_functions import collect_suffixes_from_path  # noqa: E402
+from texture_configurator import apply_texture_property_from_config  # noqa: E402
+from validator import validate_suffixes  # noqa: E402
+
+DEFAULT_CONFIG = TESTS_DIR / "assets" / "Config.json"
+DEFAULT_BASELINE = BENCH_DIR / "baselines.json"
+# 指定がない場合の許容幅は環境変数でも変えられる（CI のマシンごとの揺れに合わせる）
+THRESHOLD_ENV = "TEXNAMING_BENCH_THRESHOLD"
+
+STAGES = ("config_load", "suffix_match", "suffix_legacy", "param_resolve", "apply_e2e")
+
+
+def _best_of(repeat: int, run: Callable[[], int], setup: Callable[[], None] = lambda: None) -> Tuple[float, int]:
+    """setup → run を repeat 回行い、最短の経過秒数と run が返した件数を返す（setup は計測しない）。"""
+    best = float("inf")
+    items = 0
+    for _ in range(max(1, repeat)):
+        setup()
+        start = time.perf_counter()
+        items = run()
+        best = min(best, time.perf_counter() - start)
+    return best, items
+
+
+def bench_config_load(config_path: Path, loads: int) -> Callable[[], int]:
+    def run() -> int:
+        for _ in range(loads):
+            CompiledConfig.compile(Config.load(config_path))
+        return loads
+    return run
+
+
+def bench_suffix_match(compiled: CompiledConfig, names: List[str]) -> Callable[[], int]:
+    match = compiled.suffix_matcher.match
+
+    def run() -> int:
+        for name in names:
+            match(name)
+        return len(names)
+    return run
+
+
+def bench_suffix_legacy(compiled: CompiledConfig, names: List[str]) -> Callable[[], int]:
+    grid = compiled.suffix_grid
+
+    def run() -> int:
+        for name in names:
+            all_suffixes = [suf for row in grid for suf in row]
+            suffixes, _tokens = collect_suffixes_from_path(name, all_suffixes)
+            validate_suffixes(suffixes, grid)
+        return len(names)
+    return run
+
+
+def bench_param_resolve(compiled: CompiledConfig, names: List[str]) -> Callable[[], int]:
+    matched = []
+    for name in names:
+        m = compiled.suffix_matcher.match(name)
+        if m.validation.ok:
+            matched.append((name, m.suffixes, m.tokens))
+
+    def run() -> int:
+        resolve = compiled.resolve
+        for name, suffixes, tokens in matched:
+            resolve(name, suffixes, tokens)
+        return len(matched)
+    return run
+
+
+def make_asset_paths(count: int, compiled: CompiledConfig) -> List[str]:
+    """有効な名前だけを持つ合成ディレクトリ（サブディレクトリ 100 件ごと）を作る。"""
+    types = compiled.suffix_grid[0]
+    addrs = compiled.suffix_grid[1] if len(compiled.suffix_grid) > 1 else ["ww"]
+    paths = []
+    for i in range(count):
+        stem = f"T_Bench{i:06d}_{types[i % len(types)]}_{addrs[(i // len(types)) % len(addrs)]}"
+        paths.append(f"/Game/VFX/Bench/D{i // 100:04d}/{stem}.{stem}")
+    return paths
+
+
+def run_stages(args: argparse.Namespace) -> List[StageResult]:
+    config_path = Path(args.config).resolve()
+    compiled = CompiledConfig.compile(Config.load(config_path))
+    stages = set(args.stages)
+    names: List[str] = []
+    if stages & {"suffix_match", "suffix_legacy", "param_resolve"}:
+        names = make_names(args.names, compiled.suffix_grid)
+
+    plan: Dict[str, Callable[[], StageResult]] = {}
+
+    def add(stage: str, make_run: Callable[[], Callable[[], int]], setup: Callable[[], None] = lambda: None):
+        def measure() -> StageResult:
+            seconds, items = _best_of(args.repeat, make_run(), setup)
+            return StageResult(stage, seconds * 1e6 / max(1, items), items, args.repeat)
+        plan[stage] = measure
+
+    add("config_load", lambda: bench_config_load(config_path, args.loads))
+    add("suffix_match", lambda: bench_suffix_match(compiled, names))
+    add("suffix_legacy", lambda: bench_suffix_legacy(compiled, names))
+    add("param_resolve", lambda: bench_param_resolve(compiled, names))
+
+    asset_paths = make_asset_paths(args.assets, compiled) if "apply_e2e" in stages else []
+
+    def apply_run() -> Callable[[], int]:
+        def run() -> int:
+            with contextlib.redirect_stdout(io.StringIO()):
+                apply_texture_property_from_config(asset_paths, compiled, workers=args.jobs)
+            return len(asset_paths)
+        return run
+
+    # 毎回新しいスタブアセットから始める（反映済みの状態を引き継がない）
+    add("apply_e2e", apply_run, setup=lambda: unreal_stub.install(asset_paths))
+
+    results = []
+    for stage in STAGES:
+        if stage in stages:
+            result = plan[stage]()
+            print(f"{stage:<20} {result.per_item_us:12.3f} us/item  ({result.items} items, best of {result.repeat})")
+            results.append(result)
+    return results
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--config", default=str(DEFAULT_CONFIG), help="使用する Config.json")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES), help="計測する段階")
+    parser.add_argument("--names", type=int, default=100_000, help="サフィックス検証・設定解決に使う合成名の数")
+    parser.add_argument("--assets", type=int, default=10_000, help="apply_e2e の合成アセット数")
+    parser.add_argument("--loads", type=int, default=200, help="config_load の読み込み回数")
+    parser.add_argument("--repeat", type=int, default=3, help="各段階の繰り返し回数（最短を採用）")
+    parser.add_argument("--jobs", type=int, default=1, help="apply_e2e の準備ワーカー数")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="ベースライン JSON のパス")
+    parser.add_argument("--save-baseline", action="store_true", help="比較せずに結果をベースラインとして保存する")
+    parser.add_argument("--threshold", type=float, default=None,
+                        help=f"許容する遅化の割合（既定 {DEFAULT_THRESHOLD}、環境変数 {THRESHOLD_ENV}）")
+    parser.add_argument("--stage-threshold", action="append", default=[], metavar="STAGE=RATIO",
+                        help="段階ごとの許容幅（複数指定可）")
+    args = parser.parse_args(argv)
+
+    threshold = args.threshold
+    if threshold is None:
+        threshold = float(os.environ.get(THRESHOLD_ENV, DEFAULT_THRESHOLD))
+    try:
+        stage_thresholds = parse_stage_thresholds(args.stage_threshold)
+    except ValueError as e:
+        parser.error(str(e))
+
+    texture_logging.set_verbosity("ERROR")
+    results = run_stages(args)
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"baseline saved: {args.baseline}")
+        return 0
+
+    if not Path(args.baseline).is_file():
+        print(f"baseline not found: {args.baseline} (run with --save-baseline first)")
+        return 0
+    comparisons = compare(results, load_baseline(args.baseline), threshold, stage_thresholds)
+    print()
+    return 0 if report(comparisons) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
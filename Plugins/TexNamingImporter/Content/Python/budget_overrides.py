@@ -0,0 +1,105 @@
+"""
+メモリ予算（``budget_action: "lower"``）で下げた max_in_game の永続化。
+
+ディレクトリ一括実行で plan_budget_reductions() が求めた縮小は、この JSON に
+「アセットパス → max_in_game」として記録する。以降の処理（インポート時の configure_many、
+サブディレクトリだけの一括実行など）は budget_action が "lower" の間この記録を参照するため、
+サフィックス既定の値で縮小が取り消されることはない。
+
+- 同じアセットを再び縮小した場合は小さい方を残す（予算の再計算で大きく戻すことはしない）
+- budget_action を "warn" に戻すと記録は参照されなくなる（ファイルは残る）
+- 記録を消すには texture_directory_configurator.py の --reset-budget-overrides を使う
+
+既定の保存先: {ProjectDir}/Saved/TexNamingImporter/budget_overrides.json
+"""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Tuple, Union
+
+BUDGET_OVERRIDES_VERSION = 1
+BUDGET_OVERRIDES_FILE_NAME = "budget_overrides.json"
+
+
+class BudgetOverrides:
+    """アセットパス → 縮小後の max_in_game の対応表。load() / save() で JSON と相互変換する。"""
+
+    def __init__(self, path: Union[str, Path], sizes: Optional[Mapping[str, int]] = None):
+        self.path = Path(path)
+        self.sizes: Dict[str, int] = dict(sizes or {})
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "BudgetOverrides":
+        """記録を読み込む。ファイルが無い・壊れている・版が違う場合は空で開始する。"""
+        p = Path(path)
+        try:
+            data = json.loads(p.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(p)
+        if not isinstance(data, dict) or data.get("version") != BUDGET_OVERRIDES_VERSION:
+            return cls(p)
+        sizes = {
+            asset_path: size
+            for asset_path, size in (data.get("max_in_game") or {}).items()
+            if isinstance(size, int) and not isinstance(size, bool) and size > 0
+        }
+        return cls(p, sizes)
+
+    def merge(self, reductions: Mapping[str, int]) -> int:
+        """縮小結果を記録に加える（既存より小さい場合だけ更新）。更新した件数を返す。"""
+        changed = 0
+        for asset_path, size in reductions.items():
+            current = self.sizes.get(asset_path)
+            if current is None or size < current:
+                self.sizes[asset_path] = size
+                changed += 1
+        if changed:
+            self._dirty = True
+        return changed
+
+    def clear(self) -> None:
+        if self.sizes:
+            self.sizes.clear()
+            self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self.sizes)
+
+    def save(self) -> None:
+        """変更があれば JSON として保存する（一時ファイル経由で置き換え）。"""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": BUDGET_OVERRIDES_VERSION, "max_in_game": dict(sorted(self.sizes.items()))}
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1, ensure_ascii=False)
+        os.replace(tmp, self.path)
+        self._dirty = False
+        _cache.pop(str(self.path.resolve()), None)
+
+
+# 解決済みパス -> ((mtime_ns, size), 縮小の対応表)
+_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, int]]] = {}
+
+
+def load_cached(path: Union[str, Path]) -> Dict[str, int]:
+    """
+    記録を読み込み、アセットパス → max_in_game を返す（インポートごとの呼び出し向けにキャッシュする）。
+    ファイルの更新時刻またはサイズが変わった場合は読み直す。ファイルが無ければ空。
+    """
+    p = Path(path).resolve()
+    try:
+        st = os.stat(p)
+    except OSError:
+        return {}
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _cache.get(str(p))
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    sizes = BudgetOverrides.load(p).sizes
+    _cache[str(p)] = (stamp, sizes)
+    return sizes
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
 import json
+import os
 
 from type_define import (
     AddressMode,        # テクスチャのアドレスモード（CLAMP/WRAP/MIRROR 等）
@@ -13,12 +15,26 @@ from type_define import (
     MipGenKind,         # MipMap 生成モード（FromTextureGroup 等）
     TextureGroupKind,   # Texture Group 指定（World 等）
 )
+import stage_timer
+from directory_index import PathTrie, RunDirIndex
+from suffix_matcher import SuffixMatcher
+from token_rules import SUBUV_PATTERN, SUBUV_RULE_NAME, TokenRule, TokenRuleSet, compile_token_rules
+from validator import _extract_dir_from_asset_path, _normalize_unreal_path
 
 # ---------- 型エイリアス ----------
 AddressPair   = Tuple[AddressMode, AddressMode]                 # 2D（U, V）
 AddressTriple = Tuple[AddressMode, AddressMode, AddressMode]    # 3D（U, V, W）
 NumericSize   = Union[int, SizePreset]
 
+@lru_cache(maxsize=None)
+def _enum_members_by_value(enum_cls) -> Dict[object, object]:
+    """列挙体の 値 → メンバ 対応表（列挙体ごとに 1 度だけ構築）。"""
+    table: Dict[object, object] = {}
+    for m in enum_cls:
+        table.setdefault(getattr(m, "value", None), m)
+    return table
+
+
 # =========================
 # 個別タイプ設定: TextureConfigParams
 # =========================
@@ -55,9 +71,9 @@ class TextureConfigParams:
             return None
         if isinstance(name, int):
             # 整数での指定も許容（値に一致するメンバを探索）
-            for m in enum_cls:
-                if getattr(m, "value", None) == name:
-                    return m
+            m = _enum_members_by_value(enum_cls).get(name)
+            if m is not None:
+                return m
             raise ValueError(f"未知の {enum_cls.__name__} 整数値: {name}")
         if isinstance(name, str):
             s = name.strip()
@@ -148,6 +164,91 @@ def _parse_3d(val) -> AddressTriple:
     return (_to_addr(val[0]), _to_addr(val[1]), _to_addr(val[2]))
 
 
+# content_analysis に指定できる値（off: 解析しない / recommend: 提案をログに出す / apply: 提案を反映する）
+CONTENT_ANALYSIS_MODES = ("off", "recommend", "apply")
+
+# texture_group_budgets を超えたときの動作（warn: 警告のみ / lower: 大きいテクスチャから max_in_game を下げる）
+BUDGET_ACTIONS = ("warn", "lower")
+
+# ディレクトリ別に上書きできるキー
+_OVERLAY_KEYS = ("texture_config", "enable_subuv_texture_override", "subuv_max_in_game")
+
+
+def _merge_texture_params(base: TextureConfigParams, partial: dict) -> TextureConfigParams:
+    """base に partial（TextureConfigParams の一部フィールドの dict）を重ねた設定を返す。"""
+    merged = base.to_dict(minimal=False)
+    merged.update(partial)
+    return TextureConfigParams.from_dict(merged)
+
+
+def _parse_token_rules(raw) -> List[TokenRule]:
+    """token_rules を検証し、上書きを ResolvedTextureParams に渡せる値に変換した TokenRule の列を返す。"""
+    if raw is None:
+        return []
+    if not isinstance(raw, list):
+        raise ValueError("'token_rules' は配列で指定してください")
+    allowed = [f.name for f in fields(TextureConfigParams)]
+    defaults = TextureConfigParams().to_dict(minimal=False)
+    rules: List[TokenRule] = []
+    names = set()
+    for i, item in enumerate(raw):
+        if not isinstance(item, dict):
+            raise ValueError(f"token_rules[{i}] はオブジェクトで指定してください")
+        name = item.get("name")
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError(f"token_rules[{i}].name は空でない文字列で指定してください")
+        name = name.strip()
+        if name in names:
+            raise ValueError(f"token_rules の name が重複しています: {name!r}")
+        names.add(name)
+        pattern = item.get("pattern")
+        if not isinstance(pattern, str) or not pattern:
+            raise ValueError(f"token_rules['{name}'].pattern は空でない文字列で指定してください")
+        override = item.get("override") or {}
+        if not isinstance(override, dict):
+            raise ValueError(f"token_rules['{name}'].override はオブジェクトで指定してください")
+        unknown = set(override) - set(allowed)
+        if unknown:
+            raise ValueError(f"token_rules['{name}'].override に未知のキーがあります: {sorted(unknown)}（指定可能: {allowed}）")
+        parsed = TextureConfigParams.from_dict(dict(defaults, **override))
+        rules.append(TokenRule(name, pattern, tuple((k, getattr(parsed, k)) for k in allowed if k in override)))
+    # パターンの検証（不正なら ValueError）
+    TokenRuleSet(rules)
+    return rules
+
+
+def _parse_directory_overrides(raw, params_map: Dict[str, TextureConfigParams]) -> Dict[str, dict]:
+    """directory_overrides を検証し、キーを正規化したディレクトリにして返す。"""
+    if raw is None:
+        return {}
+    if not isinstance(raw, dict):
+        raise ValueError("'directory_overrides' はオブジェクトで指定してください")
+    result: Dict[str, dict] = {}
+    for dir_path, overlay in raw.items():
+        normalized = _normalize_unreal_path(dir_path)
+        if not normalized:
+            raise ValueError(f"directory_overrides のディレクトリが空です: {dir_path!r}")
+        if not isinstance(overlay, dict):
+            raise ValueError(f"directory_overrides['{dir_path}'] はオブジェクトで指定してください")
+        unknown = set(overlay) - set(_OVERLAY_KEYS)
+        if unknown:
+            raise ValueError(
+                f"directory_overrides['{dir_path}'] に上書きできないキーがあります: {sorted(unknown)} "
+                f"（指定可能: {list(_OVERLAY_KEYS)}）"
+            )
+        partial_cfg = overlay.get("texture_config", {})
+        if not isinstance(partial_cfg, dict):
+            raise ValueError(f"directory_overrides['{dir_path}'].texture_config はオブジェクトで指定してください")
+        for key, partial in partial_cfg.items():
+            if key not in params_map:
+                raise ValueError(f"directory_overrides['{dir_path}'].texture_config['{key}'] は texture_config に存在しません")
+            if not isinstance(partial, dict):
+                raise ValueError(f"directory_overrides['{dir_path}'].texture_config['{key}'] はオブジェクトで指定してください")
+            _merge_texture_params(params_map[key], partial)  # 値の検証のみ
+        result[normalized] = dict(overlay)
+    return result
+
+
 # =========================
 # ルート統合設定: Config
 # =========================
@@ -162,6 +263,17 @@ class Config:
       - address_suffix_3d  : Dict[str, [U,V,W]]（任意）… 3D 用のサフィックス→(U,V,W) 対応表
       - suffix_index       : List[str]        … サフィックス検索順や優先度の定義
       - texture_config     : Dict[str, TextureConfigParams 相当の dict]
+      - directory_overrides: Dict[str, dict]（任意）… ディレクトリ別の上書き。例:
+            {"/Game/UI": {"texture_config": {"col": {"srgb": "OFF"}}}}
+          上書きできるのは _OVERLAY_KEYS のみ。texture_config はフィールド単位で上書きし、
+          既存のテクスチャタイプに対してのみ指定できる。深いディレクトリの上書きほど後から適用される。
+      - content_analysis   : str（任意）… ソース画素の解析による圧縮設定の提案（CONTENT_ANALYSIS_MODES）。
+          NumPy / Pillow が必要で、無い環境では "off" と同じ。
+      - token_rules        : List[dict]（任意）… ファイル名トークンの規則 {name, pattern, override}。
+          pattern はトークン全体に一致する正規表現、override は TextureConfigParams の一部フィールド。
+          enable_subuv_texture_override は SubUV（例: 8x8）の規則として先頭に追加される（token_rules.py）
+      - texture_group_budgets: Dict[str, number]（任意）… TextureGroup 名 → メモリ予算（MiB）
+      - budget_action      : str（任意）… 予算超過時の動作（BUDGET_ACTIONS、既定 "warn"）
     """
     run_dir: List[str] = field(default_factory=list)
 
@@ -177,6 +289,16 @@ class Config:
     enable_subuv_texture_override: bool = False
     subuv_max_in_game: NumericSize = 2048
 
+    token_rules: List[TokenRule] = field(default_factory=list)
+
+    # ディレクトリ（正規化済み）→ 上書き内容（JSON と同じ形の dict）
+    directory_overrides: Dict[str, dict] = field(default_factory=dict)
+
+    content_analysis: str = "off"
+
+    texture_group_budgets: Dict[TextureGroupKind, float] = field(default_factory=dict)
+    budget_action: str = "warn"
+
     # ---------- 読み書き ----------
     @classmethod
     def from_dict(cls, data: dict) -> "Config":
@@ -246,6 +368,30 @@ class Config:
         enable_subuv_texture_override = bool(data.get("enable_subuv_texture_override", False))
         subuv_max_in_game = int(data.get("subuv_max_in_game", 2048))
 
+        token_rules = _parse_token_rules(data.get("token_rules"))
+
+        directory_overrides = _parse_directory_overrides(data.get("directory_overrides"), params_map)
+
+        content_analysis = str(data.get("content_analysis", "off")).strip().lower()
+        if content_analysis not in CONTENT_ANALYSIS_MODES:
+            raise ValueError(
+                f"'content_analysis' は {list(CONTENT_ANALYSIS_MODES)} のいずれかで指定してください: {content_analysis!r}"
+            )
+
+        raw_budgets = data.get("texture_group_budgets") or {}
+        if not isinstance(raw_budgets, dict):
+            raise ValueError("'texture_group_budgets' はオブジェクトで指定してください")
+        texture_group_budgets: Dict[TextureGroupKind, float] = {}
+        for name, mib in raw_budgets.items():
+            group = TextureConfigParams._enum(TextureGroupKind, name)
+            if isinstance(mib, bool) or not isinstance(mib, (int, float)) or mib <= 0:
+                raise ValueError(f"texture_group_budgets['{name}'] は正の数（MiB）で指定してください")
+            texture_group_budgets[group] = float(mib)
+
+        budget_action = str(data.get("budget_action", "warn")).strip().lower()
+        if budget_action not in BUDGET_ACTIONS:
+            raise ValueError(f"'budget_action' は {list(BUDGET_ACTIONS)} のいずれかで指定してください: {budget_action!r}")
+
         return cls(
             run_dir=list(run_dir),
             texture_type=list(tt),
@@ -254,7 +400,12 @@ class Config:
             suffix_index=list(suf_index),
             texture_config=params_map,
             enable_subuv_texture_override=enable_subuv_texture_override,
-            subuv_max_in_game=subuv_max_in_game
+            subuv_max_in_game=subuv_max_in_game,
+            token_rules=token_rules,
+            directory_overrides=directory_overrides,
+            content_analysis=content_analysis,
+            texture_group_budgets=texture_group_budgets,
+            budget_action=budget_action,
         )
 
     def to_dict(self) -> dict:
@@ -274,8 +425,55 @@ class Config:
             out["enable_subuv_texture_override"] = self.enable_subuv_texture_override
         if self.subuv_max_in_game is not None:
             out["subuv_max_in_game"] = self.subuv_max_in_game
-            
+        if self.token_rules:
+            out["token_rules"] = [self._token_rule_to_dict(rule) for rule in self.token_rules]
+        if self.directory_overrides:
+            out["directory_overrides"] = json.loads(json.dumps(self.directory_overrides))
+        if self.content_analysis != "off":
+            out["content_analysis"] = self.content_analysis
+        if self.texture_group_budgets:
+            out["texture_group_budgets"] = {g.name: mib for g, mib in self.texture_group_budgets.items()}
+        if self.budget_action != "warn":
+            out["budget_action"] = self.budget_action
+
         return out
+
+    @staticmethod
+    def _token_rule_to_dict(rule: TokenRule) -> dict:
+        params = TextureConfigParams(**dict(rule.override)).to_dict(minimal=False)
+        return {"name": rule.name, "pattern": rule.pattern, "override": {k: params[k] for k, _ in rule.override}}
+
+    def effective_token_rules(self) -> Tuple[TokenRule, ...]:
+        """
+        判定に使う規則。enable_subuv_texture_override が有効なら SubUV の規則を先頭に加える
+        （同名の規則が token_rules にあればそちらを使う）。
+        """
+        rules = tuple(self.token_rules)
+        if self.enable_subuv_texture_override and not any(r.name == SUBUV_RULE_NAME for r in rules):
+            size = TextureConfigParams._size_to_int(self.subuv_max_in_game)
+            rules = (TokenRule(SUBUV_RULE_NAME, SUBUV_PATTERN, (("max_in_game", size),)),) + rules
+        return rules
+
+    def texture_group_budget_bytes(self) -> Dict[TextureGroupKind, int]:
+        """texture_group_budgets をバイト単位にしたもの。"""
+        return {g: int(mib * 1024 * 1024) for g, mib in self.texture_group_budgets.items()}
+
+    def with_overlay(self, overlay: dict) -> "Config":
+        """ディレクトリ別の上書き（directory_overrides の 1 要素）を適用した複製を返す。"""
+        changes: dict = {}
+        partial_cfg = overlay.get("texture_config") or {}
+        if partial_cfg:
+            merged = dict(self.texture_config)
+            for key, partial in partial_cfg.items():
+                merged[key] = _merge_texture_params(merged[key], partial)
+            changes["texture_config"] = merged
+        if "enable_subuv_texture_override" in overlay:
+            changes["enable_subuv_texture_override"] = bool(overlay["enable_subuv_texture_override"])
+        if "subuv_max_in_game" in overlay:
+            changes["subuv_max_in_game"] = int(overlay["subuv_max_in_game"])
+        # 上書き後の Config 自体は上書き表を持たない（二重適用を防ぐ）
+        changes["directory_overrides"] = {}
+        return replace(self, **changes)
     
     def build_suffix_grid(self)->List[List[str]]:
         """
@@ -337,28 +535,339 @@ class Config:
         raise KeyError(key)
 
 
-def override_address_uv(params: TextureConfigParams, u: AddressMode, v: AddressMode) -> TextureConfigParams:
+# =========================
+# 解決済み設定: ResolvedTextureParams
+# =========================
+class ResolvedTextureParams:
+    """サフィックス・アドレス上書き・SubUV 上書きをすべて反映した最終設定（不変）。
+
+    フィールドは TextureConfigParams と同じ。__slots__ ベースで属性の再代入はできず、
+    値を変えたい場合は replace() で複製を作る（copy-on-override）。
+    不変かつハッシュ可能なため、1 つの Config を複数テクスチャ・複数スレッドで共有できる。
+    """
+    _FIELDS = tuple(f.name for f in fields(TextureConfigParams))
+    __slots__ = _FIELDS + ("_hash",)
+
+    def __init__(
+        self,
+        *,
+        address_u: Optional[AddressMode] = None,
+        address_v: Optional[AddressMode] = None,
+        address_z: Optional[AddressMode] = None,
+        max_in_game: Optional[int] = None,
+        enforce_pow2: bool = False,
+        compression: Optional[CompressionKind] = None,
+        srgb: Optional[SRGBMode] = None,
+        mip_gen: MipGenKind = MipGenKind.FROM_TEXTURE_GROUP,
+        texture_group: TextureGroupKind = TextureGroupKind.WORLD,
+    ):
+        _set = object.__setattr__
+        _set(self, "address_u", address_u)
+        _set(self, "address_v", address_v)
+        _set(self, "address_z", address_z)
+        _set(self, "max_in_game", max_in_game)
+        _set(self, "enforce_pow2", bool(enforce_pow2))
+        _set(self, "compression", compression)
+        _set(self, "srgb", srgb)
+        _set(self, "mip_gen", mip_gen)
+        _set(self, "texture_group", texture_group)
+        _set(self, "_hash", hash(self._values()))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"ResolvedTextureParams is immutable (use replace()): {name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"ResolvedTextureParams is immutable: {name}")
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, n) for n in self._FIELDS)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ResolvedTextureParams):
+            return NotImplemented
+        return self._hash == other._hash and self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        inner = ", ".join(f"{n}={getattr(self, n)!r}" for n in self._FIELDS)
+        return f"ResolvedTextureParams({inner})"
+
+    def __reduce__(self):
+        # __slots__ + 再代入禁止のため、pickle は __init__ 経由で復元する
+        return (_resolved_from_kwargs, (self.as_kwargs(),))
+
+    def as_kwargs(self) -> dict:
+        """フィールド名 → 値 の辞書を返す。"""
+        return {n: getattr(self, n) for n in self._FIELDS}
+
+    def replace(self, **changes) -> "ResolvedTextureParams":
+        """指定したフィールドだけを差し替えた新しいインスタンスを返す（自身は変更しない）。"""
+        if not changes:
+            return self
+        unknown = set(changes) - set(self._FIELDS)
+        if unknown:
+            raise TypeError(f"unknown field(s): {', '.join(sorted(unknown))}")
+        kwargs = self.as_kwargs()
+        kwargs.update(changes)
+        return ResolvedTextureParams(**kwargs)
+
+    @classmethod
+    def from_params(cls, params: Union[TextureConfigParams, "ResolvedTextureParams"]) -> "ResolvedTextureParams":
+        """TextureConfigParams の値を写した不変インスタンスを生成。"""
+        if isinstance(params, ResolvedTextureParams):
+            return params
+        return cls(**{n: getattr(params, n) for n in cls._FIELDS})
+
+    def to_config_params(self) -> TextureConfigParams:
+        """可変な TextureConfigParams に戻す（複製）。"""
+        return TextureConfigParams(**self.as_kwargs())
+
+    def to_dict(self, *, minimal: bool = True) -> dict:
+        """辞書に変換（TextureConfigParams.to_dict と同じ形式）。"""
+        return self.to_config_params().to_dict(minimal=minimal)
+
+
+def _resolved_from_kwargs(kwargs: dict) -> ResolvedTextureParams:
+    return ResolvedTextureParams(**kwargs)
+
+
+ParamsLike = Union[TextureConfigParams, ResolvedTextureParams]
+
+
+def override_address_uv(params: ParamsLike, u: AddressMode, v: AddressMode) -> ParamsLike:
     """
-    TextureConfigParams の address_u / address_v を“破壊的（in-place）”に上書きします。
-    clear_z=True の場合、address_z を None にクリアします（3D/Cube等でU/Vのみ使いたいときに便利）。
-    戻り値は同じインスタンス（チェーン用に返すだけ）。
+    address_u / address_v を上書きした“複製”を返します（引数の params は変更しません）。
+    TextureConfigParams を渡した場合は TextureConfigParams、ResolvedTextureParams を渡した場合は
+    ResolvedTextureParams が返ります。Config に保持された共有インスタンスをそのまま渡しても安全です。
     """
-    if not isinstance(params, TextureConfigParams):
-        raise TypeError("params must be TextureConfigParams")
+    if not isinstance(params, (TextureConfigParams, ResolvedTextureParams)):
+        raise TypeError("params must be TextureConfigParams or ResolvedTextureParams")
     if not isinstance(u, AddressMode) or not isinstance(v, AddressMode):
         raise TypeError("u, v must be AddressMode")
 
-    params.address_u = u
-    params.address_v = v
-    return params
+    if isinstance(params, ResolvedTextureParams):
+        return params.replace(address_u=u, address_v=v)
+    return replace(params, address_u=u, address_v=v)
 
-def override_subuv_max_in_game(params: TextureConfigParams, max_in_game: NumericSize) -> TextureConfigParams:
+def override_subuv_max_in_game(params: ParamsLike, max_in_game: NumericSize) -> ParamsLike:
     """
-    TextureConfigParams の max_in_game を“破壊的（in-place）”に上書きします。
-    戻り値は同じインスタンス（チェーン用に返すだけ）。
+    max_in_game を上書きした“複製”を返します（引数の params は変更しません）。
+    戻り値の型は引数と同じです。
     """
-    if not isinstance(params, TextureConfigParams):
-        raise TypeError("params must be TextureConfigParams")
-    
-    params.max_in_game = TextureConfigParams._size_to_int(max_in_game)
-    return params
\ No newline at end of file
+    if not isinstance(params, (TextureConfigParams, ResolvedTextureParams)):
+        raise TypeError("params must be TextureConfigParams or ResolvedTextureParams")
+
+    size = TextureConfigParams._size_to_int(max_in_game)
+    if isinstance(params, ResolvedTextureParams):
+        return params.replace(max_in_game=size)
+    return replace(params, max_in_game=size)
+
+
+def get_address_settings_from_suffix(suffixes: Sequence[str], config_data: Config):
+    """
+    サフィックスからアドレスモード（UV/UVW）の設定を決定する。
+
+    Args:
+        suffixes (List[str]): 対象テクスチャから抽出したサフィックス一覧。
+        config_data (Config): サフィックス設定を持つ Config。
+
+    Returns:
+        tuple: (AddressMode, AddressMode) の組。
+    """
+    for suf in suffixes:
+        if config_data.has_suffix_2d(suf):
+            return config_data.get_uv(suf)
+        if config_data.has_suffix_3d(suf):
+            return config_data.get_uvw(suf)
+    return (AddressMode.WRAP, AddressMode.WRAP)
+
+
+def get_texture_settings_from_suffixes(suffixes: Sequence[str],
+                                        texture_settings: Dict[str, TextureConfigParams]):
+    """
+    サフィックスに一致するテクスチャ設定を取得する。
+
+    Args:
+        suffixes (List[str]): 対象テクスチャから抽出したサフィックス一覧。
+        texture_settings (Dict[str, TextureConfigParams]): サフィックス別設定の辞書。
+
+    Returns:
+        TextureConfigParams: 一致した設定。該当がなければデフォルト値。
+    """
+    for suf in suffixes:
+        if suf in texture_settings:
+            return texture_settings[suf]
+    return TextureConfigParams()
+
+
+class ParamResolver:
+    """(検証済みサフィックス列, SubUV 判定) → ResolvedTextureParams の解決結果をメモ化する。
+
+    取り得る組み合わせは (種類 × アドレス × SubUV) 程度に限られるため、
+    バッチ処理でも解決処理は組み合わせごとに 1 回だけ行われる。
+    """
+
+    def __init__(self, config: Config):
+        self._config = config
+        self._cache: Dict[Tuple[Tuple[str, ...], bool, Tuple[TokenRule, ...]], ResolvedTextureParams] = {}
+
+    def resolve(
+        self,
+        suffixes: Sequence[str],
+        is_subuv: bool = False,
+        rules: Tuple[TokenRule, ...] = (),
+    ) -> ResolvedTextureParams:
+        """
+        サフィックス列と一致したトークン規則から最終設定を返す（キャッシュ済みなら再利用）。
+
+        rules は TokenRuleSet.match() の結果（SubUV も規則として含まれる）。
+        is_subuv は規則を使わずに subuv_max_in_game を直接適用する旧来の指定。
+        """
+        key = (tuple(suffixes), bool(is_subuv), rules)
+        resolved = self._cache.get(key)
+        if resolved is None:
+            resolved = self._resolve(*key)
+            self._cache[key] = resolved
+        return resolved
+
+    def _resolve(self, suffixes: Tuple[str, ...], is_subuv: bool, rules: Tuple[TokenRule, ...]) -> ResolvedTextureParams:
+        cfg = self._config
+        params = ResolvedTextureParams.from_params(get_texture_settings_from_suffixes(suffixes, cfg.texture_config))
+        uv = get_address_settings_from_suffix(suffixes, cfg)  # 現状は Tex2D のみ対応（W は使わない）
+        params = override_address_uv(params, uv[0], uv[1])
+        if is_subuv:
+            params = override_subuv_max_in_game(params, cfg.subuv_max_in_game)
+        for rule in rules:
+            params = rule.apply(params)
+        return params
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+# =========================
+# 事前構築済み設定とキャッシュ: CompiledConfig
+# =========================
+@dataclass(frozen=True)
+class CompiledConfig:
+    """Config と、そこから事前構築したサフィックス照合用データの組。
+
+    - config       : 読み込み済みの Config（共有されるため呼び出し側で変更しないこと）
+    - suffix_grid  : build_suffix_grid() の結果（行 = suffix_index の順）
+    - all_suffixes : suffix_grid の全要素を平坦化した集合
+    - suffix_matcher: suffix_grid から構築した SuffixMatcher
+    - param_resolver: サフィックス列 → 最終設定 のメモ化リゾルバ
+    - token_rules   : effective_token_rules() をまとめてコンパイルした TokenRuleSet
+    - run_dir_index : run_dir から構築したトライ（配下判定）
+    - overlay_index : directory_overrides から構築したトライ（for_asset() で使用）
+    """
+    config: Config
+    suffix_grid: Tuple[Tuple[str, ...], ...]
+    all_suffixes: FrozenSet[str]
+    suffix_matcher: SuffixMatcher
+    param_resolver: ParamResolver
+    token_rules: TokenRuleSet = field(default_factory=TokenRuleSet, compare=False, repr=False)
+    run_dir_index: RunDirIndex = field(default_factory=lambda: RunDirIndex(()), compare=False, repr=False)
+    overlay_index: PathTrie = field(default_factory=PathTrie, compare=False, repr=False)
+    # ディレクトリ → 有効な CompiledConfig / 適用される上書きディレクトリの組 → 有効な CompiledConfig
+    _by_dir: Dict[str, "CompiledConfig"] = field(default_factory=dict, compare=False, repr=False)
+    _by_overlays: Dict[Tuple[str, ...], "CompiledConfig"] = field(default_factory=dict, compare=False, repr=False)
+
+    @classmethod
+    def compile(cls, config: Config) -> "CompiledConfig":
+        """Config から照合用データを構築する。"""
+        grid = tuple(tuple(row) for row in config.build_suffix_grid())
+        overlay_index: PathTrie = PathTrie()
+        for dir_path, overlay in config.directory_overrides.items():
+            overlay_index.insert(dir_path, overlay)
+        return cls(
+            config=config,
+            suffix_grid=grid,
+            all_suffixes=frozenset(suf for row in grid for suf in row),
+            suffix_matcher=SuffixMatcher(grid),
+            param_resolver=ParamResolver(config),
+            token_rules=compile_token_rules(config.effective_token_rules()),
+            run_dir_index=RunDirIndex(config.run_dir),
+            overlay_index=overlay_index,
+        )
+
+    def for_asset(self, asset_path: str) -> "CompiledConfig":
+        """
+        asset_path のディレクトリに有効な CompiledConfig を返す。
+
+        directory_overrides のうちディレクトリ自身と祖先に該当するものを浅い順に重ねた設定で、
+        結果はディレクトリ単位・上書きの組み合わせ単位でキャッシュされる（2 回目以降は O(1)、
+        初回もパスの深さに比例した時間）。上書きが無ければ自分自身を返す。
+        """
+        if not len(self.overlay_index):
+            return self
+        path_dir = _normalize_unreal_path(_extract_dir_from_asset_path(asset_path))
+        effective = self._by_dir.get(path_dir)
+        if effective is None:
+            found = self.overlay_index.iter_prefixes(path_dir)
+            key = tuple(d for d, _ in found)
+            effective = self._by_overlays.get(key)
+            if effective is None:
+                effective = self._with_overlays([overlay for _, overlay in found]) if found else self
+                self._by_overlays[key] = effective
+            self._by_dir[path_dir] = effective
+        return effective
+
+    def _with_overlays(self, overlays: List[dict]) -> "CompiledConfig":
+        cfg = self.config
+        for overlay in overlays:
+            cfg = cfg.with_overlay(overlay)
+        # サフィックス表は上書きで変わらないため照合器は共有する
+        return CompiledConfig(
+            config=cfg,
+            suffix_grid=self.suffix_grid,
+            all_suffixes=self.all_suffixes,
+            suffix_matcher=self.suffix_matcher,
+            param_resolver=ParamResolver(cfg),
+            token_rules=compile_token_rules(cfg.effective_token_rules()),
+            run_dir_index=self.run_dir_index,
+        )
+
+    def resolve(
+        self,
+        asset_path: str,
+        suffixes: Sequence[str],
+        tokens: Sequence[str],
+    ) -> Tuple[ResolvedTextureParams, Tuple[TokenRule, ...]]:
+        """
+        サフィックス検証済みのアセットの最終設定と、一致したトークン規則を返す。
+
+        directory_overrides を反映した設定（for_asset）で、トークン列を 1 回走査して規則を判定する。
+        """
+        effective = self.for_asset(asset_path)
+        rules = effective.token_rules.match(tokens)
+        return effective.param_resolver.resolve(suffixes, rules=rules), rules
+
+
+# 解決済みパス -> ((mtime_ns, size), CompiledConfig)
+_compiled_cache: Dict[str, Tuple[Tuple[int, int], CompiledConfig]] = {}
+
+
+def load_compiled_config(file_path: Union[str, Path]) -> CompiledConfig:
+    """
+    JSON ファイルから CompiledConfig を読み込む（モジュール単位でキャッシュ）。
+    キャッシュはパスごとに保持し、ファイルの更新時刻またはサイズが変わった場合は読み直す。
+    """
+    with stage_timer.span("config_load"):
+        p = Path(file_path).resolve()
+        st = os.stat(p)
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = str(p)
+        cached = _compiled_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        compiled = CompiledConfig.compile(Config.load(p))
+        _compiled_cache[key] = (stamp, compiled)
+        return compiled
+
+
+def clear_config_cache() -> None:
+    """load_compiled_config() のキャッシュを破棄する。"""
+    _compiled_cache.clear()
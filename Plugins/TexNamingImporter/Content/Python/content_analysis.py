@@ -0,0 +1,204 @@
+"""
+ソース画像の画素を解析し、サフィックス既定より安価な圧縮設定・sRGB を提案する（任意機能）。
+
+サフィックスだけで種類を決めると、例えば ``_col`` のグレースケールマスクが BC7 + sRGB ON になったり、
+完全に不透明なテクスチャが使わないアルファを持ったままになる。ここでは画素を帯（タイル）ごとに
+NumPy で集計し、次を検出する。
+
+- 単一チャンネル（R=G=B）の内容
+- 未使用（全て不透明）または一定値のアルファ
+- 法線マップらしい分布（2*rgb-1 がほぼ単位ベクトルで z が正）
+- HDR の値域（1.0 を超える値）
+
+NumPy（と画像の読み込みに Pillow）が必要。どちらも無い環境では is_available() が False になり、
+analyze_image() は None を返す（Config の ``content_analysis`` を "off" 以外にしても何もしない）。
+recommend() は統計値だけを使う純粋な関数で、NumPy が無くても動く。
+
+制限:
+- 読めるのは Pillow が開ける形式だけ。標準の Pillow は EXR を開けないため EXR は解析されない
+  （analyze_image() が None を返す）。HDR の検出は浮動小数点 TIFF など ``F`` モードで開ける画像に限られる
+- 画像全体を 1 回デコードしてから帯ごとに集計するため、メモリは抑えられない（デコード後の画像全体を保持する）。
+  帯に分けて抑えられるのは float32 への変換と集計の作業領域だけ
+"""
+from __future__ import annotations
+
+import importlib.util
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+from config import ResolvedTextureParams
+from type_define import CompressionKind, SRGBMode
+
+# 1 回に float32 へ変換する行数（変換・集計の作業領域を幅 × この行数 × チャンネル数 に抑える。
+# デコード済みの画像全体は別に保持される）
+DEFAULT_TILE_ROWS = 256
+# 8bit の量子化誤差を許容する閾値
+_TOLERANCE = 1.5 / 255.0
+# 法線マップとみなす、単位ベクトルに近い画素の割合
+_NORMAL_RATIO = 0.9
+_NORMAL_LENGTH_TOLERANCE = 0.15
+
+# 単一チャンネルの内容なら GRAYSCALE に置き換えられる圧縮設定
+_COLOR_COMPRESSIONS = (CompressionKind.BC7, CompressionKind.DEFAULT)
+
+
+def is_available() -> bool:
+    """NumPy と Pillow が import できるか。"""
+    return all(importlib.util.find_spec(name) is not None for name in ("numpy", "PIL"))
+
+
+@dataclass(frozen=True)
+class ContentStats:
+    """画素の集計結果。"""
+    channels: int
+    grayscale: bool
+    # アルファが無いか全画素で不透明
+    alpha_unused: bool
+    # アルファが全画素で同じ値ならその値（0〜1）。一定でなければ None（マテリアル側の定数で代替できるかの目安）
+    alpha_constant: Optional[float]
+    normal_map_like: bool
+    hdr: bool
+    max_value: float
+
+
+@dataclass(frozen=True)
+class CompressionRecommendation:
+    compression: CompressionKind
+    srgb: SRGBMode
+    reason: str
+
+    def describe(self, current: ResolvedTextureParams) -> str:
+        def _name(v) -> str:
+            return v.name if v is not None else "-"
+        return (
+            f"{_name(current.compression)}/sRGB {_name(current.srgb)} -> "
+            f"{self.compression.name}/sRGB {self.srgb.name} ({self.reason})"
+        )
+
+
+class _Accumulator:
+    """タイルごとの統計を合算する。"""
+
+    def __init__(self) -> None:
+        self.channels = 0
+        self.pixels = 0
+        self.max_value = 0.0
+        self.color_spread = 0.0
+        self.alpha_min = 1.0
+        self.alpha_max = 0.0
+        self.normal_pixels = 0
+
+    def update(self, tile) -> None:
+        import numpy as np
+
+        if tile.ndim == 2:
+            tile = tile[:, :, np.newaxis]
+        self.channels = tile.shape[2]
+        self.pixels += tile.shape[0] * tile.shape[1]
+        color = tile[:, :, : min(self.channels, 3)]
+        self.max_value = max(self.max_value, float(color.max(initial=0.0)))
+        if self.channels >= 3:
+            spread = np.maximum(np.abs(color[:, :, 0] - color[:, :, 1]), np.abs(color[:, :, 1] - color[:, :, 2]))
+            self.color_spread = max(self.color_spread, float(spread.max(initial=0.0)))
+            n = color * 2.0 - 1.0
+            length = np.sqrt((n * n).sum(axis=2))
+            self.normal_pixels += int(np.count_nonzero((np.abs(length - 1.0) < _NORMAL_LENGTH_TOLERANCE) & (n[:, :, 2] >= 0.0)))
+        if self.channels in (2, 4):
+            alpha = tile[:, :, -1]
+            self.alpha_min = min(self.alpha_min, float(alpha.min(initial=1.0)))
+            self.alpha_max = max(self.alpha_max, float(alpha.max(initial=0.0)))
+
+    def result(self) -> ContentStats:
+        has_alpha = self.channels in (2, 4) and self.pixels > 0
+        alpha_constant = None
+        if has_alpha and self.alpha_max - self.alpha_min <= _TOLERANCE:
+            alpha_constant = round(self.alpha_max, 4)
+        grayscale = self.channels <= 2 or self.color_spread <= _TOLERANCE
+        return ContentStats(
+            channels=self.channels,
+            grayscale=grayscale,
+            alpha_unused=not has_alpha or self.alpha_min >= 1.0 - _TOLERANCE,
+            alpha_constant=alpha_constant,
+            normal_map_like=(
+                self.channels >= 3 and not grayscale and self.pixels > 0
+                and self.normal_pixels >= _NORMAL_RATIO * self.pixels
+            ),
+            hdr=self.max_value > 1.0 + _TOLERANCE,
+            max_value=self.max_value,
+        )
+
+
+def analyze_tiles(tiles: Iterable) -> ContentStats:
+    """
+    (H, W) または (H, W, C) の float 配列（0〜1、HDR は 1 超を含む）を順に集計する。
+    チャンネル順は R, G, B, A。
+    """
+    acc = _Accumulator()
+    for tile in tiles:
+        acc.update(tile)
+    return acc.result()
+
+
+def iter_image_tiles(file_path: str, tile_rows: int = DEFAULT_TILE_ROWS) -> Iterator:
+    """
+    Pillow で画像を開き、tile_rows 行ずつ float32 配列（0〜1）にして返す。
+
+    Pillow はデコード自体を分割できないため、画像は 1 回だけ全体をデコードする（メモリは画像サイズに比例する）。
+    帯ごとに行うのは float への変換と集計だけで、その作業領域だけが帯の大きさに抑えられる。
+    """
+    import numpy as np
+    from PIL import Image
+
+    with Image.open(file_path) as img:
+        if img.mode in ("I;16", "I;16B", "I"):
+            scale, mode = 65535.0, img.mode
+        elif img.mode == "F":
+            scale, mode = 1.0, "F"
+        else:
+            has_alpha = "A" in img.getbands() or "transparency" in img.info
+            gray = img.mode in ("1", "L", "LA")
+            mode = ("LA" if has_alpha else "L") if gray else ("RGBA" if has_alpha else "RGB")
+            scale = 255.0
+        img = img.convert(mode) if img.mode != mode else img
+        width, height = img.size
+        for top in range(0, height, tile_rows):
+            band = img.crop((0, top, width, min(top + tile_rows, height)))
+            yield np.asarray(band, dtype=np.float32) / scale
+
+
+def analyze_image(file_path: str, tile_rows: int = DEFAULT_TILE_ROWS) -> Optional[ContentStats]:
+    """
+    画像ファイルを解析する。依存ライブラリが無い・読み込めない場合は None。
+
+    Pillow の DecompressionBombError（Exception の直接の派生）や巨大なフリップブックでの MemoryError も
+    読み込めない扱いにする（1 枚の不正なソースでバッチ全体を止めない）。
+    """
+    if not is_available():
+        return None
+    try:
+        return analyze_tiles(iter_image_tiles(file_path, tile_rows))
+    except Exception:
+        return None
+
+
+def recommend(stats: ContentStats, params: ResolvedTextureParams) -> Optional[CompressionRecommendation]:
+    """
+    解析結果から、現在の設定（サフィックス既定）より適した圧縮設定・sRGB を返す。
+    現在の設定のままでよい場合は None。
+    """
+    current = params.compression
+    if stats.hdr:
+        rec = CompressionRecommendation(CompressionKind.HDR, SRGBMode.OFF, f"HDR range (max {stats.max_value:.2f})")
+    elif stats.normal_map_like:
+        rec = CompressionRecommendation(CompressionKind.NORMAL_MAP, SRGBMode.OFF, "normal-map-like distribution")
+    elif stats.grayscale and stats.alpha_unused and current in _COLOR_COMPRESSIONS:
+        # グレースケールの色データもあり得るため sRGB は現在の設定を維持する
+        rec = CompressionRecommendation(CompressionKind.GRAYSCALE, params.srgb or SRGBMode.ON, "single-channel content")
+    elif stats.alpha_unused and current == CompressionKind.BC7:
+        # DEFAULT はソースが不透明なら BC1（BC7 の半分のサイズ）になる
+        rec = CompressionRecommendation(CompressionKind.DEFAULT, params.srgb or SRGBMode.ON, "alpha is unused")
+    else:
+        return None
+    if rec.compression == current and rec.srgb == params.srgb:
+        return None
+    return rec
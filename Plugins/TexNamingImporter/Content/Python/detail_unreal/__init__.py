@@ -1 +1,12 @@
-# from .texture_configurator_unreal import *
\ No newline at end of file
+"""
+Unreal Editor に依存する実装（``import unreal`` を伴うモジュール）。
+
+config / validator / path_utils など unreal を必要としない層の import を軽く保つため、
+利用側はモジュール先頭ではなく adapter() で初回使用時に読み込む。
+"""
+
+
+def adapter():
+    """texture_configurator_unreal を返す（初回呼び出し時に import される）。"""
+    from . import texture_configurator_unreal
+    return texture_configurator_unreal
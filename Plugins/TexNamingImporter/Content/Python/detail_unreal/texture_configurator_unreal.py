@@ -1,14 +1,16 @@
-import math
-import sys
-from pathlib import Path
-from typing import Union, Dict, List, Callable, Optional
+import json
+import os
+import traceback
+from functools import lru_cache
+from typing import Union, Dict, List, Callable, Iterable, Optional, Tuple
 import unreal
 
-_THIS_DIR = Path(__file__).resolve().parent
-if str(_THIS_DIR) not in sys.path:
-    sys.path.insert(0, str(_THIS_DIR))
-
-from config import TextureConfigParams, NumericSize
+import stage_timer
+from texture_logging import get_logger
+from config import ResolvedTextureParams, TextureConfigParams, NumericSize
+from budget_overrides import BUDGET_OVERRIDES_FILE_NAME
+from state_manifest import MANIFEST_FILE_NAME, file_stamp
+from memory_estimator import effective_max_texture_size
 from type_define import (
     AddressMode,
     CompressionKind,
@@ -18,6 +20,8 @@ from type_define import (
     TextureGroupKind, 
 ) 
 
+logger = get_logger(__name__)
+
 def _get_texture_from_path(path: str) -> unreal.Texture:
     """
     /Game から始まるパスからテクスチャ(UTexture系)を取得する。
@@ -46,24 +50,147 @@ def _get_texture_from_path(path: str) -> unreal.Texture:
     return asset  # type: ignore[return-value]
 
 
+def get_package_file_path(asset_path: str) -> Optional[str]:
+    """
+    /Game から始まるアセットパスに対応する .uasset のフルパスを返す。
+    /Game 以外（プラグイン等のマウントポイント）は解決できないため None。
+    """
+    package_name = asset_path.split(".", 1)[0]
+    if not package_name.startswith("/Game/"):
+        return None
+    content_dir = unreal.Paths.convert_relative_path_to_full(unreal.Paths.project_content_dir())
+    return os.path.join(content_dir, package_name[len("/Game/"):] + ".uasset")
+
+
+def get_package_stamp(asset_path: str) -> Optional[str]:
+    """アセットのパッケージファイルの状態（更新時刻:サイズ）。取得できなければ None。"""
+    file_path = get_package_file_path(asset_path)
+    return None if file_path is None else file_stamp(file_path)
+
+
+def _first_import_filename(tag_value: Optional[str]) -> Optional[str]:
+    """AssetImportData タグ（JSON 配列）から最初のソースファイル名を取り出す。"""
+    if not tag_value:
+        return None
+    try:
+        entries = json.loads(tag_value)
+    except ValueError:
+        return None
+    if isinstance(entries, dict):
+        entries = [entries]
+    for entry in entries if isinstance(entries, list) else []:
+        if isinstance(entry, dict) and entry.get("RelativeFilename"):
+            return str(entry["RelativeFilename"])
+    return None
+
+
+def get_source_file_path(asset_path: str) -> Optional[str]:
+    """
+    テクスチャのインポート元ファイルのフルパスを返す（AssetImportData が無ければ None）。
+    アセットレジストリのタグから引くため、テクスチャ自体はロードしない。
+    相対パスはパッケージファイルのディレクトリ基準で解決する（UAssetImportData と同じ規則）。
+    """
+    registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    data = registry.get_asset_by_object_path(asset_path)
+    if not data.is_valid():
+        return None
+    filename = _first_import_filename(data.get_tag_value("AssetImportData"))
+    if not filename:
+        return None
+    if os.path.isabs(filename):
+        return os.path.normpath(filename)
+    package_file = get_package_file_path(asset_path)
+    if package_file is None:
+        return None
+    return os.path.normpath(os.path.join(os.path.dirname(package_file), filename))
+
+
+def _is_package_dirty(texture: "unreal.Texture") -> bool:
+    """
+    テクスチャのパッケージが未保存の変更を持つか。判定できない場合は True を返す
+    （保存は only_if_is_dirty で行うため、dirty でなければエンジン側で何もしない）。
+    """
+    try:
+        return bool(texture.get_outermost().is_dirty())
+    except Exception:
+        return True
+
+
+def _mark_unsaved(report: Dict[str, Union[bool, List[str]]], message: str) -> None:
+    """反映済みだが保存できなかったことを記録する（変更はメモリ上に残るため ok は変えない）。"""
+    report["unsaved"] = True
+    report["errors"].append(message)
+
+
+def default_manifest_path() -> str:
+    """増分実行用マニフェストの既定パス: {ProjectDir}/Saved/TexNamingImporter/manifest.json"""
+    saved_dir = unreal.Paths.convert_relative_path_to_full(unreal.Paths.project_saved_dir())
+    return os.path.join(saved_dir, "TexNamingImporter", MANIFEST_FILE_NAME)
+
+
+def default_budget_overrides_path() -> str:
+    """メモリ予算で下げた max_in_game の記録の既定パス: {ProjectDir}/Saved/TexNamingImporter/budget_overrides.json"""
+    saved_dir = unreal.Paths.convert_relative_path_to_full(unreal.Paths.project_saved_dir())
+    return os.path.join(saved_dir, "TexNamingImporter", BUDGET_OVERRIDES_FILE_NAME)
+
+
 def delete_texture_asset(texture_path: str) -> bool:
     """指定されたテクスチャアセットを削除する。"""
     if not texture_path:
         raise ValueError("texture_path must be non-empty")
+    return delete_texture_assets([texture_path])[texture_path]
 
-    package_path = texture_path.split(".", 1)[0]
-    editor_lib = unreal.EditorAssetLibrary
 
-    if not editor_lib.does_asset_exist(package_path):
-        unreal.log_warning(f"[TextureConfigurator] Delete skipped. Asset not found: {package_path}")
-        return False
+def delete_texture_assets(texture_paths: Iterable[str]) -> Dict[str, bool]:
+    """
+    複数のテクスチャアセットを 1 回の一括削除で削除する。
 
-    deleted = editor_lib.delete_asset(package_path)
-    if deleted:
-        unreal.log(f"[TextureConfigurator] Deleted texture asset: {package_path}")
-    else:
-        unreal.log_error(f"[TextureConfigurator] Failed to delete texture asset: {package_path}")
-    return deleted
+    存在するアセットを読み込んで EditorAssetLibrary.delete_loaded_assets にまとめて渡すため、
+    参照チェックと Content Browser の更新は 1 回で済む。一括削除が使えない・失敗した場合は
+    残ったアセットを 1 件ずつ delete_asset で削除する。
+
+    Returns:
+        Dict[str, bool]: テクスチャパス → 削除できたか（存在しなかった場合は False）。
+    """
+    editor_lib = unreal.EditorAssetLibrary
+    results: Dict[str, bool] = {}
+    packages: Dict[str, str] = {}
+    for texture_path in texture_paths:
+        if not texture_path:
+            raise ValueError("texture_path must be non-empty")
+        package_path = texture_path.split(".", 1)[0]
+        if not editor_lib.does_asset_exist(package_path):
+            logger.warning("[TextureConfigurator] Delete skipped. Asset not found: %s", package_path)
+            results[texture_path] = False
+            continue
+        packages[texture_path] = package_path
+    if not packages:
+        return results
+
+    with stage_timer.span("delete"):
+        delete_many = getattr(editor_lib, "delete_loaded_assets", None)
+        if callable(delete_many):
+            loaded = [a for a in (editor_lib.load_asset(p) for p in packages) if a is not None]
+            try:
+                if loaded:
+                    delete_many(loaded)
+            except Exception as delete_error:
+                logger.error("[TextureConfigurator] Bulk delete failed: %s", delete_error)
+        # 一括削除で消えなかったもの（参照が残っていた等）は個別に削除を試みる
+        for texture_path, package_path in packages.items():
+            deleted = not editor_lib.does_asset_exist(package_path)
+            if not deleted:
+                try:
+                    deleted = bool(editor_lib.delete_asset(package_path))
+                except Exception as delete_error:
+                    logger.error("[TextureConfigurator] Failed to delete %s: %s", package_path, delete_error)
+                    deleted = False
+            results[texture_path] = deleted
+            if deleted:
+                logger.debug("[TextureConfigurator] Deleted texture asset: %s", package_path)
+            else:
+                logger.error("[TextureConfigurator] Failed to delete texture asset: %s", package_path)
+    return results
 
 
 def show_texture_configurator_dialog(
@@ -82,12 +209,13 @@ def show_texture_configurator_dialog(
                 f"[TextureConfigurator] Dialog not shown: AppMsgType/AppReturnType not available.\n{title}: {message}"
             )
             return
-        unreal.EditorDialog.show_message(
-            title=title,
-            message=message,
-            message_type=message_type,
-            default_value=default_value,
-        )
+        with stage_timer.span("dialog"):
+            unreal.EditorDialog.show_message(
+                title=title,
+                message=message,
+                message_type=message_type,
+                default_value=default_value,
+            )
     except Exception as dialog_error:  # pragma: no cover - best effort logging
         unreal.log_error(
             f"[TextureConfigurator] Failed to show dialog '{title}': {dialog_error}\n{message}"
@@ -96,18 +224,22 @@ def show_texture_configurator_dialog(
 
 class TextureConfigurator:
     """
-    - __init__(*, params: TextureConfigParams) で設定値を受け取る
+    - __init__(*, params: TextureConfigParams | ResolvedTextureParams) で設定値を受け取る
     - apply(texture): dataclassの内容を一括反映（Undo, post_edit_change, 保存, 共通エラハン）
+    - apply_many(jobs): 複数テクスチャを 1 トランザクション・最後に一括保存で反映
     - set_address / set_max_in_game / set_compression / set_srgb: 個別反映（commit=Trueで即保存）
     """
 
-    def __init__(self, *, params: TextureConfigParams):
-        if not isinstance(params, TextureConfigParams):
-            raise TypeError("params must be TextureConfigParams")
+    def __init__(self, *, params: Union[TextureConfigParams, ResolvedTextureParams]):
+        if not isinstance(params, (TextureConfigParams, ResolvedTextureParams)):
+            raise TypeError("params must be TextureConfigParams or ResolvedTextureParams")
         self.params = params
 
     # ---------- Unreal 変換（アダプタ） ----------
+    # 列挙体 → unreal 列挙値の変換結果はメモ化し、同じ値の組み合わせでは 2 回目以降の探索を省く
+    # （変換に失敗した場合は例外となりキャッシュされない）
     @staticmethod
+    @lru_cache(maxsize=None)
     def _ua(addr: AddressMode):
         E = unreal.TextureAddress
         if addr is AddressMode.WRAP:
@@ -122,6 +254,7 @@ class TextureConfigurator:
         raise RuntimeError(f"Unsupported AddressMode on this engine build: {addr}")
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _uc(kind: CompressionKind):
         E = unreal.TextureCompressionSettings
         table = {
@@ -141,6 +274,7 @@ class TextureConfigurator:
         raise RuntimeError(f"Unsupported CompressionKind on this engine build: {kind}")
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def _um(kind: MipGenKind):
         """MipGenKind -> unreal.TextureMipGenSettings"""
         E = unreal.TextureMipGenSettings
@@ -166,6 +300,7 @@ class TextureConfigurator:
         raise RuntimeError(f"Unsupported MipGenKind on this engine build: {kind}")
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _utg(kind: TextureGroupKind):
         """TextureGroupKind -> unreal.TextureGroup"""
         E = unreal.TextureGroup
@@ -220,133 +355,277 @@ class TextureConfigurator:
         - 各ステップの例外を収集して返す
         """
         texture = _get_texture_from_path(path_name)
-        p = self.params
         report = {"ok": True, "applied": [], "errors": []}
         revert_actions: List[Callable[[], None]] = []
 
+        if not isinstance(texture, unreal.Texture):
+            msg = "apply(): first argument must be unreal.Texture"
+            unreal.log_error(msg)
+            report.update(ok=False, errors=[msg])
+            return report
+
+        trans = unreal.ScopedEditorTransaction("Configure Texture (Batch Apply)")
+        try:
+            self._apply_properties(texture, report, revert_actions)
+
+            # 一括反映
+            path = texture.get_path_name()
+            if report["ok"] and report["unchanged"]:
+                # 既に目標値と一致している: modify を行わない（パッケージを dirty にしない）
+                self._cancel_transaction(trans, report)
+                logger.debug("[TextureConfigurator] Unchanged: %s", path)
+                if _is_package_dirty(texture):
+                    # インポート直後など、元から dirty なパッケージは従来どおり保存する
+                    if not unreal.EditorAssetLibrary.save_loaded_asset(texture, only_if_is_dirty=True):
+                        _mark_unsaved(report, "save: save_loaded_asset failed")
+            elif report["ok"]:
+                if not unreal.EditorAssetLibrary.save_loaded_asset(texture):
+                    _mark_unsaved(report, "save: save_loaded_asset failed")
+                logger.debug("[TextureConfigurator] Applied to %s (%s)", path, ", ".join(report["applied"]) or "no-op")
+            else:
+                self._rollback(report, revert_actions)
+                self._cancel_transaction(trans, report)
+                logger.warning("[TextureConfigurator] Applied with errors on %s: %s", path, report["errors"])
+
+            return report
+        finally:
+            del trans
+
+    @classmethod
+    def apply_many(
+        cls,
+        jobs: Iterable[Tuple[str, Union[TextureConfigParams, ResolvedTextureParams]]],
+    ) -> Dict[str, Dict[str, Union[bool, List[str]]]]:
+        """
+        複数テクスチャへの一括反映。
+        - 全テクスチャの変更を 1 つの ScopedEditorTransaction（Undo 1 回分）にまとめる
+        - 保存は最後に save_loaded_assets で 1 回だけ行う
+        - 失敗したテクスチャはそのテクスチャの変更だけをロールバックする（他には影響しない）
+        - 既に目標値と一致しているテクスチャは modify しない（report["unchanged"] が True）。
+          パッケージが dirty でなければ保存もしない
+        - 保存に失敗したテクスチャは、変更がエディタ上に残っている（Undo で戻せる）ため ok のまま
+          report["unsaved"] を True にし、errors に保存の失敗を記録する
+
+        Args:
+            jobs: (テクスチャパス, 設定) の組の列。
+
+        Returns:
+            Dict[str, dict]: テクスチャパス → apply() と同形式のレポート。
+                読み込みなどで例外が発生した場合は "exception" / "traceback" キーを含む。
+        """
+        reports: Dict[str, Dict[str, Union[bool, List[str]]]] = {}
+        to_save: List[Tuple[str, "unreal.Texture"]] = []
+
+        trans = unreal.ScopedEditorTransaction("Configure Textures (Batch Apply)")
+        try:
+            for path_name, params in jobs:
+                report = {"ok": True, "applied": [], "errors": []}
+                reports[path_name] = report
+                revert_actions: List[Callable[[], None]] = []
+                texture = None
+                try:
+                    with stage_timer.span("load", path_name):
+                        texture = _get_texture_from_path(path_name)
+                    with stage_timer.span("apply", path_name):
+                        cls(params=params)._apply_properties(texture, report, revert_actions)
+                except Exception as e:
+                    report["ok"] = False
+                    report["errors"].append(f"exception: {e}")
+                    report["exception"] = e
+                    report["traceback"] = traceback.format_exc()
+                if report["ok"] and report.get("unchanged"):
+                    logger.debug("[TextureConfigurator] Unchanged: %s", path_name)
+                    if _is_package_dirty(texture):
+                        # インポート直後など、元から dirty なパッケージは従来どおり保存する
+                        to_save.append((path_name, texture))
+                elif report["ok"]:
+                    to_save.append((path_name, texture))
+                else:
+                    cls._rollback(report, revert_actions)
+                    logger.warning("[TextureConfigurator] Applied with errors on %s: %s", path_name, report["errors"])
+
+            if not any(r.get("applied") for r in reports.values()):
+                # 何も変更していなければ空の Undo 履歴を残さない
+                cls._cancel_transaction(trans, {"errors": []})
+            with stage_timer.span("save"):
+                cls._save_all(to_save, reports)
+            return reports
+        finally:
+            del trans
+
+    @staticmethod
+    def _save_all(
+        textures: List[Tuple[str, "unreal.Texture"]],
+        reports: Dict[str, Dict[str, Union[bool, List[str]]]],
+    ) -> None:
+        """反映に成功したテクスチャをまとめて保存する。"""
+        if not textures:
+            return
+        lib = unreal.EditorAssetLibrary
+        save_many = getattr(lib, "save_loaded_assets", None)
+        if callable(save_many):
+            try:
+                saved = save_many([t for _, t in textures], only_if_is_dirty=True)
+            except Exception as save_error:
+                saved = False
+                logger.error("[TextureConfigurator] Bulk save failed: %s", save_error)
+            if not saved:
+                for path_name, _ in textures:
+                    _mark_unsaved(reports[path_name], "save: save_loaded_assets failed")
+        else:
+            # save_loaded_assets が無いエンジンビルド向け
+            for path_name, texture in textures:
+                if not lib.save_loaded_asset(texture):
+                    _mark_unsaved(reports[path_name], "save: save_loaded_asset failed")
+
+        for path_name, _ in textures:
+            report = reports[path_name]
+            if report.get("unsaved"):
+                logger.warning("[TextureConfigurator] Applied but not saved: %s", path_name)
+            elif report["ok"] and not report.get("unchanged"):
+                logger.debug("[TextureConfigurator] Applied to %s (%s)", path_name, ", ".join(report["applied"]) or "no-op")
+
+    @staticmethod
+    def _cancel_transaction(trans, report: Dict[str, Union[bool, List[str]]]) -> None:
+        cancel = getattr(trans, "cancel", None)
+        if callable(cancel):
+            try:
+                cancel()
+            except Exception as cancel_error:
+                report["errors"].append(f"transaction_cancel: {cancel_error}")
+
+    @staticmethod
+    def _rollback(report: Dict[str, Union[bool, List[str]]], revert_actions: List[Callable[[], None]]) -> None:
+        """ここまでに行った変更を逆順に取り消す。"""
+        for revert in reversed(revert_actions):
+            try:
+                revert()
+            except Exception as revert_error:
+                report["errors"].append(f"rollback: {revert_error}")
+        report["applied"] = []
+
+    def _apply_properties(
+        self,
+        texture: "unreal.Texture",
+        report: Dict[str, Union[bool, List[str]]],
+        revert_actions: List[Callable[[], None]],
+    ) -> None:
+        """
+        設定値をテクスチャへ反映する（Undo・保存は呼び出し側で行う）。
+        現在値を読み、目標値と異なるプロパティだけを書き込む。最初の書き込みの直前に
+        texture.modify() を 1 回だけ呼ぶため、差分が無ければテクスチャには一切触れない。
+        変更ごとに元へ戻す処理を revert_actions に積み、失敗は report に記録する。
+        report["applied"] には実際に変更したプロパティだけが入り、
+        変更が 1 つも無ければ report["unchanged"] が True になる。
+        """
+        p = self.params
+        modified = [False]
+
         def _revert_with(setter: Callable[[], None]) -> None:
             revert_actions.append(setter)
 
-        def _set_attr(attr: str, value) -> None:
+        def _ensure_modified() -> None:
+            if not modified[0]:
+                texture.modify()
+                modified[0] = True
+
+        def _set_attr(attr: str, value) -> bool:
             original = getattr(texture, attr)
+            if original == value:
+                return False
+            _ensure_modified()
             setattr(texture, attr, value)
             _revert_with(lambda texture=texture, attr=attr, original=original: setattr(texture, attr, original))
+            return True
 
-        def _set_editor_property(name: str, value) -> None:
+        def _set_editor_property(name: str, value) -> bool:
             original = texture.get_editor_property(name)
+            if original == value:
+                return False
+            _ensure_modified()
             texture.set_editor_property(name, value)
             _revert_with(
                 lambda texture=texture, name=name, original=original: texture.set_editor_property(name, original)
             )
+            return True
 
         if not isinstance(texture, unreal.Texture):
-            msg = "apply(): first argument must be unreal.Texture"
-            unreal.log_error(msg)
-            report.update(ok=False, errors=[msg])
-            return report
-
-        trans = unreal.ScopedEditorTransaction("Configure Texture (Batch Apply)")
-        try:
-            texture.modify()
+            raise TypeError("apply(): first argument must be unreal.Texture")
 
-            # 1) Address
-            if p.address_u is not None and p.address_v is not None:
-                try:
-                    _set_attr("address_x", self._ua(p.address_u))
-                    _set_attr("address_y", self._ua(p.address_v))
-                    if p.address_z is not None and hasattr(texture, "address_z"):
-                        _set_attr("address_z", self._ua(p.address_z))
+        # 1) Address
+        if p.address_u is not None and p.address_v is not None:
+            try:
+                changed = _set_attr("address_x", self._ua(p.address_u))
+                changed = _set_attr("address_y", self._ua(p.address_v)) or changed
+                if p.address_z is not None and hasattr(texture, "address_z"):
+                    changed = _set_attr("address_z", self._ua(p.address_z)) or changed
+                if changed:
                     report["applied"].append("address")
-                except Exception as e:
-                    report["ok"] = False
-                    report["errors"].append(f"address: {e}")
+            except Exception as e:
+                report["ok"] = False
+                report["errors"].append(f"address: {e}")
 
-            # 2) Max In-Game
-            if p.max_in_game is not None:
-                try:
-                    size = self._size_to_int(p.max_in_game)
-                    if p.enforce_pow2 and size > 0:
-                        size = 1 << int(math.log2(size))
-                    if size > 0:
-                        size = max(16, min(size, 16384))
-                    if hasattr(texture, "max_texture_size"):
-                        _set_attr("max_texture_size", size)
-                    else:
-                        _set_editor_property("MaxTextureSize", size)
+        # 2) Max In-Game
+        if p.max_in_game is not None:
+            try:
+                size = effective_max_texture_size(self._size_to_int(p.max_in_game), p.enforce_pow2)
+                if hasattr(texture, "max_texture_size"):
+                    changed = _set_attr("max_texture_size", size)
+                else:
+                    changed = _set_editor_property("MaxTextureSize", size)
+                if changed:
                     report["applied"].append("max_in_game")
-                except Exception as e:
-                    report["ok"] = False
-                    report["errors"].append(f"max_in_game: {e}")
-
-            # 3) Compression（sRGB AUTO 参照元）
-            if p.compression is not None:
-                try:
-                    _set_attr("compression_settings", self._uc(p.compression))
-                    report["applied"].append("compression")
-                except Exception as e:
-                    report["ok"] = False
-                    report["errors"].append(f"compression: {e}")
-
-            # 4) sRGB
-            if p.srgb is not None:
-                try:
-                    if p.srgb is SRGBMode.AUTO:
-                        cs = getattr(texture, "compression_settings", None)
-                        if not isinstance(cs, unreal.TextureCompressionSettings):
-                            raise RuntimeError("failed to read compression_settings for AUTO sRGB")
-                        desired = self._auto_srgb_from_compression_unreal(cs)
-                    else:
-                        desired = (p.srgb is SRGBMode.ON)
-
-                    if hasattr(texture, "srgb"):
-                        _set_attr("srgb", bool(desired))
-                    else:
-                        _set_editor_property("SRGB", bool(desired))
-                    report["applied"].append("srgb")
-                except Exception as e:
-                    report["ok"] = False
-                    report["errors"].append(f"srgb: {e}")
+            except Exception as e:
+                report["ok"] = False
+                report["errors"].append(f"max_in_game: {e}")
 
-            # 5) TextureGroup（LODGroup
+        # 3) Compression（sRGB AUTO 参照元）
+        if p.compression is not None:
             try:
-                tg = self._utg(p.texture_group)
-                # C++プロパティ名は LODGroup。Python では set_editor_property が確実。
-                _set_editor_property("LODGroup", tg)
-                report["applied"].append("texture_group")
+                if _set_attr("compression_settings", self._uc(p.compression)):
+                    report["applied"].append("compression")
             except Exception as e:
                 report["ok"] = False
-                report["errors"].append(f"texture_group: {e}")
+                report["errors"].append(f"compression: {e}")
 
-            # === 6) MipGenSettings ===
+        # 4) sRGB
+        if p.srgb is not None:
             try:
-                mg = self._um(p.mip_gen)
-                _set_editor_property("MipGenSettings", mg)
-                report["applied"].append("mip_gen")
+                if p.srgb is SRGBMode.AUTO:
+                    cs = getattr(texture, "compression_settings", None)
+                    if not isinstance(cs, unreal.TextureCompressionSettings):
+                        raise RuntimeError("failed to read compression_settings for AUTO sRGB")
+                    desired = self._auto_srgb_from_compression_unreal(cs)
+                else:
+                    desired = (p.srgb is SRGBMode.ON)
+
+                if hasattr(texture, "srgb"):
+                    changed = _set_attr("srgb", bool(desired))
+                else:
+                    changed = _set_editor_property("SRGB", bool(desired))
+                if changed:
+                    report["applied"].append("srgb")
             except Exception as e:
                 report["ok"] = False
-                report["errors"].append(f"mip_gen: {e}")
+                report["errors"].append(f"srgb: {e}")
 
-            # 一括反映
-            path = texture.get_path_name()
-            if report["ok"]:
-                unreal.EditorAssetLibrary.save_loaded_asset(texture)
-                unreal.log(f"[TextureConfigurator] Applied to {path} ({', '.join(report['applied']) or 'no-op'})")
-            else:
-                # Rollback all modifications done so far
-                for revert in reversed(revert_actions):
-                    try:
-                        revert()
-                    except Exception as revert_error:
-                        report["errors"].append(f"rollback: {revert_error}")
-                report["applied"] = []
-                cancel = getattr(trans, "cancel", None)
-                if callable(cancel):
-                    try:
-                        cancel()
-                    except Exception as cancel_error:
-                        report["errors"].append(f"transaction_cancel: {cancel_error}")
-                unreal.log_warning(f"[TextureConfigurator] Applied with errors on {path}: {report['errors']}")
+        # 5) TextureGroup（LODGroup
+        try:
+            tg = self._utg(p.texture_group)
+            # C++プロパティ名は LODGroup。Python では set_editor_property が確実。
+            if _set_editor_property("LODGroup", tg):
+                report["applied"].append("texture_group")
+        except Exception as e:
+            report["ok"] = False
+            report["errors"].append(f"texture_group: {e}")
 
-            return report
-        finally:
-            del trans
+        # === 6) MipGenSettings ===
+        try:
+            mg = self._um(p.mip_gen)
+            if _set_editor_property("MipGenSettings", mg):
+                report["applied"].append("mip_gen")
+        except Exception as e:
+            report["ok"] = False
+            report["errors"].append(f"mip_gen: {e}")
+
+        report["unchanged"] = not modified[0]
@@ -0,0 +1,112 @@
+"""
+Unreal のディレクトリパス（/Game/...）をセグメント単位のトライで引くためのインデックス。
+
+- RunDirIndex  : run_dir の「同一または配下」判定をパスの深さに比例した時間で行う
+- PathTrie     : ディレクトリ → 値 の対応を持ち、パス上にある値を浅い順に列挙する
+                 （ディレクトリ別 Config 上書きの解決に使う）
+
+パスの正規化・ディレクトリ抽出は validator と同じ規則に従う（大小文字は区別する）。
+"""
+from __future__ import annotations
+
+from typing import Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+from validator import _extract_dir_from_asset_path, _normalize_unreal_path
+
+T = TypeVar("T")
+
+
+def _segments(normalized_dir: str) -> List[str]:
+    # 先頭の '/' も空セグメントとして残し、"Game/VFX" と "/Game/VFX" を区別する
+    return normalized_dir.split("/")
+
+
+class _Node(Generic[T]):
+    __slots__ = ("children", "has_value", "value")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_Node[T]"] = {}
+        self.has_value = False
+        self.value: Optional[T] = None
+
+
+class PathTrie(Generic[T]):
+    """ディレクトリパスをキーとするトライ。"""
+
+    def __init__(self) -> None:
+        self._root: _Node[T] = _Node()
+        self._size = 0
+
+    def insert(self, dir_path: str, value: T) -> None:
+        """dir_path に value を登録する（同じディレクトリは上書き）。空パスは無視する。"""
+        normalized = _normalize_unreal_path(dir_path)
+        if not normalized:
+            return
+        node = self._root
+        for seg in _segments(normalized):
+            node = node.children.setdefault(seg, _Node())
+        if not node.has_value:
+            self._size += 1
+        node.has_value = True
+        node.value = value
+
+    def __len__(self) -> int:
+        return self._size
+
+    def iter_prefixes(self, dir_path: str) -> List[Tuple[str, T]]:
+        """
+        dir_path 自身とその祖先に登録された (ディレクトリ, 値) を浅い順に返す。
+        dir_path は正規化済みのディレクトリパスを想定する。
+        """
+        found: List[Tuple[str, T]] = []
+        node = self._root
+        segs = _segments(dir_path)
+        for depth, seg in enumerate(segs):
+            node = node.children.get(seg)
+            if node is None:
+                break
+            if node.has_value:
+                found.append(("/".join(segs[: depth + 1]), node.value))  # type: ignore[arg-type]
+        return found
+
+    def has_prefix_of(self, dir_path: str) -> bool:
+        """dir_path 自身またはその祖先が登録されていれば True。"""
+        node = self._root
+        for seg in _segments(dir_path):
+            node = node.children.get(seg)
+            if node is None:
+                return False
+            if node.has_value:
+                return True
+        return False
+
+
+class RunDirIndex:
+    """run_dir のリストから一度だけ構築し、アセットパスが配下にあるかを判定する。"""
+
+    def __init__(self, run_dirs: Iterable[str]):
+        self._trie: PathTrie[bool] = PathTrie()
+        for d in run_dirs or []:
+            self._trie.insert(d, True)
+
+    def __len__(self) -> int:
+        return len(self._trie)
+
+    def match(self, asset_path: str) -> Optional[str]:
+        """asset_path を含む run_dir のうち最も深いもの（無ければ None）。"""
+        if not asset_path:
+            return None
+        path_dir = _extract_dir_from_asset_path(asset_path)
+        if not path_dir:
+            return None
+        found = self._trie.iter_prefixes(_normalize_unreal_path(path_dir))
+        return found[-1][0] if found else None
+
+    def contains(self, asset_path: str) -> bool:
+        """asset_path のディレクトリがいずれかの run_dir の直下または配下なら True（validate_directory と同じ判定）。"""
+        if not asset_path:
+            return False
+        path_dir = _extract_dir_from_asset_path(asset_path)
+        if not path_dir:
+            return False
+        return self._trie.has_prefix_of(_normalize_unreal_path(path_dir))
@@ -0,0 +1,79 @@
+"""
+バッチ処理中のエラーを集約し、終了時に 1 つのサマリー（ダイアログ・レポートファイル）にまとめる。
+
+処理途中でモーダルダイアログを出すと、不正なファイルが大量にある場合に
+ユーザーが延々とクリックし続けることになるため、エラーはここに溜めておき、
+バッチ終了時に 1 回だけ表示・保存する。
+"""
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Union
+
+# エラー種別 → サマリーでの表示名
+KIND_LABELS = {
+    "suffix_error": "サフィックスエラー",
+    "import_exception": "設定適用中の例外",
+    "import_failed": "設定適用の失敗",
+    "save_failed": "保存の失敗（適用済み・未保存）",
+    "delete_failed": "削除の失敗",
+    "memory_budget": "メモリ予算超過",
+}
+
+
+@dataclass
+class ErrorEntry:
+    kind: str
+    asset_path: str
+    message: str
+    # 例外時のトレースバックなど（レポートファイルにのみ出力する）
+    detail: str = ""
+
+
+class ErrorReport:
+    """エラーを種別ごとに溜め、サマリー文字列や JSON ファイルとして出力する。"""
+
+    def __init__(self) -> None:
+        self.entries: List[ErrorEntry] = []
+
+    def add(self, kind: str, asset_path: str, message: str, detail: str = "") -> None:
+        self.entries.append(ErrorEntry(kind, asset_path, str(message), detail))
+
+    def extend(self, other: "ErrorReport") -> None:
+        self.entries.extend(other.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def counts_by_kind(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for e in self.entries:
+            counts[e.kind] = counts.get(e.kind, 0) + 1
+        return counts
+
+    def format_summary(self, *, max_entries: int = 20) -> str:
+        """ダイアログ向けのサマリー文字列（先頭 max_entries 件のみ列挙）。"""
+        lines = [f"{len(self.entries)} 件のエラーが発生しました。"]
+        for kind, count in self.counts_by_kind().items():
+            lines.append(f"  {KIND_LABELS.get(kind, kind)}: {count}")
+        lines.append("")
+        for e in self.entries[:max_entries]:
+            first_line = e.message.splitlines()[0] if e.message else ""
+            lines.append(f"- {e.asset_path}: {first_line}")
+        rest = len(self.entries) - max_entries
+        if rest > 0:
+            lines.append(f"... 他 {rest} 件")
+        return "\n".join(lines)
+
+    def write(self, file_path: Union[str, Path]) -> None:
+        """全件を JSON として書き出す。"""
+        p = Path(file_path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "counts": self.counts_by_kind(),
+            "errors": [asdict(e) for e in self.entries],
+        }
+        with p.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,314 @@
+"""
+ソース画像のヘッダーだけを読み、解像度・チャンネル情報を返す（デコードはしない）。
+
+対応形式: PNG / TGA / EXR / DDS / PSD(PSB)
+ファイルは mmap で開き、ヘッダー部分（PNG は IDAT まで、EXR はヘッダー属性まで）だけを参照するため、
+巨大なソースでも読み込み量は数 KB 程度で済む。``unreal`` には依存しないため、
+エディタ内（AssetImportData のソースパス）とオフラインツールの両方から使える。
+
+    info = probe_image("D:/Art/T_Fire_col_cc.png")
+    info.width, info.height, info.bit_depth, info.channels, info.has_alpha
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+SUPPORTED_FORMATS = ("png", "tga", "exr", "dds", "psd")
+
+
+class ImageProbeError(ValueError):
+    """未対応の形式、またはヘッダーが壊れている場合に送出する。"""
+
+
+@dataclass(frozen=True)
+class ImageInfo:
+    """
+    ヘッダーから分かる画像情報。
+
+    - bit_depth: 1 チャンネルあたりのビット数（チャンネルごとに異なる場合は最大値、不明なら 0）
+    - channels : ファイルに格納されているチャンネル数（パレット画像は展開後の数、不明なら 0）
+    """
+    format: str
+    width: int
+    height: int
+    bit_depth: int
+    channels: int
+    has_alpha: bool
+
+    @property
+    def max_dimension(self) -> int:
+        return max(self.width, self.height)
+
+    @property
+    def is_pow2(self) -> bool:
+        return all(v > 0 and (v & (v - 1)) == 0 for v in (self.width, self.height))
+
+    def to_dict(self) -> Dict[str, object]:
+        return asdict(self)
+
+
+def probe_image(file_path: Union[str, Path]) -> ImageInfo:
+    """
+    file_path の画像ヘッダーを読み、ImageInfo を返す。
+
+    Raises:
+        OSError: ファイルを開けない場合。
+        ImageProbeError: 未対応の形式・ヘッダーの破損。
+    """
+    path = str(file_path)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ImageProbeError(f"empty file: {path}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return probe_bytes(mm, extension=os.path.splitext(path)[1])
+
+
+def try_probe_image(file_path: Union[str, Path]) -> Optional[ImageInfo]:
+    """probe_image() の例外を握りつぶして None を返す版。"""
+    try:
+        return probe_image(file_path)
+    except (OSError, ImageProbeError):
+        return None
+
+
+def probe_bytes(data, extension: str = "") -> ImageInfo:
+    """
+    先頭からのバイト列（bytes / mmap）を解析する。
+
+    TGA にはマジックナンバーが無いため、他の形式に一致しない場合に extension が ".tga" のときだけ判定する。
+    """
+    try:
+        head = bytes(data[:4])
+        if bytes(data[:8]) == _PNG_SIGNATURE:
+            return _probe_png(data)
+        if head == b"DDS ":
+            return _probe_dds(data)
+        if head == b"8BPS":
+            return _probe_psd(data)
+        if head == _EXR_MAGIC:
+            return _probe_exr(data)
+        if extension.lower().lstrip(".") == "tga":
+            return _probe_tga(data)
+    except struct.error as e:
+        raise ImageProbeError(f"truncated header: {e}") from e
+    raise ImageProbeError(f"unsupported image format (extension={extension!r})")
+
+
+# ---------- PNG ----------
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# color type → (チャンネル数, アルファ有無)
+_PNG_COLOR_TYPES = {0: (1, False), 2: (3, False), 3: (3, False), 4: (2, True), 6: (4, True)}
+
+
+def _probe_png(data) -> ImageInfo:
+    length, chunk_type = struct.unpack_from(">I4s", data, 8)
+    if chunk_type != b"IHDR" or length < 13:
+        raise ImageProbeError("PNG: IHDR chunk is missing")
+    width, height, bit_depth, color_type = struct.unpack_from(">IIBB", data, 16)
+    if color_type not in _PNG_COLOR_TYPES:
+        raise ImageProbeError(f"PNG: unknown color type {color_type}")
+    channels, has_alpha = _PNG_COLOR_TYPES[color_type]
+    if color_type == 3:
+        bit_depth = 8  # パレットのエントリは 8bit RGB
+
+    if not has_alpha:
+        # tRNS は IDAT より前にしか現れないので、チャンクヘッダーだけを辿る
+        offset = 8 + 12 + length
+        while offset + 8 <= len(data):
+            length, chunk_type = struct.unpack_from(">I4s", data, offset)
+            if chunk_type in (b"IDAT", b"IEND"):
+                break
+            if chunk_type == b"tRNS":
+                has_alpha = True
+                channels += 1
+                break
+            offset += 12 + length
+    return ImageInfo("png", width, height, bit_depth, channels, has_alpha)
+
+
+# ---------- TGA ----------
+
+def _probe_tga(data) -> ImageInfo:
+    (_id_len, cmap_type, image_type, _cmap_first, _cmap_len, cmap_bits,
+     _x, _y, width, height, pixel_bits, descriptor) = struct.unpack_from("<BBBHHBHHHHBB", data, 0)
+    alpha_bits = descriptor & 0x0F
+    base_type = image_type & ~0x08  # 9/10/11 は RLE 版
+    if base_type == 1 and cmap_type == 1:
+        # カラーマップ: エントリのビット数で決まる
+        pixel_bits = cmap_bits
+    elif base_type == 3:
+        channels = 2 if pixel_bits == 16 else 1
+        return ImageInfo("tga", width, height, 8, channels, channels == 2)
+    elif base_type != 2:
+        raise ImageProbeError(f"TGA: unsupported image type {image_type}")
+    if pixel_bits == 32:
+        return ImageInfo("tga", width, height, 8, 4, alpha_bits > 0)
+    if pixel_bits == 24:
+        return ImageInfo("tga", width, height, 8, 3, False)
+    if pixel_bits in (15, 16):
+        has_alpha = pixel_bits == 16 and alpha_bits > 0
+        return ImageInfo("tga", width, height, 5, 4 if has_alpha else 3, has_alpha)
+    raise ImageProbeError(f"TGA: unsupported pixel depth {pixel_bits}")
+
+
+# ---------- OpenEXR ----------
+
+_EXR_MAGIC = b"\x76\x2f\x31\x01"
+# pixel type → ビット数（UINT / HALF / FLOAT）
+_EXR_PIXEL_BITS = {0: 32, 1: 16, 2: 32}
+
+
+def _read_cstr(data, offset: int, limit: int = 256) -> Tuple[str, int]:
+    end = data.find(b"\x00", offset, offset + limit)
+    if end < 0:
+        raise ImageProbeError("EXR: unterminated string in header")
+    return bytes(data[offset:end]).decode("latin-1"), end + 1
+
+
+def _probe_exr(data) -> ImageInfo:
+    offset = 8  # magic + version
+    channels = []
+    data_window = None
+    while True:
+        start = offset
+        name, offset = _read_cstr(data, offset)
+        if not name:
+            break  # ヘッダー終端
+        _attr_type, offset = _read_cstr(data, offset)
+        (size,) = struct.unpack_from("<i", data, offset)
+        offset += 4
+        value_end = offset + size
+        # 負のサイズやファイル末尾を越える値は読み位置を戻す・飛ばすため、壊れたヘッダーとして扱う
+        if size < 0 or value_end > len(data):
+            raise ImageProbeError(f"EXR: invalid size {size} for attribute {name!r}")
+        if name == "channels":
+            pos = offset
+            while pos < value_end:
+                ch_name, pos = _read_cstr(data, pos)
+                if not ch_name:
+                    break
+                (pixel_type,) = struct.unpack_from("<i", data, pos)
+                pos += 16  # pixel_type, pLinear + reserved, xSampling, ySampling
+                channels.append((ch_name, pixel_type))
+        elif name == "dataWindow":
+            data_window = struct.unpack_from("<iiii", data, offset)
+        if data_window is not None and channels:
+            break
+        if value_end <= start:
+            raise ImageProbeError("EXR: header offset did not advance")
+        offset = value_end
+    if data_window is None or not channels:
+        raise ImageProbeError("EXR: dataWindow or channels attribute is missing")
+    x_min, y_min, x_max, y_max = data_window
+    bit_depth = max(_EXR_PIXEL_BITS.get(t, 0) for _, t in channels)
+    has_alpha = any(n == "A" or n.endswith(".A") for n, _ in channels)
+    return ImageInfo("exr", x_max - x_min + 1, y_max - y_min + 1, bit_depth, len(channels), has_alpha)
+
+
+# ---------- DDS ----------
+
+_DDPF_ALPHAPIXELS = 0x1
+_DDPF_ALPHA = 0x2
+_DDPF_FOURCC = 0x4
+_DDPF_LUMINANCE = 0x20000
+
+# FourCC → (チャンネル数, ビット深度, アルファ有無)
+_DDS_FOURCC = {
+    b"DXT1": (3, 8, False),
+    b"DXT2": (4, 8, True),
+    b"DXT3": (4, 8, True),
+    b"DXT4": (4, 8, True),
+    b"DXT5": (4, 8, True),
+    b"ATI1": (1, 8, False),
+    b"BC4U": (1, 8, False),
+    b"BC4S": (1, 8, False),
+    b"ATI2": (2, 8, False),
+    b"BC5U": (2, 8, False),
+    b"BC5S": (2, 8, False),
+    # D3DFORMAT の数値がそのまま入る浮動小数点・16bit 形式
+    struct.pack("<I", 36): (4, 16, True),   # A16B16G16R16
+    struct.pack("<I", 111): (1, 16, False),  # R16F
+    struct.pack("<I", 112): (2, 16, False),  # G16R16F
+    struct.pack("<I", 113): (4, 16, True),   # A16B16G16R16F
+    struct.pack("<I", 114): (1, 32, False),  # R32F
+    struct.pack("<I", 115): (2, 32, False),  # G32R32F
+    struct.pack("<I", 116): (4, 32, True),   # A32B32G32R32F
+}
+
+# DXGI_FORMAT → (チャンネル数, ビット深度, アルファ有無)
+_DXGI_FORMATS: Dict[int, Tuple[int, int, bool]] = {}
+for _ids, _info in (
+    ((2,), (4, 32, True)),              # R32G32B32A32_FLOAT
+    ((6,), (3, 32, False)),             # R32G32B32_FLOAT
+    ((10, 11), (4, 16, True)),          # R16G16B16A16_FLOAT / UNORM
+    ((24,), (4, 10, True)),             # R10G10B10A2_UNORM
+    ((26,), (3, 11, False)),            # R11G11B10_FLOAT
+    ((27, 28, 29), (4, 8, True)),       # R8G8B8A8
+    ((34, 35), (2, 16, False)),         # R16G16_FLOAT / UNORM
+    ((41,), (1, 32, False)),            # R32_FLOAT
+    ((49,), (2, 8, False)),             # R8G8_UNORM
+    ((54, 56), (1, 16, False)),         # R16_FLOAT / UNORM
+    ((61,), (1, 8, False)),             # R8_UNORM
+    ((65,), (1, 8, True)),              # A8_UNORM
+    ((70, 71, 72), (3, 8, False)),      # BC1
+    ((73, 74, 75), (4, 8, True)),       # BC2
+    ((76, 77, 78), (4, 8, True)),       # BC3
+    ((79, 80, 81), (1, 8, False)),      # BC4
+    ((82, 83, 84), (2, 8, False)),      # BC5
+    ((87, 90, 91), (4, 8, True)),       # B8G8R8A8
+    ((88, 92, 93), (3, 8, False)),      # B8G8R8X8
+    ((94, 95, 96), (3, 16, False)),     # BC6H
+    ((97, 98, 99), (4, 8, True)),       # BC7
+):
+    for _id in _ids:
+        _DXGI_FORMATS[_id] = _info
+
+
+def _probe_dds(data) -> ImageInfo:
+    header_size, _flags, height, width = struct.unpack_from("<IIII", data, 4)
+    if header_size != 124:
+        raise ImageProbeError(f"DDS: unexpected header size {header_size}")
+    pf_flags, four_cc, bit_count, r_mask, g_mask, b_mask, a_mask = struct.unpack_from("<I4sIIIII", data, 80)
+
+    if pf_flags & _DDPF_FOURCC:
+        if four_cc == b"DX10":
+            (dxgi_format,) = struct.unpack_from("<I", data, 128)
+            channels, bit_depth, has_alpha = _DXGI_FORMATS.get(dxgi_format, (0, 0, False))
+        else:
+            channels, bit_depth, has_alpha = _DDS_FOURCC.get(four_cc, (0, 0, False))
+        return ImageInfo("dds", width, height, bit_depth, channels, has_alpha)
+
+    has_alpha = bool(pf_flags & (_DDPF_ALPHAPIXELS | _DDPF_ALPHA)) and a_mask != 0
+    if pf_flags & _DDPF_ALPHA and not (r_mask or g_mask or b_mask):
+        color_masks = []
+    elif pf_flags & _DDPF_LUMINANCE:
+        color_masks = [r_mask]
+    else:
+        color_masks = [m for m in (r_mask, g_mask, b_mask) if m]
+    masks = color_masks + ([a_mask] if has_alpha else [])
+    bit_depth = max((bin(m).count("1") for m in masks), default=0)
+    return ImageInfo("dds", width, height, bit_depth, len(masks), has_alpha)
+
+
+# ---------- PSD / PSB ----------
+
+# カラーモード → カラーチャンネル数（これを超えるチャンネルはアルファとみなす）
+_PSD_COLOR_CHANNELS = {0: 1, 1: 1, 2: 1, 3: 3, 4: 4, 7: 0, 8: 1, 9: 3}
+
+
+def _probe_psd(data) -> ImageInfo:
+    version, channels, height, width, depth, mode = struct.unpack_from(">H6xHIIHH", data, 4)
+    if version not in (1, 2):
+        raise ImageProbeError(f"PSD: unsupported version {version}")
+    color_channels = _PSD_COLOR_CHANNELS.get(mode, channels)
+    if mode == 2:
+        # インデックスカラーはパレット展開後の RGB として扱う
+        return ImageInfo("psd", width, height, 8, 3, False)
+    has_alpha = color_channels > 0 and channels > color_channels
+    return ImageInfo("psd", width, height, depth, channels, has_alpha)
@@ -0,0 +1,302 @@
+"""
+最終設定（ResolvedTextureParams）とソース解像度から、テクスチャのメモリ使用量を見積もる。
+
+- 上限解像度: max_in_game（enforce_pow2 なら 2 の冪に切り下げ）を超える分はミップ単位で縮小
+- ミップ: NO_MIPMAPS 以外かつ 2 の冪サイズなら 1x1 までの全段（非 2 の冪はエンジン同様ミップ無し）
+- 形式: CompressionKind ごとのビット数（BC 系は 4x4 ブロック単位で切り上げ）
+
+見積もりは run_dir / TextureGroup / テクスチャ種類ごとに集計でき（MemoryReport）、
+Config の texture_group_budgets を超えたグループの検出と、大きいテクスチャから順に
+max_in_game を下げる計画（plan_budget_reductions）を作れる。``unreal`` には依存しない。
+"""
+from __future__ import annotations
+
+import heapq
+import json
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from config import ResolvedTextureParams
+from image_probe import ImageInfo
+from type_define import CompressionKind, MipGenKind, SizePreset, TextureGroupKind
+
+MIB = 1024 * 1024
+# エンジンが受け付ける MaxTextureSize の範囲（アダプタ側の反映と同じ）
+MIN_TEXTURE_SIZE = 16
+MAX_TEXTURE_SIZE = 16384
+# 予算超過時に max_in_game を下げる下限
+DEFAULT_MIN_REDUCED_SIZE = 128
+
+# CompressionKind → (不透明時のビット数, アルファありのビット数, BC ブロック圧縮か)
+_FORMAT_BITS: Dict[CompressionKind, Tuple[int, int, bool]] = {
+    CompressionKind.DEFAULT: (4, 8, True),               # BC1 / BC3
+    CompressionKind.NORMAL_MAP: (8, 8, True),            # BC5
+    CompressionKind.MASKS: (4, 8, True),                 # BC1 / BC3（sRGB 無し）
+    CompressionKind.GRAYSCALE: (8, 8, False),            # G8
+    CompressionKind.HDR: (64, 64, False),                # RGBA16F
+    CompressionKind.ALPHA: (4, 4, True),                 # BC4
+    CompressionKind.EDITOR_ICON: (32, 32, False),        # BGRA8
+    CompressionKind.DISTANCE_FIELD_FONT: (8, 8, False),  # G8
+    CompressionKind.BC7: (8, 8, True),
+}
+
+
+def effective_max_texture_size(max_in_game: Optional[Union[int, SizePreset]], enforce_pow2: bool) -> int:
+    """max_in_game をエンジンに設定する値に変換する（0 は無制限）。"""
+    if max_in_game is None:
+        return 0
+    size = max(0, int(max_in_game))
+    if enforce_pow2 and size > 0:
+        size = 1 << int(math.log2(size))
+    if size > 0:
+        size = max(MIN_TEXTURE_SIZE, min(size, MAX_TEXTURE_SIZE))
+    return size
+
+
+def bits_per_pixel(compression: Optional[CompressionKind], has_alpha: bool = False) -> Tuple[int, bool]:
+    """(1 ピクセルあたりのビット数, BC ブロック圧縮か)。compression が None なら DEFAULT 扱い。"""
+    opaque, alpha, block = _FORMAT_BITS.get(compression or CompressionKind.DEFAULT, _FORMAT_BITS[CompressionKind.DEFAULT])
+    return (alpha if has_alpha else opaque), block
+
+
+def _is_pow2(v: int) -> bool:
+    return v > 0 and (v & (v - 1)) == 0
+
+
+def top_mip_size(width: int, height: int, max_size: int) -> Tuple[int, int]:
+    """max_size（0 は無制限）に収まるまでミップ単位で縮小した最上位ミップの解像度。"""
+    while max_size > 0 and max(width, height) > max_size and max(width, height) > 1:
+        width, height = max(1, width >> 1), max(1, height >> 1)
+    return width, height
+
+
+def mip_chain_bytes(width: int, height: int, bits: int, block: bool, mip_count: int) -> int:
+    total = 0
+    for _ in range(mip_count):
+        if block:
+            total += math.ceil(width / 4) * math.ceil(height / 4) * bits * 2  # 16 ピクセル × bits / 8
+        else:
+            total += width * height * bits // 8
+        width, height = max(1, width >> 1), max(1, height >> 1)
+    return total
+
+
+@dataclass(frozen=True)
+class TextureMemoryEstimate:
+    asset_path: str
+    params: ResolvedTextureParams
+    source_width: int
+    source_height: int
+    has_alpha: bool
+    width: int
+    height: int
+    mip_count: int
+    bytes: int
+    texture_type: Optional[str] = None
+    run_dir: Optional[str] = None
+    # ソースを読めず max_in_game から見積もった場合 False
+    size_known: bool = True
+
+    @property
+    def texture_group(self) -> TextureGroupKind:
+        return self.params.texture_group
+
+    def with_max_in_game(self, max_in_game: int) -> "TextureMemoryEstimate":
+        """max_in_game を変えた場合の見積もり。"""
+        return estimate_texture(
+            self.asset_path,
+            self.params.replace(max_in_game=max_in_game),
+            self.source_width,
+            self.source_height,
+            has_alpha=self.has_alpha,
+            texture_type=self.texture_type,
+            run_dir=self.run_dir,
+            size_known=self.size_known,
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "asset_path": self.asset_path,
+            "texture_type": self.texture_type,
+            "texture_group": self.texture_group.name,
+            "run_dir": self.run_dir,
+            "source": [self.source_width, self.source_height],
+            "size": [self.width, self.height],
+            "mip_count": self.mip_count,
+            "bytes": self.bytes,
+            "size_known": self.size_known,
+        }
+
+
+def estimate_texture(
+    asset_path: str,
+    params: ResolvedTextureParams,
+    source_width: int,
+    source_height: int,
+    *,
+    has_alpha: bool = False,
+    texture_type: Optional[str] = None,
+    run_dir: Optional[str] = None,
+    size_known: bool = True,
+) -> TextureMemoryEstimate:
+    """ソース解像度と最終設定から 1 テクスチャの見積もりを作る。"""
+    max_size = effective_max_texture_size(params.max_in_game, params.enforce_pow2)
+    width, height = top_mip_size(source_width, source_height, max_size)
+    if params.mip_gen == MipGenKind.NO_MIPMAPS or not (_is_pow2(width) and _is_pow2(height)):
+        mip_count = 1
+    else:
+        mip_count = int(math.log2(max(width, height))) + 1
+    bits, block = bits_per_pixel(params.compression, has_alpha)
+    return TextureMemoryEstimate(
+        asset_path=asset_path,
+        params=params,
+        source_width=source_width,
+        source_height=source_height,
+        has_alpha=has_alpha,
+        width=width,
+        height=height,
+        mip_count=mip_count,
+        bytes=mip_chain_bytes(width, height, bits, block, mip_count),
+        texture_type=texture_type,
+        run_dir=run_dir,
+        size_known=size_known,
+    )
+
+
+def estimate_from_source(
+    asset_path: str,
+    params: ResolvedTextureParams,
+    source: Optional[ImageInfo],
+    *,
+    texture_type: Optional[str] = None,
+    run_dir: Optional[str] = None,
+) -> Optional[TextureMemoryEstimate]:
+    """
+    ヘッダー情報（image_probe）から見積もる。ソースが読めない場合は max_in_game の正方形で
+    上限を見積もり（size_known=False）、それも無ければ None。
+    """
+    if source is not None and source.width > 0 and source.height > 0:
+        return estimate_texture(asset_path, params, source.width, source.height, has_alpha=source.has_alpha,
+                                texture_type=texture_type, run_dir=run_dir)
+    max_size = effective_max_texture_size(params.max_in_game, params.enforce_pow2)
+    if max_size <= 0:
+        return None
+    return estimate_texture(asset_path, params, max_size, max_size,
+                            texture_type=texture_type, run_dir=run_dir, size_known=False)
+
+
+@dataclass(frozen=True)
+class BudgetOverrun:
+    group: TextureGroupKind
+    budget_bytes: int
+    total_bytes: int
+
+    def format(self) -> str:
+        return (f"{self.group.name}: {self.total_bytes / MIB:.1f} MiB "
+                f"(budget {self.budget_bytes / MIB:.1f} MiB, over by {(self.total_bytes - self.budget_bytes) / MIB:.1f} MiB)")
+
+
+class MemoryReport:
+    """見積もりを溜め、run_dir / TextureGroup / テクスチャ種類ごとに集計する。"""
+
+    def __init__(self, estimates: Iterable[TextureMemoryEstimate] = ()) -> None:
+        self.estimates: Dict[str, TextureMemoryEstimate] = {}
+        # 見積もれなかった（ソースも max_in_game も無い）テクスチャ
+        self.unknown: List[str] = []
+        for e in estimates:
+            self.add(e)
+
+    def add(self, estimate: TextureMemoryEstimate) -> None:
+        self.estimates[estimate.asset_path] = estimate
+
+    def __len__(self) -> int:
+        return len(self.estimates)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(e.bytes for e in self.estimates.values())
+
+    def _totals(self, key) -> Dict[str, int]:
+        totals: Dict[str, int] = {}
+        for e in self.estimates.values():
+            k = key(e)
+            totals[k] = totals.get(k, 0) + e.bytes
+        return dict(sorted(totals.items(), key=lambda kv: -kv[1]))
+
+    def by_group(self) -> Dict[str, int]:
+        return self._totals(lambda e: e.texture_group.name)
+
+    def by_run_dir(self) -> Dict[str, int]:
+        return self._totals(lambda e: e.run_dir or "-")
+
+    def by_texture_type(self) -> Dict[str, int]:
+        return self._totals(lambda e: e.texture_type or "-")
+
+    def check_budgets(self, budgets: Dict[TextureGroupKind, int]) -> List[BudgetOverrun]:
+        """予算（バイト）を超えた TextureGroup を返す。"""
+        totals = self.by_group()
+        return [
+            BudgetOverrun(group, budget, totals[group.name])
+            for group, budget in budgets.items()
+            if totals.get(group.name, 0) > budget
+        ]
+
+    def format_summary(self, *, top: int = 5) -> str:
+        lines = [f"Estimated texture memory: {self.total_bytes / MIB:.1f} MiB in {len(self)} textures"
+                 + (f" ({len(self.unknown)} unknown)" if self.unknown else "")]
+        for title, totals in (("group", self.by_group()), ("run_dir", self.by_run_dir()),
+                              ("type", self.by_texture_type())):
+            parts = ", ".join(f"{k} {v / MIB:.1f}" for k, v in list(totals.items())[:top])
+            lines.append(f"  by {title} (MiB): {parts}")
+        return "\n".join(lines)
+
+    def write(self, file_path: Union[str, Path]) -> None:
+        """集計と全テクスチャの見積もりを JSON として書き出す。"""
+        p = Path(file_path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "total_bytes": self.total_bytes,
+            "by_group": self.by_group(),
+            "by_run_dir": self.by_run_dir(),
+            "by_texture_type": self.by_texture_type(),
+            "unknown": self.unknown,
+            "textures": sorted((e.to_dict() for e in self.estimates.values()), key=lambda d: -d["bytes"]),
+        }
+        with p.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def plan_budget_reductions(
+    report: MemoryReport,
+    budgets: Dict[TextureGroupKind, int],
+    *,
+    min_size: int = DEFAULT_MIN_REDUCED_SIZE,
+) -> Dict[str, int]:
+    """
+    予算を超えた TextureGroup について、大きいテクスチャから順に最上位ミップを半分にする
+    max_in_game を求める（予算内に収まるか、全テクスチャが min_size に達するまで）。
+
+    report の見積もりも縮小後の値に更新する。
+
+    Returns:
+        Dict[str, int]: アセットパス → 新しい max_in_game
+    """
+    reductions: Dict[str, int] = {}
+    for overrun in report.check_budgets(budgets):
+        total = overrun.total_bytes
+        heap = [(-e.bytes, e.asset_path) for e in report.estimates.values() if e.texture_group == overrun.group]
+        heapq.heapify(heap)
+        while heap and total > overrun.budget_bytes:
+            _neg_bytes, path = heapq.heappop(heap)
+            current = report.estimates[path]
+            new_size = max(current.width, current.height) // 2
+            if new_size < min_size:
+                continue  # これ以上は下げない
+            reduced = current.with_max_in_game(new_size)
+            total -= current.bytes - reduced.bytes
+            report.add(reduced)
+            reductions[path] = new_size
+            heapq.heappush(heap, (-reduced.bytes, path))
+    return reductions
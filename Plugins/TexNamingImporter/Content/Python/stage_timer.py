@@ -0,0 +1,166 @@
+"""
+設定適用パイプラインの段階別計測（既定は無効）。
+
+使い方:
+    import stage_timer
+    stage_timer.enable()
+    with stage_timer.span("resolve", tex_path):
+        ...
+    stage_timer.dump("timing.json")   # テクスチャ別の時間と段階別の p50 / p95 / max
+
+無効時の span() は共有の何もしないコンテキストマネージャを返すだけなので、
+計測箇所を残したままでもコストはほぼ無い。
+"""
+from __future__ import annotations
+
+import json
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+# この環境変数に出力先パスを指定すると、サービス経由の実行でも計測を有効にする
+TIMING_ENV_VAR = "TEXNAMING_TIMING"
+
+_perf_counter = time.perf_counter
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("_timer", "_stage", "_item", "_start")
+
+    def __init__(self, timer: "StageTimer", stage: str, item: Optional[str]):
+        self._timer = timer
+        self._stage = stage
+        self._item = item
+        self._start = 0.0
+
+    def __enter__(self) -> "_Span":
+        self._start = _perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._timer.record(self._stage, _perf_counter() - self._start, self._item)
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """nearest-rank 法のパーセンタイル（sorted_values は昇順・非空）。"""
+    rank = max(1, math.ceil(q / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class StageTimer:
+    """段階名ごとの所要時間と、テクスチャ（item）ごとの内訳を記録する（texture_pipeline のワーカーからも記録される）。"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._samples: Dict[str, List[float]] = {}
+        self._items: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def span(self, stage: str, item: Optional[str] = None):
+        """stage の区間を計測するコンテキストマネージャ。item を渡すとテクスチャ別にも集計する。"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, stage, item)
+
+    def record(self, stage: str, seconds: float, item: Optional[str] = None) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._samples.setdefault(stage, []).append(seconds)
+            if item is not None:
+                per_item = self._items.setdefault(item, {})
+                per_item[stage] = per_item.get(stage, 0.0) + seconds
+
+    def reset(self) -> None:
+        self._samples.clear()
+        self._items.clear()
+
+    def report(self) -> dict:
+        """
+        計測結果を JSON 化できる辞書で返す（時間はミリ秒）。
+
+        Returns:
+            dict: {"stages": {stage: {count, total_ms, p50_ms, p95_ms, max_ms}},
+                   "items": {item: {stage: ms}}}
+        """
+        stages = {}
+        for stage, values in self._samples.items():
+            ordered = sorted(values)
+            stages[stage] = {
+                "count": len(ordered),
+                "total_ms": sum(ordered) * 1000.0,
+                "p50_ms": _percentile(ordered, 50) * 1000.0,
+                "p95_ms": _percentile(ordered, 95) * 1000.0,
+                "max_ms": ordered[-1] * 1000.0,
+            }
+        items = {
+            item: {stage: seconds * 1000.0 for stage, seconds in per_item.items()}
+            for item, per_item in self._items.items()
+        }
+        return {"stages": stages, "items": items}
+
+    def dump(self, file_path: Union[str, Path]) -> None:
+        """report() を JSON ファイルへ書き出す。"""
+        p = Path(file_path)
+        if p.parent and not p.parent.exists():
+            p.parent.mkdir(parents=True, exist_ok=True)
+        with p.open("w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2, ensure_ascii=False)
+
+
+# モジュール全体で共有する計測器
+_timer = StageTimer()
+
+
+def get_timer() -> StageTimer:
+    return _timer
+
+
+def enable() -> None:
+    """計測を有効にし、これまでの記録を破棄する。"""
+    _timer.reset()
+    _timer.enabled = True
+
+
+def disable() -> None:
+    _timer.enabled = False
+
+
+def is_enabled() -> bool:
+    return _timer.enabled
+
+
+def span(stage: str, item: Optional[str] = None):
+    """共有の計測器で stage の区間を計測する（無効時は何もしない）。"""
+    if not _timer.enabled:
+        return _NULL_SPAN
+    return _Span(_timer, stage, item)
+
+
+def report() -> dict:
+    return _timer.report()
+
+
+def dump(file_path: Union[str, Path]) -> None:
+    _timer.dump(file_path)
+
+
+def env_output_path() -> Optional[str]:
+    """環境変数 TEXNAMING_TIMING に指定された出力先（未設定なら None）。"""
+    return os.environ.get(TIMING_ENV_VAR) or None
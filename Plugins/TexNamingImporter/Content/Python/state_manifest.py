@@ -0,0 +1,108 @@
+"""
+ディレクトリ一括設定の増分実行用マニフェスト。
+
+アセットパスごとに「最後に設定したときのパッケージの状態（更新時刻・サイズ）」と
+「そのとき適用した最終設定のハッシュ」を記録する。次回実行時はどちらも一致する
+アセットをスキップし、新規・変更されたアセットと Config の該当設定が変わったアセットだけを処理する。
+
+既定の保存先: {ProjectDir}/Saved/TexNamingImporter/manifest.json
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from config import ResolvedTextureParams, TextureConfigParams
+
+MANIFEST_VERSION = 1
+MANIFEST_FILE_NAME = "manifest.json"
+
+
+def params_hash(params: Union[TextureConfigParams, ResolvedTextureParams]) -> str:
+    """最終設定の内容から安定したハッシュ文字列を作る（プロセス間・実行間で同じ値になる）。"""
+    payload = json.dumps(params.to_dict(minimal=False), sort_keys=True, ensure_ascii=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def file_stamp(file_path: Union[str, Path]) -> Optional[str]:
+    """ファイルの更新時刻とサイズから状態文字列を作る。ファイルが無ければ None。"""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+@dataclass
+class ManifestEntry:
+    package_stamp: str
+    params_hash: str
+
+
+class StateManifest:
+    """アセットパス → ManifestEntry の対応表。load() / save() で JSON と相互変換する。"""
+
+    def __init__(self, path: Union[str, Path], entries: Optional[Dict[str, ManifestEntry]] = None):
+        self.path = Path(path)
+        self.entries: Dict[str, ManifestEntry] = dict(entries or {})
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "StateManifest":
+        """マニフェストを読み込む。ファイルが無い・壊れている・版が違う場合は空で開始する。"""
+        p = Path(path)
+        try:
+            data = json.loads(p.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(p)
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return cls(p)
+        entries: Dict[str, ManifestEntry] = {}
+        for asset_path, raw in (data.get("assets") or {}).items():
+            if isinstance(raw, dict) and isinstance(raw.get("package_stamp"), str) and isinstance(raw.get("params_hash"), str):
+                entries[asset_path] = ManifestEntry(raw["package_stamp"], raw["params_hash"])
+        return cls(p, entries)
+
+    def is_up_to_date(self, asset_path: str, package_stamp: Optional[str], params_digest: str) -> bool:
+        """前回記録時からパッケージも最終設定も変わっていなければ True。状態が取れない場合は常に False。"""
+        if package_stamp is None:
+            return False
+        entry = self.entries.get(asset_path)
+        return entry is not None and entry.package_stamp == package_stamp and entry.params_hash == params_digest
+
+    def record(self, asset_path: str, package_stamp: Optional[str], params_digest: str) -> None:
+        """設定済みとして記録する。パッケージの状態が取れない場合は記録しない（毎回処理される）。"""
+        if package_stamp is None:
+            self.forget(asset_path)
+            return
+        self.entries[asset_path] = ManifestEntry(package_stamp, params_digest)
+        self._dirty = True
+
+    def forget(self, asset_path: str) -> None:
+        if self.entries.pop(asset_path, None) is not None:
+            self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def save(self) -> None:
+        """変更があれば JSON として保存する（一時ファイル経由で置き換え）。"""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": MANIFEST_VERSION,
+            "assets": {
+                k: {"package_stamp": e.package_stamp, "params_hash": e.params_hash}
+                for k, e in sorted(self.entries.items())
+            },
+        }
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1, ensure_ascii=False)
+        os.replace(tmp, self.path)
+        self._dirty = False
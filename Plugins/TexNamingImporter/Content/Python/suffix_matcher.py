@@ -0,0 +1,123 @@
+"""
+サフィックス抽出（collect_suffixes_from_path）と検証（validate_suffixes）を
+1 回の走査で行う事前構築済みマッチャ。
+"""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from validator import SuffixValidationResult
+
+_basename = os.path.basename
+
+
+@dataclass
+class SuffixMatchResult:
+    # 末尾から連続して見つかったサフィックス（左→右の自然順）。該当なしなら空
+    suffixes: List[str]
+    # ファイル名を '_' で分割したトークン全体（サフィックスが無い場合は空）
+    tokens: List[str]
+    # suffix_grid に対する検証結果
+    validation: SuffixValidationResult
+
+
+class SuffixMatcher:
+    """Config.build_suffix_grid() から一度だけ構築して使い回すサフィックス照合器。
+
+    - 抽出は collect_suffixes_from_path と同じく大小文字を区別する（厳密一致）
+    - 行ごとの検証は validate_suffixes と同じく大小文字を無視する
+    - 行ごとの許容キーは小文字化済みの frozenset として保持する
+    """
+
+    def __init__(self, suffix_grid: Sequence[Sequence[str]]):
+        rows = [list(row or []) for row in suffix_grid]
+        self._all_suffixes = frozenset(suf for row in rows for suf in row)
+        self._rows_lower: Tuple[frozenset, ...] = tuple(frozenset(k.lower() for k in row) for row in rows)
+        self._row_previews: Tuple[str, ...] = tuple(self._make_preview(row) for row in rows)
+        self._row_count = len(rows)
+
+    @staticmethod
+    def _make_preview(row: Sequence[str]) -> str:
+        """エラーメッセージ用の許容例（小文字・重複除去・先頭 8 件）。"""
+        lowered = list(dict.fromkeys(k.lower() for k in row))
+        return ", ".join(lowered[:8]) + ("..." if len(lowered) > 8 else "")
+
+    @property
+    def all_suffixes(self) -> frozenset:
+        return self._all_suffixes
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count
+
+    @staticmethod
+    def tokenize(src_path: str) -> List[str]:
+        """パスのファイル名から最後の拡張子を除き、'_' で分割したトークンを返す。"""
+        base = _basename(src_path)
+        dot = base.rfind('.')
+        if dot > 0 and base[0] != '.':
+            stem = base[:dot]
+        else:
+            # 先頭ドットや拡張子なしは os.path.splitext の規則に任せる
+            stem = os.path.splitext(base)[0]
+        tokens = stem.split('_')
+        if '' in tokens:
+            tokens = [t for t in tokens if t != '']
+        return tokens
+
+    def match(self, src_path: str) -> SuffixMatchResult:
+        """
+        ファイル名の末尾から 1 回だけ走査し、サフィックス抽出と行ごとの検証を同時に行う。
+        戻り値の suffixes / tokens / validation は collect_suffixes_from_path と
+        validate_suffixes を順に呼んだ結果と同じ内容になる。
+        """
+        tokens = self.tokenize(src_path) if self._all_suffixes else []
+
+        all_suffixes = self._all_suffixes
+        rows_lower = self._rows_lower
+        last_row = self._row_count - 1
+        collected_rev: List[str] = []
+        failed_row: Optional[int] = None
+        for tok in reversed(tokens):
+            if tok not in all_suffixes:
+                break
+            row = last_row - len(collected_rev)
+            # 右から走査するため、最後に上書きされた行が最も左の不一致行になる
+            if row >= 0 and tok.lower() not in rows_lower[row]:
+                failed_row = row
+            collected_rev.append(tok)
+
+        if not collected_rev:
+            suffixes: List[str] = []
+            tokens = []
+        else:
+            collected_rev.reverse()
+            suffixes = collected_rev
+
+        return SuffixMatchResult(suffixes=suffixes, tokens=tokens, validation=self._build_result(suffixes, failed_row))
+
+    def _build_result(self, suffixes: List[str], failed_row: Optional[int]) -> SuffixValidationResult:
+        if len(suffixes) != self._row_count:
+            return SuffixValidationResult(
+                ok=False,
+                error=f"サフィックス数と規則行数が一致しません。expected={self._row_count}, actual={len(suffixes)}",
+                failed_row_index=None,
+                suffix_list=suffixes,
+            )
+        if failed_row is not None:
+            return SuffixValidationResult(
+                ok=False,
+                error=(
+                    f"行 {failed_row} のサフィックス '{suffixes[failed_row]}' は許容値に含まれていません。"
+                    f"許容例: [{self._row_previews[failed_row]}]"
+                ),
+                failed_row_index=failed_row,
+                suffix_list=suffixes,
+            )
+        return SuffixValidationResult(
+            ok=True,
+            matches_by_row=list(suffixes),
+            suffix_list=suffixes,
+        )
@@ -0,0 +1,78 @@
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+THIS_FILE = Path(__file__).resolve()
+PYTHON_DIR = THIS_FILE.parents[1]
+BENCH_DIR = PYTHON_DIR / "benchmarks"
+if str(BENCH_DIR) not in sys.path:
+    sys.path.insert(0, str(BENCH_DIR))
+
+from bench_gate import (  # noqa: E402
+    StageResult,
+    compare,
+    load_baseline,
+    parse_stage_thresholds,
+    report,
+    save_baseline,
+)
+
+BASELINE = {
+    "suffix_match": StageResult("suffix_match", 10.0, 100000, 3),
+    "apply_e2e": StageResult("apply_e2e", 40.0, 10000, 3),
+}
+
+
+class TestBenchGate(unittest.TestCase):
+    def test_within_threshold_passes(self):
+        comparisons = compare([StageResult("suffix_match", 12.4, 100000)], BASELINE, threshold=0.25)
+        self.assertFalse(comparisons[0].regressed)
+        self.assertAlmostEqual(comparisons[0].ratio, 1.24)
+        self.assertTrue(report(comparisons, io.StringIO()))
+
+    def test_beyond_threshold_fails(self):
+        comparisons = compare([StageResult("suffix_match", 9.0, 100000), StageResult("apply_e2e", 51.0, 10000)],
+                              BASELINE, threshold=0.25)
+        self.assertEqual([c.stage for c in comparisons if c.regressed], ["apply_e2e"])
+        out = io.StringIO()
+        self.assertFalse(report(comparisons, out))
+        self.assertIn("regression in: apply_e2e", out.getvalue())
+
+    def test_stage_threshold_overrides_default(self):
+        current = [StageResult("apply_e2e", 51.0, 10000)]
+        self.assertFalse(compare(current, BASELINE, 0.25, {"apply_e2e": 0.5})[0].regressed)
+        self.assertTrue(compare(current, BASELINE, 0.5, {"apply_e2e": 0.1})[0].regressed)
+
+    def test_stage_without_baseline_is_not_judged(self):
+        comparisons = compare([StageResult("config_load", 1000.0, 200)], BASELINE)
+        self.assertIsNone(comparisons[0].ratio)
+        self.assertFalse(comparisons[0].regressed)
+        self.assertTrue(report(comparisons, io.StringIO()))
+
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "sub" / "baselines.json"
+            save_baseline(list(BASELINE.values()), path)
+            self.assertEqual(load_baseline(path), BASELINE)
+
+            path.write_text(json.dumps({"version": 99, "stages": {}}), encoding="utf-8")
+            with self.assertRaises(ValueError):
+                load_baseline(path)
+
+    def test_invalid_thresholds(self):
+        self.assertEqual(parse_stage_thresholds(["apply_e2e=0.5"]), {"apply_e2e": 0.5})
+        with self.assertRaises(ValueError):
+            parse_stage_thresholds(["apply_e2e"])
+        with self.assertRaises(ValueError):
+            compare([], BASELINE, threshold=-0.1)
+
+    def test_shipped_baseline_is_loadable(self):
+        baseline = load_baseline(BENCH_DIR / "baselines.json")
+        self.assertTrue({"config_load", "suffix_match", "param_resolve", "apply_e2e"} <= set(baseline))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,11 @@
 import json
+import os
+import shutil
+import tempfile
 import unittest
 from pathlib import Path
 
-from config import Config
+from config import CompiledConfig, Config, clear_config_cache, load_compiled_config
 
 
 class TestConfig(unittest.TestCase):
@@ -28,5 +31,48 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(expected, actual)
 
 
+class TestCompiledConfigCache(unittest.TestCase):
+    """Unit tests for load_compiled_config() / CompiledConfig"""
+
+    def setUp(self):
+        clear_config_cache()
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.config_path = self.tmp_dir / "Config.json"
+        asset_path = Path(__file__).resolve().parent / "assets" / "Config.json"
+        shutil.copyfile(asset_path, self.config_path)
+
+    def tearDown(self):
+        clear_config_cache()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_compiled_grid_and_suffixes(self):
+        compiled = load_compiled_config(self.config_path)
+        self.assertIsInstance(compiled, CompiledConfig)
+        self.assertEqual(
+            [list(row) for row in compiled.suffix_grid],
+            compiled.config.build_suffix_grid(),
+        )
+        self.assertIn("col", compiled.all_suffixes)
+        self.assertIn("ww", compiled.all_suffixes)
+
+    def test_same_object_while_file_unchanged(self):
+        first = load_compiled_config(self.config_path)
+        second = load_compiled_config(str(self.config_path))
+        self.assertIs(first, second)
+
+    def test_invalidated_when_file_changes(self):
+        first = load_compiled_config(self.config_path)
+        data = json.loads(self.config_path.read_text(encoding="utf-8"))
+        data["run_dir"] = ["/Game/Changed"]
+        self.config_path.write_text(json.dumps(data), encoding="utf-8")
+        # mtime の分解能が粗い環境でも確実に変化させる
+        st = os.stat(self.config_path)
+        os.utime(self.config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        second = load_compiled_config(self.config_path)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.config.run_dir, ["/Game/Changed"])
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
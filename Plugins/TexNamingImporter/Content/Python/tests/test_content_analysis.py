@@ -0,0 +1,116 @@
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+THIS_FILE = Path(__file__).resolve()
+PYTHON_DIR = THIS_FILE.parents[1]
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+import unreal_stub  # noqa: E402
+
+unreal = unreal_stub.install()
+
+import content_analysis  # noqa: E402
+from config import CompiledConfig, Config, ResolvedTextureParams  # noqa: E402
+from content_analysis import ContentStats, analyze_tiles, recommend  # noqa: E402
+from texture_configurator import apply_texture_property_from_config  # noqa: E402
+from type_define import CompressionKind, SRGBMode  # noqa: E402
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+BC7_SRGB = ResolvedTextureParams(compression=CompressionKind.BC7, srgb=SRGBMode.ON)
+
+
+def _stats(**kw):
+    base = dict(channels=4, grayscale=False, alpha_unused=False, alpha_constant=None,
+                normal_map_like=False, hdr=False, max_value=1.0)
+    base.update(kw)
+    return ContentStats(**base)
+
+
+class TestRecommend(unittest.TestCase):
+    def test_grayscale_opaque_content(self):
+        rec = recommend(_stats(grayscale=True, alpha_unused=True), BC7_SRGB)
+        self.assertEqual((rec.compression, rec.srgb), (CompressionKind.GRAYSCALE, SRGBMode.ON))
+
+    def test_unused_alpha_drops_to_default(self):
+        rec = recommend(_stats(alpha_unused=True, alpha_constant=1.0), BC7_SRGB)
+        self.assertEqual(rec.compression, CompressionKind.DEFAULT)
+
+    def test_normal_and_hdr_turn_srgb_off(self):
+        self.assertEqual(recommend(_stats(normal_map_like=True), BC7_SRGB).compression, CompressionKind.NORMAL_MAP)
+        rec = recommend(_stats(hdr=True, max_value=4.0), BC7_SRGB)
+        self.assertEqual((rec.compression, rec.srgb), (CompressionKind.HDR, SRGBMode.OFF))
+
+    def test_no_recommendation_when_setting_already_fits(self):
+        self.assertIsNone(recommend(_stats(), BC7_SRGB))
+        masks = ResolvedTextureParams(compression=CompressionKind.MASKS, srgb=SRGBMode.OFF)
+        self.assertIsNone(recommend(_stats(grayscale=True, alpha_unused=True), masks))
+        normal = ResolvedTextureParams(compression=CompressionKind.NORMAL_MAP, srgb=SRGBMode.OFF)
+        self.assertIsNone(recommend(_stats(normal_map_like=True), normal))
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+class TestAnalyzeTiles(unittest.TestCase):
+    def test_detects_grayscale_and_opaque_alpha(self):
+        import numpy as np
+
+        gray = np.linspace(0.0, 1.0, 64, dtype=np.float32).reshape(8, 8)
+        tile = np.dstack([gray, gray, gray, np.ones_like(gray)])
+        stats = analyze_tiles([tile, tile])
+        self.assertTrue(stats.grayscale)
+        self.assertTrue(stats.alpha_unused)
+        self.assertEqual(stats.alpha_constant, 1.0)
+        self.assertFalse(stats.hdr)
+
+    def test_detects_normal_map_and_hdr(self):
+        import numpy as np
+
+        flat = np.tile(np.array([0.5, 0.5, 1.0], dtype=np.float32), (4, 4, 1))
+        self.assertTrue(analyze_tiles([flat]).normal_map_like)
+        self.assertTrue(analyze_tiles([flat * 3.0]).hdr)
+
+
+class TestApplyWithAnalysis(unittest.TestCase):
+    TEX = "/Game/VFX/T_A_col_cc.T_A_col_cc"
+
+    def setUp(self):
+        unreal_stub.install([self.TEX])
+        self.base = Config.load(THIS_FILE.parent / "assets" / "Config.json").to_dict()
+
+    def _run(self, mode, **analyze_image):
+        compiled = CompiledConfig.compile(Config.from_dict(dict(self.base, content_analysis=mode)))
+        analyze_image = analyze_image or {"return_value": _stats(grayscale=True, alpha_unused=True)}
+        with mock.patch.object(content_analysis, "is_available", return_value=True), \
+                mock.patch.object(content_analysis, "analyze_image", **analyze_image), \
+                mock.patch("detail_unreal.texture_configurator_unreal.get_source_file_path",
+                           return_value="D:/Art/T_A_col_cc.png"):
+            apply_texture_property_from_config([self.TEX], compiled)
+        return unreal.stub_assets[self.TEX].compression_settings
+
+    def test_recommend_mode_keeps_suffix_setting(self):
+        self.assertEqual(self._run("recommend"), unreal.TextureCompressionSettings.TC_BC7)
+
+    def test_apply_mode_uses_recommendation(self):
+        self.assertEqual(self._run("apply"), unreal.TextureCompressionSettings.TC_GRAYSCALE)
+
+    def test_analysis_failure_does_not_abort_apply(self):
+        self.assertEqual(self._run("apply", side_effect=MemoryError()), unreal.TextureCompressionSettings.TC_BC7)
+
+    def test_unreadable_source_is_skipped(self):
+        for error in (MemoryError(), RuntimeError("decompression bomb")):
+            with self.subTest(error=type(error).__name__), \
+                    mock.patch.object(content_analysis, "is_available", return_value=True), \
+                    mock.patch.object(content_analysis, "iter_image_tiles", side_effect=error):
+                self.assertIsNone(content_analysis.analyze_image("D:/Art/T_A_col_cc.png"))
+
+    def test_invalid_mode_rejected(self):
+        with self.assertRaises(ValueError):
+            Config.from_dict(dict(self.base, content_analysis="always"))
+
+
+if __name__ == "__main__":
+    unittest.main()
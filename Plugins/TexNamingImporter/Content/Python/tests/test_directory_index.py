@@ -0,0 +1,95 @@
+import sys
+import unittest
+from pathlib import Path
+
+THIS_FILE = Path(__file__).resolve()
+PYTHON_DIR = THIS_FILE.parents[1]
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+from config import CompiledConfig, Config  # noqa: E402
+from directory_index import PathTrie, RunDirIndex  # noqa: E402
+from type_define import CompressionKind  # noqa: E402
+
+
+class TestPathTrie(unittest.TestCase):
+    def test_iter_prefixes_shallow_to_deep(self):
+        trie = PathTrie()
+        trie.insert("/Game/UI/", "ui")
+        trie.insert("/Game", "game")
+        trie.insert("/Game/UI/Icons", "icons")
+        found = trie.iter_prefixes("/Game/UI/Icons/Small")
+        self.assertEqual(found, [("/Game", "game"), ("/Game/UI", "ui"), ("/Game/UI/Icons", "icons")])
+        self.assertEqual(len(trie), 3)
+
+    def test_sibling_with_common_prefix_does_not_match(self):
+        trie = PathTrie()
+        trie.insert("/Game/VFX", True)
+        self.assertFalse(trie.has_prefix_of("/Game/VFX2"))
+        self.assertTrue(trie.has_prefix_of("/Game/VFX/Sub"))
+        self.assertEqual(trie.iter_prefixes("/Game"), [])
+
+
+class TestRunDirIndex(unittest.TestCase):
+    def test_contains_matches_validate_directory_rules(self):
+        index = RunDirIndex(["/Game/VFX", " /Game/Debug/ "])
+        self.assertTrue(index.contains("/Game/VFX/T_Fire.T_Fire"))
+        self.assertTrue(index.contains("/Game/Debug/Sub/T_A"))
+        self.assertFalse(index.contains("/Game/T_Root.T_Root"))
+        self.assertFalse(index.contains("/Game/VFXExtra/T_A"))
+        self.assertFalse(index.contains(""))
+
+    def test_empty_index(self):
+        self.assertFalse(RunDirIndex([]).contains("/Game/VFX/T_A"))
+
+
+class TestDirectoryOverrides(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.base = Config.load(THIS_FILE.parent / "assets" / "Config.json").to_dict()
+
+    def _compile(self, overrides):
+        data = dict(self.base, directory_overrides=overrides)
+        return CompiledConfig.compile(Config.from_dict(data))
+
+    def test_nested_overrides_apply_in_depth_order(self):
+        compiled = self._compile({
+            "/Game/UI": {"texture_config": {"col": {"compression": "EDITOR_ICON", "max_in_game": 512}}},
+            "/Game/UI/Icons/": {"texture_config": {"col": {"max_in_game": 128}}},
+        })
+        icons = compiled.for_asset("/Game/UI/Icons/T_Icon_col_cc.T_Icon_col_cc")
+        col = icons.config.texture_config["col"]
+        self.assertEqual(col.compression, CompressionKind.EDITOR_ICON)
+        self.assertEqual(col.max_in_game, 128)
+        self.assertEqual(icons.param_resolver.resolve(["col", "cc"]).max_in_game, 128)
+
+        # 上書き対象外のディレクトリ・タイプは元の設定のまま
+        self.assertIs(compiled.for_asset("/Game/VFX/T_Fire_col_cc"), compiled)
+        self.assertEqual(compiled.config.texture_config["col"].max_in_game, 1024)
+        self.assertEqual(icons.config.texture_config["nml"], compiled.config.texture_config["nml"])
+
+    def test_effective_config_is_cached(self):
+        compiled = self._compile({"/Game/UI": {"subuv_max_in_game": 256}})
+        first = compiled.for_asset("/Game/UI/A/T_A_col_cc")
+        self.assertIs(compiled.for_asset("/Game/UI/A/T_B_col_cc"), first)
+        # 同じ上書きの組み合わせになる別ディレクトリも同じインスタンスを共有する
+        self.assertIs(compiled.for_asset("/Game/UI/B/T_C_col_cc"), first)
+        self.assertEqual(first.config.subuv_max_in_game, 256)
+        self.assertIs(first.suffix_matcher, compiled.suffix_matcher)
+
+    def test_round_trip(self):
+        overrides = {"/Game/UI": {"texture_config": {"col": {"srgb": "OFF"}}}}
+        cfg = self._compile(overrides).config
+        self.assertEqual(Config.from_dict(cfg.to_dict()).directory_overrides, overrides)
+
+    def test_invalid_overrides_rejected(self):
+        with self.assertRaises(ValueError):
+            self._compile({"/Game/UI": {"run_dir": ["/Game"]}})
+        with self.assertRaises(ValueError):
+            self._compile({"/Game/UI": {"texture_config": {"unknown": {"srgb": "OFF"}}}})
+        with self.assertRaises(ValueError):
+            self._compile({"/Game/UI": {"texture_config": {"col": {"compression": "NOPE"}}}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import contextlib
+import io
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+THIS_FILE = Path(__file__).resolve()
+PYTHON_DIR = THIS_FILE.parents[1]
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+import unreal_stub  # noqa: E402
+
+unreal = unreal_stub.install()
+
+from config import CompiledConfig, Config  # noqa: E402
+from error_report import ErrorReport  # noqa: E402
+from texture_configurator import apply_texture_property_from_config  # noqa: E402
+from texture_directory_configurator import run_directory  # noqa: E402
+
+TEX_OK = "/Game/VFX/T_A_col_cc.T_A_col_cc"
+BAD_NAMES = [f"/Game/VFX/T_Bad{i}_col.T_Bad{i}_col" for i in range(5)]
+TEX_MISSING = "/Game/VFX/T_Missing_col_cc.T_Missing_col_cc"
+
+
+class TestErrorReport(unittest.TestCase):
+    def test_summary_truncates_and_counts(self):
+        report = ErrorReport()
+        for i in range(25):
+            report.add("suffix_error", f"/Game/T{i}", f"bad {i}\nsecond line")
+        report.add("import_failed", "/Game/X", "boom")
+        summary = report.format_summary(max_entries=20)
+        self.assertIn("26 件", summary)
+        self.assertIn("サフィックスエラー: 25", summary)
+        self.assertIn("... 他 6 件", summary)
+        self.assertNotIn("second line", summary)
+
+    def test_write_json(self):
+        tmp = Path(tempfile.mkdtemp())
+        try:
+            report = ErrorReport()
+            report.add("import_exception", "/Game/X", "Exception: boom", "Traceback ...")
+            report.write(tmp / "sub" / "errors.json")
+            data = json.loads((tmp / "sub" / "errors.json").read_text(encoding="utf-8"))
+            self.assertEqual(data["counts"], {"import_exception": 1})
+            self.assertEqual(data["errors"][0]["detail"], "Traceback ...")
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+class TestSingleSummaryDialog(unittest.TestCase):
+    def setUp(self):
+        unreal_stub.install([TEX_OK] + BAD_NAMES)
+        self.compiled = CompiledConfig.compile(Config.load(THIS_FILE.parent / "assets" / "Config.json"))
+
+    def test_batch_shows_one_dialog(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            apply_texture_property_from_config(
+                [TEX_OK, TEX_MISSING] + BAD_NAMES, self.compiled, show_dialog_on_error=True
+            )
+        self.assertEqual(len(unreal.stub_dialogs), 1)
+        self.assertIn("6 件", unreal.stub_dialogs[0])
+
+    def test_suffix_errors_are_deleted_in_one_call(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            apply_texture_property_from_config([TEX_OK] + BAD_NAMES, self.compiled, delete_on_suffix_error=True)
+        self.assertEqual(unreal.stub_delete_calls, [BAD_NAMES])
+        self.assertEqual(list(unreal.stub_assets), [TEX_OK])
+
+    def test_directory_run_collects_without_dialogs(self):
+        report = ErrorReport()
+        with contextlib.redirect_stdout(io.StringIO()):
+            run_directory(
+                [TEX_OK] + BAD_NAMES, self.compiled, chunk_size=2, show_dialog_on_error=True, error_report=report
+            )
+        self.assertEqual(unreal.stub_dialogs, [])
+        self.assertEqual(report.counts_by_kind(), {"suffix_error": 5})
+
+
+if __name__ == "__main__":
+    unittest.main()
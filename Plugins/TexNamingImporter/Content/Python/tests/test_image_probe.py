@@ -0,0 +1,170 @@
+import json
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+THIS_FILE = Path(__file__).resolve()
+PYTHON_DIR = THIS_FILE.parents[1]
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+import unreal_stub  # noqa: E402
+
+unreal = unreal_stub.install()
+
+from detail_unreal.texture_configurator_unreal import get_source_file_path  # noqa: E402
+from image_probe import ImageInfo, ImageProbeError, probe_bytes, probe_image, try_probe_image  # noqa: E402
+
+
+def _png_chunk(chunk_type: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I", len(payload)) + chunk_type + payload + b"\0\0\0\0"
+
+
+def make_png(width, height, bit_depth=8, color_type=6, trns=False) -> bytes:
+    data = b"\x89PNG\r\n\x1a\n" + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, bit_depth, color_type, 0, 0, 0))
+    if trns:
+        data += _png_chunk(b"tRNS", b"\0")
+    return data + _png_chunk(b"IDAT", b"\0" * 16) + _png_chunk(b"IEND", b"")
+
+
+def make_tga(width, height, pixel_bits=32, alpha_bits=8, image_type=2) -> bytes:
+    return struct.pack("<BBBHHBHHHHBB", 0, 0, image_type, 0, 0, 0, 0, 0, width, height, pixel_bits, alpha_bits) + b"\0" * 8
+
+
+def make_exr(width, height, channels=(("B", 1), ("G", 1), ("R", 1))) -> bytes:
+    def attr(name, type_name, value):
+        return name.encode() + b"\0" + type_name.encode() + b"\0" + struct.pack("<i", len(value)) + value
+
+    chlist = b"".join(n.encode() + b"\0" + struct.pack("<iB3xii", t, 0, 1, 1) for n, t in channels) + b"\0"
+    header = attr("channels", "chlist", chlist)
+    header += attr("compression", "compression", b"\x03")
+    header += attr("dataWindow", "box2i", struct.pack("<iiii", 0, 0, width - 1, height - 1))
+    return b"\x76\x2f\x31\x01" + struct.pack("<I", 2) + header + b"\0"
+
+
+def make_dds(width, height, four_cc=b"DXT5", dxgi=None, rgb_masks=None) -> bytes:
+    header = bytearray(128)
+    header[0:4] = b"DDS "
+    struct.pack_into("<IIII", header, 4, 124, 0x1007, height, width)
+    if rgb_masks is not None:
+        flags, bit_count, masks = rgb_masks
+        struct.pack_into("<II4sIIIII", header, 76, 32, flags, b"\0\0\0\0", bit_count, *masks)
+    else:
+        struct.pack_into("<II4s", header, 76, 32, 0x4, four_cc)
+    data = bytes(header)
+    if dxgi is not None:
+        data += struct.pack("<IIIII", dxgi, 3, 0, 1, 0)
+    return data
+
+
+def make_psd(width, height, channels=4, depth=8, mode=3) -> bytes:
+    return b"8BPS" + struct.pack(">H6xHIIHH", 1, channels, height, width, depth, mode) + b"\0" * 8
+
+
+class TestProbeFormats(unittest.TestCase):
+    def test_png(self):
+        self.assertEqual(probe_bytes(make_png(512, 256)), ImageInfo("png", 512, 256, 8, 4, True))
+        gray16 = probe_bytes(make_png(64, 64, bit_depth=16, color_type=0))
+        self.assertEqual((gray16.bit_depth, gray16.channels, gray16.has_alpha), (16, 1, False))
+
+    def test_png_palette_with_transparency(self):
+        info = probe_bytes(make_png(32, 32, bit_depth=4, color_type=3, trns=True))
+        self.assertEqual((info.bit_depth, info.channels, info.has_alpha), (8, 4, True))
+
+    def test_tga_needs_extension(self):
+        data = make_tga(1024, 512)
+        self.assertEqual(probe_bytes(data, ".TGA"), ImageInfo("tga", 1024, 512, 8, 4, True))
+        self.assertFalse(probe_bytes(make_tga(8, 8, pixel_bits=24, alpha_bits=0), "tga").has_alpha)
+        self.assertEqual(probe_bytes(make_tga(8, 8, pixel_bits=8, alpha_bits=0, image_type=11), "tga").channels, 1)
+        with self.assertRaises(ImageProbeError):
+            probe_bytes(data, ".bin")
+
+    def test_exr(self):
+        info = probe_bytes(make_exr(2048, 1024, (("A", 1), ("B", 1), ("G", 1), ("R", 2))))
+        self.assertEqual(info, ImageInfo("exr", 2048, 1024, 32, 4, True))
+
+    def test_dds(self):
+        self.assertEqual(probe_bytes(make_dds(256, 128)), ImageInfo("dds", 256, 128, 8, 4, True))
+        bc5 = probe_bytes(make_dds(64, 64, four_cc=b"DX10", dxgi=83))
+        self.assertEqual((bc5.channels, bc5.has_alpha), (2, False))
+        rgba = probe_bytes(make_dds(16, 16, rgb_masks=(0x41, 32, (0xFF0000, 0xFF00, 0xFF, 0xFF000000))))
+        self.assertEqual((rgba.bit_depth, rgba.channels, rgba.has_alpha), (8, 4, True))
+
+    def test_psd(self):
+        self.assertEqual(probe_bytes(make_psd(300, 200)), ImageInfo("psd", 300, 200, 8, 4, True))
+        gray = probe_bytes(make_psd(300, 200, channels=1, depth=16, mode=1))
+        self.assertEqual((gray.bit_depth, gray.channels, gray.has_alpha), (16, 1, False))
+
+    def test_truncated_header(self):
+        with self.assertRaises(ImageProbeError):
+            probe_bytes(make_png(8, 8)[:20])
+
+    def test_exr_with_bad_attribute_size(self):
+        prefix = b"\x76\x2f\x31\x01" + struct.pack("<I", 2) + b"foo\0int\0"
+        for size in (-12, 4096):
+            with self.subTest(size=size), self.assertRaises(ImageProbeError):
+                probe_bytes(prefix + struct.pack("<i", size) + b"\0" * 8)
+        with self.assertRaises(ImageProbeError):
+            probe_bytes(make_exr(64, 64)[:40])
+
+
+class TestProbeFiles(unittest.TestCase):
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def test_probe_image_reads_through_mmap(self):
+        path = self.dir / "T_Fire_col_cc.png"
+        path.write_bytes(make_png(300, 100, color_type=2) + b"\0" * 100000)
+        info = probe_image(path)
+        self.assertEqual((info.width, info.height, info.channels), (300, 100, 3))
+        self.assertFalse(info.is_pow2)
+        self.assertEqual(info.max_dimension, 300)
+
+    def test_try_probe_image_returns_none(self):
+        empty = self.dir / "empty.png"
+        empty.write_bytes(b"")
+        self.assertIsNone(try_probe_image(empty))
+        self.assertIsNone(try_probe_image(self.dir / "missing.png"))
+
+
+class TestSourceFileFromImportData(unittest.TestCase):
+    TEX = "/Game/VFX/T_A_col_cc.T_A_col_cc"
+
+    def setUp(self):
+        unreal_stub.install([self.TEX])
+        self.dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def _set_import_data(self, filename):
+        tag = json.dumps([{"RelativeFilename": filename, "Timestamp": "0", "FileMD5": ""}])
+        unreal.stub_assets[self.TEX].asset_tags["AssetImportData"] = tag
+
+    def test_absolute_source_is_probed_without_loading(self):
+        source = self.dir / "T_A_col_cc.tga"
+        source.write_bytes(make_tga(128, 64))
+        self._set_import_data(str(source))
+        self.assertEqual(get_source_file_path(self.TEX), os.path.normpath(str(source)))
+        self.assertEqual(try_probe_image(get_source_file_path(self.TEX)), ImageInfo("tga", 128, 64, 8, 4, True))
+        self.assertEqual(unreal.stub_loaded, [])
+
+    def test_relative_source_resolves_from_package_dir(self):
+        self._set_import_data("../../Source/T_A_col_cc.png")
+        expected = os.path.normpath(os.path.join(unreal.stub_content_dir, "VFX", "../../Source/T_A_col_cc.png"))
+        self.assertEqual(get_source_file_path(self.TEX), expected)
+
+    def test_missing_import_data(self):
+        self.assertIsNone(get_source_file_path(self.TEX))
+        self.assertIsNone(get_source_file_path("/Game/VFX/T_Missing.T_Missing"))
+
+
+if __name__ == "__main__":
+    unittest.main()
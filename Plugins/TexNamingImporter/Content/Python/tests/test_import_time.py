@@ -0,0 +1,79 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+THIS_FILE = Path(__file__).resolve()
+PYTHON_DIR = THIS_FILE.parents[1]
+
+# 名前の検証・設定の解決だけを行う最下層（画像・unreal・CLI を含まない）
+PURE_MODULES = (
+    "type_define",
+    "config",
+    "validator",
+    "path_utils.path_functions",
+    "directory_index",
+    "suffix_matcher",
+    "token_rules",
+)
+# unreal を必要としない層。エディタ外のツール・ワーカープロセス・テストから import される
+CORE_MODULES = (
+    "type_define",
+    "config",
+    "validator",
+    "path_utils.path_functions",
+    "directory_index",
+    "image_probe",
+    "memory_estimator",
+    "content_analysis",
+    "texture_configurator",
+    "texture_directory_configurator",
+    "texture_naming_audit",
+)
+# 上限（ミリ秒）。実測（最下層 30〜40ms、全体 55〜70ms）の数倍に抑え、import 時の処理の追加を検出する。
+# 遅い CI では環境変数 TEXNAMING_IMPORT_BUDGET_MS で両方の上限をまとめて緩められる
+_BUDGET_OVERRIDE = os.environ.get("TEXNAMING_IMPORT_BUDGET_MS")
+PURE_IMPORT_BUDGET_MS = float(_BUDGET_OVERRIDE or 150)
+IMPORT_BUDGET_MS = float(_BUDGET_OVERRIDE or 250)
+
+_PROBE = """
+import json, sys, time
+sys.path.insert(0, sys.argv[1])
+start = time.perf_counter()
+for name in sys.argv[2:]:
+    __import__(name)
+elapsed = (time.perf_counter() - start) * 1000.0
+print(json.dumps({"ms": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def _import_in_subprocess(*modules):
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE, str(PYTHON_DIR), *modules],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(proc.stdout)
+
+
+class TestImportWithoutUnreal(unittest.TestCase):
+    def test_core_modules_import_without_unreal(self):
+        result = _import_in_subprocess(*CORE_MODULES)
+        loaded = set(result["modules"])
+        self.assertNotIn("unreal", loaded)
+        self.assertNotIn("detail_unreal.texture_configurator_unreal", loaded)
+        self.assertNotIn("numpy", loaded)
+        self.assertLess(result["ms"], IMPORT_BUDGET_MS)
+
+    def test_pure_layer_import_budget(self):
+        result = _import_in_subprocess(*PURE_MODULES)
+        self.assertLess(result["ms"], PURE_IMPORT_BUDGET_MS)
+
+    def test_audit_does_not_load_multiprocessing(self):
+        loaded = set(_import_in_subprocess("texture_naming_audit")["modules"])
+        self.assertNotIn("concurrent.futures.process", loaded)
+
+
+if __name__ == "__main__":
+    unittest.main()
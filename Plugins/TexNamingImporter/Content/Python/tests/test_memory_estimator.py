@@ -0,0 +1,193 @@
+import contextlib
+import io
+import json
+import shutil
+import struct
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+THIS_FILE = Path(__file__).resolve()
+PYTHON_DIR = THIS_FILE.parents[1]
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+import unreal_stub  # noqa: E402
+
+unreal = unreal_stub.install()
+
+from budget_overrides import BudgetOverrides  # noqa: E402
+from config import CompiledConfig, Config, ResolvedTextureParams  # noqa: E402
+from error_report import ErrorReport  # noqa: E402
+from texture_logging import get_verbosity, set_verbosity  # noqa: E402
+from memory_estimator import (  # noqa: E402
+    MIB,
+    MemoryReport,
+    effective_max_texture_size,
+    estimate_texture,
+    plan_budget_reductions,
+)
+from texture_configurator import apply_texture_property_from_config  # noqa: E402
+from texture_directory_configurator import (  # noqa: E402
+    enforce_memory_budgets,
+    estimate_directory_memory,
+    main,
+    run_directory,
+)
+from type_define import CompressionKind, MipGenKind, TextureGroupKind  # noqa: E402
+
+BC7 = ResolvedTextureParams(compression=CompressionKind.BC7, max_in_game=0, texture_group=TextureGroupKind.EFFECTS)
+
+
+class TestEstimate(unittest.TestCase):
+    def test_full_mip_chain(self):
+        e = estimate_texture("/Game/T", BC7, 1024, 1024)
+        self.assertEqual(e.mip_count, 11)
+        # 4x4 ブロック 16 バイト。1x1〜2x2 のミップも 1 ブロックに切り上げ
+        expected = sum(max(1, (1024 >> i) // 4) ** 2 * 16 for i in range(11))
+        self.assertEqual(e.bytes, expected)
+
+    def test_max_in_game_drops_top_mips(self):
+        e = estimate_texture("/Game/T", BC7.replace(max_in_game=1000, enforce_pow2=True), 4096, 2048)
+        self.assertEqual((e.width, e.height), (512, 256))
+        self.assertEqual(effective_max_texture_size(1000, True), 512)
+        self.assertEqual(effective_max_texture_size(8, False), 16)
+
+    def test_uncompressed_non_pow2_and_no_mips(self):
+        hdr = ResolvedTextureParams(compression=CompressionKind.HDR)
+        self.assertEqual(estimate_texture("/Game/T", hdr, 300, 200).bytes, 300 * 200 * 8)
+        no_mips = BC7.replace(mip_gen=MipGenKind.NO_MIPMAPS)
+        self.assertEqual(estimate_texture("/Game/T", no_mips, 256, 256).bytes, 256 * 256)
+
+    def test_default_compression_depends_on_alpha(self):
+        default = ResolvedTextureParams(compression=CompressionKind.DEFAULT, mip_gen=MipGenKind.NO_MIPMAPS)
+        opaque = estimate_texture("/Game/T", default, 256, 256)
+        alpha = estimate_texture("/Game/T", default, 256, 256, has_alpha=True)
+        self.assertEqual(alpha.bytes, opaque.bytes * 2)
+
+
+class TestBudgets(unittest.TestCase):
+    def _report(self):
+        return MemoryReport([
+            estimate_texture("/Game/VFX/T_Big", BC7, 4096, 4096, texture_type="col", run_dir="/Game/VFX"),
+            estimate_texture("/Game/VFX/T_Mid", BC7, 2048, 2048, texture_type="msk", run_dir="/Game/VFX"),
+            estimate_texture("/Game/UI/T_Icon", BC7.replace(texture_group=TextureGroupKind.UI), 256, 256,
+                             texture_type="col", run_dir="/Game/UI"),
+        ])
+
+    def test_aggregates(self):
+        report = self._report()
+        self.assertEqual(list(report.by_group()), ["EFFECTS", "UI"])
+        self.assertEqual(report.by_run_dir()["/Game/UI"], report.estimates["/Game/UI/T_Icon"].bytes)
+        self.assertEqual(sum(report.by_texture_type().values()), report.total_bytes)
+
+    def test_plan_lowers_largest_first(self):
+        report = self._report()
+        budgets = {TextureGroupKind.EFFECTS: 12 * MIB}
+        self.assertEqual(len(report.check_budgets(budgets)), 1)
+        reductions = plan_budget_reductions(report, budgets)
+        self.assertEqual(reductions, {"/Game/VFX/T_Big": 2048})
+        self.assertLessEqual(report.by_group()["EFFECTS"], 12 * MIB)
+        self.assertEqual(report.check_budgets(budgets), [])
+
+    def test_plan_stops_at_min_size(self):
+        report = self._report()
+        reductions = plan_budget_reductions(report, {TextureGroupKind.EFFECTS: 1}, min_size=1024)
+        self.assertEqual(reductions, {"/Game/VFX/T_Big": 1024, "/Game/VFX/T_Mid": 1024})
+
+    def test_config_budgets(self):
+        base = Config.load(THIS_FILE.parent / "assets" / "Config.json").to_dict()
+        cfg = Config.from_dict(dict(base, texture_group_budgets={"EFFECTS": 64}, budget_action="lower"))
+        self.assertEqual(cfg.texture_group_budget_bytes(), {TextureGroupKind.EFFECTS: 64 * MIB})
+        self.assertEqual(Config.from_dict(cfg.to_dict()).texture_group_budgets, cfg.texture_group_budgets)
+        with self.assertRaises(ValueError):
+            Config.from_dict(dict(base, texture_group_budgets={"NOPE": 64}))
+        with self.assertRaises(ValueError):
+            Config.from_dict(dict(base, texture_group_budgets={"EFFECTS": -1}))
+        with self.assertRaises(ValueError):
+            Config.from_dict(dict(base, budget_action="delete"))
+
+
+class TestDirectoryBudget(unittest.TestCase):
+    TEX_BIG = "/Game/VFX/T_Big_col_cc.T_Big_col_cc"
+    TEX_SMALL = "/Game/VFX/T_Small_col_cc.T_Small_col_cc"
+
+    def setUp(self):
+        unreal_stub.install([self.TEX_BIG, self.TEX_SMALL])
+        self.dir = Path(tempfile.mkdtemp())
+        for tex, size in ((self.TEX_BIG, 1024), (self.TEX_SMALL, 256)):
+            source = self.dir / (tex.rsplit(".", 1)[1] + ".png")
+            source.write_bytes(b"\x89PNG\r\n\x1a\n" + struct.pack(">I4sIIBBBBB", 13, b"IHDR", size, size, 8, 2, 0, 0, 0))
+            tag = json.dumps([{"RelativeFilename": str(source)}])
+            unreal.stub_assets[tex].asset_tags["AssetImportData"] = tag
+        base = Config.load(THIS_FILE.parent / "assets" / "Config.json").to_dict()
+        self.config = Config.from_dict(dict(base, texture_group_budgets={"EFFECTS": 1}, budget_action="lower"))
+        self._saved_dir = unreal.stub_saved_dir
+        unreal.stub_saved_dir = str(self.dir / "Saved")
+
+    def tearDown(self):
+        unreal.stub_saved_dir = self._saved_dir
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def test_estimate_and_lower_over_budget(self):
+        compiled = CompiledConfig.compile(self.config)
+        report = estimate_directory_memory([self.TEX_BIG, self.TEX_SMALL], compiled)
+        big = report.estimates[self.TEX_BIG]
+        self.assertEqual((big.width, big.run_dir, big.texture_type), (1024, "/Game/VFX", "col"))
+        self.assertEqual(unreal.stub_loaded, [])
+
+        errors = ErrorReport()
+        overrides = enforce_memory_budgets(report, self.config, errors)
+        self.assertEqual(overrides, {self.TEX_BIG: 512})
+        self.assertEqual(errors.counts_by_kind(), {"memory_budget": 1})
+
+        run_directory([self.TEX_BIG, self.TEX_SMALL], compiled, max_in_game_overrides=overrides)
+        self.assertEqual(unreal.stub_assets[self.TEX_BIG].max_texture_size, 512)
+        self.assertEqual(unreal.stub_assets[self.TEX_SMALL].max_texture_size, 1024)
+
+    def test_warn_only_returns_no_overrides(self):
+        config = Config.from_dict(dict(self.config.to_dict(), budget_action="warn"))
+        report = estimate_directory_memory([self.TEX_BIG, self.TEX_SMALL], CompiledConfig.compile(config))
+        self.assertEqual(enforce_memory_budgets(report, config), {})
+
+    def test_reductions_survive_later_imports(self):
+        config_path = self.dir / "Config.json"
+        self.config.save(config_path)
+        self.addCleanup(set_verbosity, get_verbosity())
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(main([str(config_path), "/Game/VFX", "-qq"]), 0)
+        self.assertEqual(unreal.stub_assets[self.TEX_BIG].max_texture_size, 512)
+        store = BudgetOverrides.load(self.dir / "Saved" / "TexNamingImporter" / "budget_overrides.json")
+        self.assertEqual(store.sizes, {self.TEX_BIG: 512})
+
+        # インポート時の configure_many と同じ経路（上書きの指定なし）でも縮小が維持される
+        unreal_stub.install([self.TEX_BIG])
+        apply_texture_property_from_config([self.TEX_BIG], CompiledConfig.compile(self.config))
+        self.assertEqual(unreal.stub_assets[self.TEX_BIG].max_texture_size, 512)
+
+        warn = Config.from_dict(dict(self.config.to_dict(), budget_action="warn"))
+        apply_texture_property_from_config([self.TEX_BIG], CompiledConfig.compile(warn))
+        self.assertEqual(unreal.stub_assets[self.TEX_BIG].max_texture_size, 1024)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(main([str(config_path), "/Game/Empty", "-qq", "--reset-budget-overrides"]), 0)
+        self.assertEqual(len(BudgetOverrides.load(store.path)), 0)
+
+
+class TestBudgetOverrides(unittest.TestCase):
+    def test_merge_keeps_smallest_and_round_trips(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "budget_overrides.json"
+            store = BudgetOverrides(path)
+            self.assertEqual(store.merge({"/Game/A": 512, "/Game/B": 256}), 2)
+            self.assertEqual(store.merge({"/Game/A": 1024, "/Game/B": 128}), 1)
+            store.save()
+            self.assertEqual(BudgetOverrides.load(path).sizes, {"/Game/A": 512, "/Game/B": 128})
+
+            path.write_text('{"version": 99}', encoding="utf-8")
+            self.assertEqual(len(BudgetOverrides.load(path)), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import sys
+import unittest
+from pathlib import Path
+
+THIS_FILE = Path(__file__).resolve()
+PYTHON_DIR = THIS_FILE.parents[1]
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+import pickle  # noqa: E402
+
+from config import (  # noqa: E402
+    CompiledConfig,
+    Config,
+    ResolvedTextureParams,
+    TextureConfigParams,
+    override_address_uv,
+    override_subuv_max_in_game,
+)
+from type_define import AddressMode, CompressionKind  # noqa: E402
+
+
+class TestParamResolver(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.asset_path = THIS_FILE.parent / "assets" / "Config.json"
+
+    def setUp(self):
+        self.compiled = CompiledConfig.compile(Config.load(self.asset_path))
+        self.resolver = self.compiled.param_resolver
+
+    def test_resolves_type_and_address(self):
+        resolved = self.resolver.resolve(["col", "cm"])
+        self.assertIsInstance(resolved, ResolvedTextureParams)
+        self.assertEqual(resolved.compression, CompressionKind.BC7)
+        self.assertEqual((resolved.address_u, resolved.address_v), (AddressMode.CLAMP, AddressMode.MIRROR))
+        self.assertEqual(resolved.max_in_game, 1024)
+
+    def test_memoized_per_combination(self):
+        first = self.resolver.resolve(["col", "cc"])
+        second = self.resolver.resolve(("col", "cc"))
+        self.assertIs(first, second)
+        self.resolver.resolve(["col", "cc"], True)
+        self.resolver.resolve(["nml", "cc"])
+        self.assertEqual(len(self.resolver), 3)
+
+    def test_subuv_override_only_with_flag(self):
+        subuv = self.resolver.resolve(["col", "ww"], True)
+        normal = self.resolver.resolve(["col", "ww"], False)
+        self.assertEqual(subuv.max_in_game, 2048)
+        self.assertEqual(normal.max_in_game, 1024)
+
+    def test_shared_config_is_not_modified(self):
+        self.resolver.resolve(["col", "mm"], True)
+        col = self.compiled.config.texture_config["col"]
+        self.assertEqual((col.address_u, col.address_v), (AddressMode.WRAP, AddressMode.WRAP))
+        self.assertEqual(col.max_in_game, 1024)
+
+    def test_resolved_params_are_frozen(self):
+        resolved = self.resolver.resolve(["col", "cc"])
+        with self.assertRaises(Exception):
+            resolved.max_in_game = 16
+
+
+class TestImmutableParams(unittest.TestCase):
+    def test_override_returns_copy_of_config_params(self):
+        shared = TextureConfigParams(address_u=AddressMode.WRAP, address_v=AddressMode.WRAP, max_in_game=1024)
+        overridden = override_address_uv(shared, AddressMode.CLAMP, AddressMode.MIRROR)
+        overridden = override_subuv_max_in_game(overridden, 2048)
+        self.assertIsNot(overridden, shared)
+        self.assertIsInstance(overridden, TextureConfigParams)
+        self.assertEqual((shared.address_u, shared.address_v, shared.max_in_game), (AddressMode.WRAP, AddressMode.WRAP, 1024))
+        self.assertEqual(
+            (overridden.address_u, overridden.address_v, overridden.max_in_game),
+            (AddressMode.CLAMP, AddressMode.MIRROR, 2048),
+        )
+
+    def test_override_resolved_params(self):
+        base = ResolvedTextureParams(address_u=AddressMode.WRAP, address_v=AddressMode.WRAP, max_in_game=1024)
+        overridden = override_subuv_max_in_game(override_address_uv(base, AddressMode.CLAMP, AddressMode.CLAMP), 256)
+        self.assertIsInstance(overridden, ResolvedTextureParams)
+        self.assertEqual(base.max_in_game, 1024)
+        self.assertEqual(overridden.max_in_game, 256)
+        self.assertEqual(overridden.address_u, AddressMode.CLAMP)
+
+    def test_slots_and_immutability(self):
+        params = ResolvedTextureParams(compression=CompressionKind.BC7)
+        with self.assertRaises(AttributeError):
+            params.compression = CompressionKind.HDR
+        with self.assertRaises(AttributeError):
+            params.new_attr = 1
+        self.assertFalse(hasattr(params, "__dict__"))
+
+    def test_equality_hash_and_pickle(self):
+        a = ResolvedTextureParams(max_in_game=512, compression=CompressionKind.MASKS)
+        b = ResolvedTextureParams.from_params(a.to_config_params())
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(pickle.loads(pickle.dumps(a)), a)
+        self.assertNotEqual(a, a.replace(max_in_game=256))
+
+    def test_batch_does_not_leak_subuv_size(self):
+        # SubUV の上書きが同じ種類の後続テクスチャへ漏れないこと（Config を再読み込みせずに共有）
+        compiled = CompiledConfig.compile(Config.load(THIS_FILE.parent / "assets" / "Config.json"))
+        resolver = compiled.param_resolver
+        self.assertEqual(resolver.resolve(["msk", "cc"], True).max_in_game, 2048)
+        self.assertEqual(resolver.resolve(["msk", "ww"], False).max_in_game, 1024)
+        self.assertEqual(compiled.config.texture_config["msk"].max_in_game, 1024)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import contextlib
+import io
+import sys
+import unittest
+from pathlib import Path
+
+THIS_FILE = Path(__file__).resolve()
+PYTHON_DIR = THIS_FILE.parents[1]
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+import unreal_stub  # noqa: E402
+
+unreal = unreal_stub.install()
+
+import stage_timer  # noqa: E402
+from config import CompiledConfig, Config  # noqa: E402
+from stage_timer import StageTimer  # noqa: E402
+from texture_configurator import apply_texture_property_from_config  # noqa: E402
+
+TEX_A = "/Game/VFX/T_A_col_cc.T_A_col_cc"
+TEX_B = "/Game/VFX/T_B_msk_ww.T_B_msk_ww"
+
+
+class TestStageTimer(unittest.TestCase):
+    def test_disabled_records_nothing(self):
+        timer = StageTimer()
+        with timer.span("load", "a"):
+            pass
+        timer.record("load", 1.0, "a")
+        self.assertEqual(timer.report(), {"stages": {}, "items": {}})
+
+    def test_aggregate_percentiles(self):
+        timer = StageTimer(enabled=True)
+        for i in range(1, 101):
+            timer.record("apply", i / 1000.0, f"tex{i}")
+        stats = timer.report()["stages"]["apply"]
+        self.assertEqual(stats["count"], 100)
+        self.assertAlmostEqual(stats["p50_ms"], 50.0)
+        self.assertAlmostEqual(stats["p95_ms"], 95.0)
+        self.assertAlmostEqual(stats["max_ms"], 100.0)
+        self.assertAlmostEqual(timer.report()["items"]["tex7"]["apply"], 7.0)
+
+
+class TestPipelineInstrumentation(unittest.TestCase):
+    def setUp(self):
+        unreal_stub.install([TEX_A, TEX_B])
+        stage_timer.enable()
+
+    def tearDown(self):
+        stage_timer.disable()
+
+    def test_stages_are_recorded_per_texture(self):
+        compiled = CompiledConfig.compile(Config.load(THIS_FILE.parent / "assets" / "Config.json"))
+        with contextlib.redirect_stdout(io.StringIO()):
+            apply_texture_property_from_config([TEX_A, TEX_B], compiled)
+        report = stage_timer.report()
+        for stage in ("suffix_match", "resolve", "load", "apply", "save"):
+            self.assertIn(stage, report["stages"])
+        self.assertEqual(report["stages"]["load"]["count"], 2)
+        self.assertEqual(set(report["items"][TEX_A]), {"suffix_match", "resolve", "load", "apply"})
+
+
+if __name__ == "__main__":
+    unittest.main()
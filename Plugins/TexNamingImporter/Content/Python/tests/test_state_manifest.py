@@ -0,0 +1,120 @@
+import contextlib
+import io
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+THIS_FILE = Path(__file__).resolve()
+PYTHON_DIR = THIS_FILE.parents[1]
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+import unreal_stub  # noqa: E402
+
+unreal = unreal_stub.install()
+
+from config import CompiledConfig, Config, ResolvedTextureParams  # noqa: E402
+from error_report import ErrorReport  # noqa: E402
+import texture_logging  # noqa: E402
+from state_manifest import StateManifest, params_hash  # noqa: E402
+from texture_configurator import apply_texture_property_from_config  # noqa: E402
+from type_define import CompressionKind  # noqa: E402
+
+
+class TestStateManifest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.path = self.tmp_dir / "Saved" / "manifest.json"
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_round_trip(self):
+        manifest = StateManifest.load(self.path)
+        self.assertEqual(len(manifest), 0)
+        manifest.record("/Game/VFX/T_A.T_A", "1:10", "abc")
+        manifest.save()
+
+        loaded = StateManifest.load(self.path)
+        self.assertTrue(loaded.is_up_to_date("/Game/VFX/T_A.T_A", "1:10", "abc"))
+        self.assertFalse(loaded.is_up_to_date("/Game/VFX/T_A.T_A", "2:10", "abc"))
+        self.assertFalse(loaded.is_up_to_date("/Game/VFX/T_A.T_A", "1:10", "def"))
+        self.assertFalse(loaded.is_up_to_date("/Game/VFX/T_B.T_B", "1:10", "abc"))
+        self.assertFalse(loaded.is_up_to_date("/Game/VFX/T_A.T_A", None, "abc"))
+
+    def test_corrupt_file_starts_empty(self):
+        self.path.parent.mkdir(parents=True)
+        self.path.write_text("{not json", encoding="utf-8")
+        self.assertEqual(len(StateManifest.load(self.path)), 0)
+
+    def test_params_hash_is_stable_and_content_based(self):
+        a = ResolvedTextureParams(max_in_game=1024, compression=CompressionKind.BC7)
+        b = ResolvedTextureParams(max_in_game=1024, compression=CompressionKind.BC7)
+        self.assertEqual(params_hash(a), params_hash(b))
+        self.assertNotEqual(params_hash(a), params_hash(a.replace(max_in_game=512)))
+
+
+class TestIncrementalApply(unittest.TestCase):
+    TEX_A = "/Game/VFX/T_A_col_cc.T_A_col_cc"
+    TEX_B = "/Game/VFX/T_B_msk_ww.T_B_msk_ww"
+
+    def setUp(self):
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        unreal_stub.install([self.TEX_A, self.TEX_B])
+        unreal.stub_content_dir = str(self.tmp_dir / "Content")
+        for tex in (self.TEX_A, self.TEX_B):
+            package_file = self.tmp_dir / "Content" / (tex.split(".", 1)[0][len("/Game/"):] + ".uasset")
+            package_file.parent.mkdir(parents=True, exist_ok=True)
+            package_file.write_bytes(b"uasset")
+        self.compiled = CompiledConfig.compile(Config.load(THIS_FILE.parent / "assets" / "Config.json"))
+        self.manifest_path = self.tmp_dir / "manifest.json"
+        # スキップ行はテクスチャごとの詳細（DEBUG）として出力される
+        self._level = texture_logging.get_verbosity()
+        texture_logging.set_verbosity("DEBUG")
+
+    def tearDown(self):
+        texture_logging.set_verbosity(self._level)
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _run(self):
+        manifest = StateManifest.load(self.manifest_path)
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            apply_texture_property_from_config([self.TEX_A, self.TEX_B], self.compiled, manifest=manifest)
+        manifest.save()
+        return out.getvalue()
+
+    def test_second_run_skips_unchanged_assets(self):
+        self._run()
+        self.assertEqual(len(StateManifest.load(self.manifest_path)), 2)
+
+        out = self._run()
+        self.assertIn(f"Skip (up to date): {self.TEX_A}", out)
+        self.assertIn(f"Skip (up to date): {self.TEX_B}", out)
+
+    def test_changed_package_is_reprocessed(self):
+        self._run()
+        package_file = self.tmp_dir / "Content" / "VFX" / "T_B_msk_ww.uasset"
+        package_file.write_bytes(b"uasset-reimported")
+
+        out = self._run()
+        self.assertIn(f"Skip (up to date): {self.TEX_A}", out)
+        self.assertNotIn(f"Skip (up to date): {self.TEX_B}", out)
+
+    def test_unsaved_textures_are_not_recorded(self):
+        errors = ErrorReport()
+        manifest = StateManifest.load(self.manifest_path)
+        with mock.patch.object(unreal.EditorAssetLibrary, "save_loaded_assets", return_value=False), \
+                contextlib.redirect_stdout(io.StringIO()):
+            apply_texture_property_from_config([self.TEX_A, self.TEX_B], self.compiled, manifest=manifest,
+                                               error_report=errors)
+        # 反映はエディタ上に残っているが、ディスクに無いので次回も処理する
+        self.assertEqual(unreal.stub_assets[self.TEX_A].compression_settings, unreal.TextureCompressionSettings.TC_BC7)
+        self.assertEqual(len(manifest), 0)
+        self.assertEqual(errors.counts_by_kind(), {"save_failed": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
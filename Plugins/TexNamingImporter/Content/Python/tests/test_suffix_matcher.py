@@ -0,0 +1,74 @@
+import sys
+import unittest
+from pathlib import Path
+
+THIS_FILE = Path(__file__).resolve()
+PYTHON_DIR = THIS_FILE.parents[1]
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+from path_utils.path_functions import collect_suffixes_from_path  # noqa: E402
+from suffix_matcher import SuffixMatcher  # noqa: E402
+from validator import validate_suffixes  # noqa: E402
+
+SUFFIX_GRID = [
+    ["col", "msk", "nml", "mat", "cub", "flw"],
+    ["cc", "cw", "cm", "wc", "ww", "wm", "mc", "mw", "mm"],
+]
+
+
+class TestSuffixMatcher(unittest.TestCase):
+    def setUp(self):
+        self.matcher = SuffixMatcher(SUFFIX_GRID)
+        self.all_suffixes = [suf for row in SUFFIX_GRID for suf in row]
+
+    def test_same_result_as_collect_and_validate(self):
+        # 従来の collect_suffixes_from_path + validate_suffixes と同じ結果になること
+        cases = [
+            "/Game/VFX/T_Fire_col_ww.T_Fire_col_ww",
+            "/Game/VFX/T_Fire_4x4_msk_cc.T_Fire_4x4_msk_cc",
+            "/Game/VFX/T_Fire_ww_col.T_Fire_ww_col",        # 行の順序違い
+            "/Game/VFX/T_Fire_col.T_Fire_col",              # 数不足
+            "/Game/VFX/T_Fire_col_nml_ww.T_Fire_col_nml_ww",  # 数超過
+            "/Game/VFX/T_Fire_01.T_Fire_01",                # サフィックスなし
+            "/home/dev/tex/Rock_nml_msk.png",
+            "/home/dev/textures/CharacterHair_cc_BAD_msk.tga",
+            "T_col_ww",
+            "",
+        ]
+        for path in cases:
+            with self.subTest(path=path):
+                suffixes, tokens = collect_suffixes_from_path(path, self.all_suffixes)
+                expected = validate_suffixes(suffixes, SUFFIX_GRID)
+                result = self.matcher.match(path)
+                self.assertEqual(result.suffixes, suffixes)
+                self.assertEqual(result.tokens, tokens)
+                self.assertEqual(result.validation.ok, expected.ok)
+                self.assertEqual(result.validation.failed_row_index, expected.failed_row_index)
+                self.assertEqual(result.validation.matches_by_row, expected.matches_by_row)
+
+    def test_leftmost_failed_row_is_reported(self):
+        result = self.matcher.match("/Game/VFX/T_Fire_ww_col.T_Fire_ww_col")
+        self.assertFalse(result.validation.ok)
+        self.assertEqual(result.validation.failed_row_index, 0)
+        self.assertIn("'ww'", result.validation.error)
+
+    def test_validation_is_case_insensitive_per_row(self):
+        # 抽出は厳密一致、行ごとの検証は大小無視
+        matcher = SuffixMatcher([["col", "COL"], ["ww"]])
+        result = matcher.match("/Game/VFX/T_Fire_COL_ww.T_Fire_COL_ww")
+        self.assertTrue(result.validation.ok)
+        self.assertEqual(result.suffixes, ["COL", "ww"])
+
+        result = self.matcher.match("/Game/VFX/T_Fire_COL_ww.T_Fire_COL_ww")
+        self.assertEqual(result.suffixes, ["ww"])
+        self.assertFalse(result.validation.ok)
+
+    def test_tokens_returned_on_success(self):
+        result = self.matcher.match("/Game/VFX/T_Smoke_8x8_col_cc.T_Smoke_8x8_col_cc")
+        self.assertTrue(result.validation.ok)
+        self.assertEqual(result.tokens, ["T", "Smoke", "8x8", "col", "cc"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import contextlib
+import io
+import sys
+import unittest
+from pathlib import Path
+
+THIS_FILE = Path(__file__).resolve()
+PYTHON_DIR = THIS_FILE.parents[1]
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+import unreal_stub  # noqa: E402
+
+unreal = unreal_stub.install()
+
+import texture_configurator_service  # noqa: E402
+
+CONFIG_PATH = THIS_FILE.parent / "assets" / "Config.json"
+TEX_A = "/Game/VFX/T_A_col_cc.T_A_col_cc"
+TEX_B = "/Game/VFX/T_B_msk_ww.T_B_msk_ww"
+
+
+class TestConfigureMany(unittest.TestCase):
+    def setUp(self):
+        unreal_stub.install([TEX_A, TEX_B])
+
+    def test_batch_is_saved_once(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            ret = texture_configurator_service.configure_many([TEX_A, TEX_B, TEX_A], config_path=CONFIG_PATH)
+        self.assertEqual(ret, 0)
+        self.assertEqual(unreal.stub_save_calls, [[TEX_A, TEX_B]])
+
+    def test_missing_config_path(self):
+        texture_configurator_service.set_default_config_path(None)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(texture_configurator_service.configure_many([TEX_A]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
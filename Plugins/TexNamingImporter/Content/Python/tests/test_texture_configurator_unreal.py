@@ -0,0 +1,152 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+THIS_FILE = Path(__file__).resolve()
+PYTHON_DIR = THIS_FILE.parents[1]
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+import unreal_stub  # noqa: E402
+
+unreal = unreal_stub.install()
+
+from config import ResolvedTextureParams  # noqa: E402
+from detail_unreal.texture_configurator_unreal import TextureConfigurator, delete_texture_assets  # noqa: E402
+from type_define import AddressMode, CompressionKind, SRGBMode, TextureGroupKind  # noqa: E402
+
+TEX_A = "/Game/VFX/T_A_col_cc.T_A_col_cc"
+TEX_B = "/Game/VFX/T_B_msk_ww.T_B_msk_ww"
+TEX_MISSING = "/Game/VFX/T_Missing_col_cc.T_Missing_col_cc"
+
+PARAMS = ResolvedTextureParams(
+    address_u=AddressMode.CLAMP,
+    address_v=AddressMode.CLAMP,
+    max_in_game=1024,
+    enforce_pow2=True,
+    compression=CompressionKind.BC7,
+    srgb=SRGBMode.ON,
+    texture_group=TextureGroupKind.EFFECTS,
+)
+
+
+class TestApplyMany(unittest.TestCase):
+    def setUp(self):
+        unreal_stub.install([TEX_A, TEX_B])
+
+    def test_single_bulk_save(self):
+        reports = TextureConfigurator.apply_many([(TEX_A, PARAMS), (TEX_B, PARAMS)])
+        self.assertTrue(all(r["ok"] for r in reports.values()))
+        self.assertEqual(unreal.stub_save_calls, [[TEX_A, TEX_B]])
+        tex = unreal.stub_assets[TEX_A]
+        self.assertEqual(tex.address_x, unreal.TextureAddress.TA_CLAMP)
+        self.assertEqual(tex.compression_settings, unreal.TextureCompressionSettings.TC_BC7)
+        self.assertEqual(tex.get_editor_property("LODGroup"), unreal.TextureGroup.TEXTUREGROUP_EFFECTS)
+
+    def test_failed_asset_does_not_block_others(self):
+        reports = TextureConfigurator.apply_many([(TEX_MISSING, PARAMS), (TEX_A, PARAMS)])
+        self.assertFalse(reports[TEX_MISSING]["ok"])
+        self.assertIn("exception", reports[TEX_MISSING])
+        self.assertTrue(reports[TEX_A]["ok"])
+        self.assertEqual(unreal.stub_save_calls, [[TEX_A]])
+
+    def test_per_asset_rollback(self):
+        class _BrokenGroupTexture(unreal.Texture2D):
+            def set_editor_property(self, name, value):
+                if name == "LODGroup":
+                    raise RuntimeError("LODGroup is read-only")
+                super().set_editor_property(name, value)
+
+        unreal.stub_assets[TEX_B] = _BrokenGroupTexture(TEX_B)
+        reports = TextureConfigurator.apply_many([(TEX_A, PARAMS), (TEX_B, PARAMS)])
+        self.assertTrue(reports[TEX_A]["ok"])
+        self.assertFalse(reports[TEX_B]["ok"])
+        self.assertEqual(reports[TEX_B]["applied"], [])
+        # 失敗したテクスチャだけが元の値に戻る
+        self.assertEqual(unreal.stub_assets[TEX_B].address_x, unreal.TextureAddress.TA_WRAP)
+        self.assertEqual(unreal.stub_assets[TEX_A].address_x, unreal.TextureAddress.TA_CLAMP)
+        self.assertEqual(unreal.stub_save_calls, [[TEX_A]])
+
+    def test_failed_save_is_reported_as_unsaved(self):
+        with mock.patch.object(unreal.EditorAssetLibrary, "save_loaded_assets", return_value=False):
+            reports = TextureConfigurator.apply_many([(TEX_A, PARAMS)])
+        report = reports[TEX_A]
+        # 変更はエディタ上に残る（ロールバックしない）ため ok のまま、未保存として報告する
+        self.assertTrue(report["ok"])
+        self.assertTrue(report["unsaved"])
+        self.assertIn("save: save_loaded_assets failed", report["errors"])
+        self.assertEqual(unreal.stub_assets[TEX_A].address_x, unreal.TextureAddress.TA_CLAMP)
+
+
+class TestSkipNoOpWrites(unittest.TestCase):
+    def setUp(self):
+        unreal_stub.install([TEX_A, TEX_B])
+
+    def test_second_apply_is_unchanged(self):
+        first = TextureConfigurator(params=PARAMS).apply(TEX_A)
+        self.assertTrue(first["ok"])
+        self.assertFalse(first["unchanged"])
+        texture = unreal.stub_assets[TEX_A]
+        modify_count = texture.modify_count
+
+        second = TextureConfigurator(params=PARAMS).apply(TEX_A)
+        self.assertTrue(second["ok"])
+        self.assertTrue(second["unchanged"])
+        self.assertEqual(second["applied"], [])
+        self.assertEqual(texture.modify_count, modify_count)
+        self.assertEqual(unreal.stub_saved, [TEX_A])
+
+    def test_only_differing_properties_are_written(self):
+        TextureConfigurator.apply_many([(TEX_A, PARAMS)])
+        changed = PARAMS.replace(compression=CompressionKind.MASKS, srgb=SRGBMode.OFF)
+        reports = TextureConfigurator.apply_many([(TEX_A, changed), (TEX_B, PARAMS)])
+        self.assertEqual(reports[TEX_A]["applied"], ["compression", "srgb"])
+        self.assertFalse(reports[TEX_A]["unchanged"])
+        self.assertEqual(unreal.stub_save_calls[-1], [TEX_A, TEX_B])
+
+    def test_conformant_batch_is_not_saved(self):
+        TextureConfigurator.apply_many([(TEX_A, PARAMS), (TEX_B, PARAMS)])
+        save_calls = len(unreal.stub_save_calls)
+        reports = TextureConfigurator.apply_many([(TEX_A, PARAMS), (TEX_B, PARAMS)])
+        self.assertTrue(all(r["unchanged"] for r in reports.values()))
+        self.assertEqual(len(unreal.stub_save_calls), save_calls)
+
+    def test_dirty_conformant_import_is_still_saved(self):
+        TextureConfigurator.apply_many([(TEX_A, PARAMS), (TEX_B, PARAMS)])
+        # 再インポート直後: 値は既に目標どおりだがパッケージは未保存
+        unreal.stub_assets[TEX_A].stub_dirty = True
+        reports = TextureConfigurator.apply_many([(TEX_A, PARAMS), (TEX_B, PARAMS)])
+        self.assertTrue(all(r["ok"] and r["unchanged"] for r in reports.values()))
+        self.assertEqual(unreal.stub_save_calls[-1], [TEX_A])
+        self.assertFalse(unreal.stub_assets[TEX_A].stub_dirty)
+
+        unreal.stub_assets[TEX_B].stub_dirty = True
+        self.assertTrue(TextureConfigurator(params=PARAMS).apply(TEX_B)["unchanged"])
+        self.assertEqual(unreal.stub_saved[-1], TEX_B)
+        self.assertFalse(unreal.stub_assets[TEX_B].stub_dirty)
+
+
+class TestBulkDelete(unittest.TestCase):
+    BAD = [f"/Game/VFX/T_Bad{i}_col.T_Bad{i}_col" for i in range(3)]
+
+    def setUp(self):
+        unreal_stub.install(self.BAD)
+
+    def test_single_bulk_delete_with_per_asset_results(self):
+        results = delete_texture_assets(self.BAD + [TEX_MISSING])
+        self.assertEqual(unreal.stub_delete_calls, [self.BAD])
+        self.assertEqual(results, {**{p: True for p in self.BAD}, TEX_MISSING: False})
+        self.assertEqual(unreal.stub_assets, {})
+
+    def test_assets_left_by_bulk_delete_are_reported(self):
+        unreal.stub_undeletable.add(self.BAD[1])
+        results = delete_texture_assets(self.BAD)
+        self.assertTrue(results[self.BAD[0]])
+        self.assertFalse(results[self.BAD[1]])
+        self.assertTrue(results[self.BAD[2]])
+        self.assertIn(self.BAD[1], unreal.stub_assets)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+import contextlib
+import io
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+THIS_FILE = Path(__file__).resolve()
+PYTHON_DIR = THIS_FILE.parents[1]
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+import unreal_stub  # noqa: E402
+
+unreal = unreal_stub.install()
+
+from config import CompiledConfig, Config  # noqa: E402
+from texture_directory_configurator import (  # noqa: E402
+    TimeSlicedDirectoryRun,
+    build_parser,
+    cancel_time_sliced_runs,
+    iter_chunks,
+    iter_texture_asset_paths,
+    main,
+    run_directory,
+    select_textures_by_name,
+    start_time_sliced_run,
+)
+
+OK_VFX = "/Game/VFX/T_A_col_cc.T_A_col_cc"
+BAD_VFX = "/Game/VFX/T_B_col.T_B_col"
+OK_OTHER = "/Game/Props/T_C_col_cc.T_C_col_cc"
+
+
+class TestSelectTexturesByName(unittest.TestCase):
+    def setUp(self):
+        unreal_stub.install([OK_VFX, BAD_VFX, OK_OTHER])
+        config = Config.load(THIS_FILE.parent / "assets" / "Config.json")
+        self.compiled = CompiledConfig.compile(config)
+
+    def test_partition_without_loading(self):
+        selection = select_textures_by_name([OK_VFX, BAD_VFX, OK_OTHER], self.compiled)
+        self.assertEqual(selection.targets, [OK_VFX])
+        self.assertEqual([p for p, _ in selection.suffix_errors], [BAD_VFX])
+        self.assertEqual(selection.outside_run_dir, [OK_OTHER])
+        self.assertEqual(unreal.stub_loaded, [])
+
+    def test_ignore_run_dir(self):
+        selection = select_textures_by_name([OK_VFX, OK_OTHER], self.compiled, check_run_dir=False)
+        self.assertEqual(selection.targets, [OK_VFX, OK_OTHER])
+        self.assertEqual(selection.outside_run_dir, [])
+
+
+class TestStreamingPipeline(unittest.TestCase):
+    PATHS = [f"/Game/VFX/Sub{i % 3}/T_N{i:03d}_col_cc.T_N{i:03d}_col_cc" for i in range(10)]
+
+    def setUp(self):
+        unreal_stub.install(self.PATHS + [OK_OTHER])
+        self.compiled = CompiledConfig.compile(Config.load(THIS_FILE.parent / "assets" / "Config.json"))
+
+    def test_iter_texture_asset_paths_is_lazy_and_complete(self):
+        gen = iter_texture_asset_paths("/Game/VFX")
+        self.assertEqual(next(gen), "/Game/VFX/Sub0/T_N000_col_cc.T_N000_col_cc")
+        self.assertEqual(sorted([self.PATHS[0]] + list(gen)), sorted(self.PATHS))
+        self.assertEqual(list(iter_texture_asset_paths("/Game/VFX", recursive=False)), [])
+
+    def test_iter_chunks(self):
+        self.assertEqual(list(iter_chunks(range(5), 2)), [[0, 1], [2, 3], [4]])
+        with self.assertRaises(ValueError):
+            list(iter_chunks([], 0))
+
+    def test_run_directory_in_chunks(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            summary = run_directory(iter_texture_asset_paths("/Game"), self.compiled, chunk_size=4)
+        self.assertEqual(summary.found, 11)
+        self.assertEqual(summary.chunks, 3)
+        self.assertEqual(summary.configured, 10)
+        self.assertEqual(summary.outside_run_dir, 1)
+        self.assertEqual(len(unreal.stub_save_calls), 3)
+
+    def test_cancel_between_chunks(self):
+        consumed = []
+
+        def source():
+            for p in self.PATHS:
+                consumed.append(p)
+                yield p
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            summary = run_directory(source(), self.compiled, chunk_size=4, should_cancel=lambda: len(consumed) > 4)
+        self.assertTrue(summary.cancelled)
+        self.assertEqual(summary.chunks, 1)
+        self.assertEqual(summary.configured, 4)
+
+
+class TestTimeSlicedRun(unittest.TestCase):
+    PATHS = [f"/Game/VFX/T_N{i:03d}_col_cc.T_N{i:03d}_col_cc" for i in range(10)]
+
+    def setUp(self):
+        unreal_stub.install(self.PATHS)
+        self.compiled = CompiledConfig.compile(Config.load(THIS_FILE.parent / "assets" / "Config.json"))
+        self.finished = []
+
+    def _start(self, **kwargs):
+        kwargs.setdefault("progress", "none")
+        return start_time_sliced_run(self.PATHS, self.compiled, on_finished=self.finished.append, **kwargs)
+
+    def _tick_until_done(self, run, limit=100):
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(limit):
+                if run.finished:
+                    break
+                unreal.stub_tick()
+
+    def test_processes_one_slice_per_tick(self):
+        run = self._start()
+        self.assertEqual(unreal.stub_loaded, [])  # nothing runs until the editor ticks
+        run.seconds_per_texture = 0.004  # 8 ms budget -> 2 textures per frame
+        self.assertEqual(run.next_slice_size(), 2)
+        with contextlib.redirect_stdout(io.StringIO()):
+            unreal.stub_tick()
+        self.assertEqual(run.summary.found, 2)
+        self.assertEqual(len(unreal.stub_save_calls), 1)
+
+        self._tick_until_done(run)
+        self.assertEqual(self.finished, [run.summary])
+        self.assertEqual(run.summary.configured, 10)
+        self.assertFalse(run.summary.cancelled)
+        self.assertEqual(unreal.stub_tick_callbacks, {})
+
+    def test_slice_size_follows_budget(self):
+        run = TimeSlicedDirectoryRun(self.PATHS, self.compiled, frame_budget_ms=8, max_slice_size=50)
+        run.seconds_per_texture = 0.0001
+        self.assertEqual(run.next_slice_size(), 50)
+        run.seconds_per_texture = 1.0
+        self.assertEqual(run.next_slice_size(), 1)
+        with self.assertRaises(ValueError):
+            TimeSlicedDirectoryRun(self.PATHS, self.compiled, frame_budget_ms=0)
+
+    def test_cancel_between_slices(self):
+        run = self._start(max_slice_size=3)
+        with contextlib.redirect_stdout(io.StringIO()):
+            unreal.stub_tick()
+            self.assertEqual(cancel_time_sliced_runs(), 1)
+            unreal.stub_tick()
+        self.assertTrue(run.finished)
+        self.assertTrue(run.summary.cancelled)
+        self.assertEqual(run.summary.found, 3)
+        self.assertEqual(self.finished, [run.summary])
+        self.assertEqual(unreal.stub_tick_callbacks, {})
+
+    def test_progress_dialog_mode_is_rejected(self):
+        # A ScopedSlowTask spanning frames would make the editor modal for the whole run
+        with self.assertRaises(ValueError):
+            TimeSlicedDirectoryRun(self.PATHS, self.compiled, progress="dialog")
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            build_parser().parse_args(["Config.json", "/Game/VFX", "--background", "--progress-dialog"])
+
+    def test_background_rejects_jobs(self):
+        with contextlib.redirect_stderr(io.StringIO()) as err, self.assertRaises(SystemExit):
+            main(["Config.json", "/Game/VFX", "--background", "--jobs", "4"])
+        self.assertIn("--jobs cannot be combined with --background", err.getvalue())
+
+    def test_error_stops_the_run(self):
+        run = self._start()
+        with mock.patch("texture_directory_configurator._process_chunk", side_effect=RuntimeError("boom")):
+            with contextlib.redirect_stdout(io.StringIO()):
+                unreal.stub_tick()
+        self.assertTrue(run.finished)
+        self.assertTrue(run.summary.cancelled)
+        self.assertEqual(unreal.stub_tick_callbacks, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
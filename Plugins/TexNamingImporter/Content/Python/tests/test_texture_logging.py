@@ -0,0 +1,132 @@
+import contextlib
+import io
+import logging
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+THIS_FILE = Path(__file__).resolve()
+PYTHON_DIR = THIS_FILE.parents[1]
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+import unreal_stub  # noqa: E402
+
+unreal = unreal_stub.install()
+
+import texture_logging  # noqa: E402
+from config import CompiledConfig, Config  # noqa: E402
+from texture_configurator import apply_texture_property_from_config  # noqa: E402
+from texture_logging import BatchBufferHandler, get_logger, log_batch  # noqa: E402
+
+TEX_A = "/Game/VFX/T_A_col_cc.T_A_col_cc"
+TEX_BAD = "/Game/VFX/T_Bad_col.T_Bad_col"
+
+
+class _CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+
+class TestBatchBufferHandler(unittest.TestCase):
+    def setUp(self):
+        self.stream = _CountingStream()
+        self.handler = BatchBufferHandler(self.stream, capacity=3)
+        self.logger = logging.getLogger("test_texture_logging")
+        self.logger.addHandler(self.handler)
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+
+    def tearDown(self):
+        self.logger.removeHandler(self.handler)
+
+    def test_unbatched_records_are_written_immediately(self):
+        self.logger.info("one")
+        self.assertEqual(self.stream.getvalue(), "one\n")
+
+    def test_batch_flushes_once_or_at_capacity(self):
+        self.handler.batch_depth += 1
+        self.logger.info("a")
+        self.logger.info("b")
+        self.assertEqual(self.stream.writes, 0)
+        self.logger.info("c")
+        self.assertEqual(self.stream.writes, 1)
+        self.logger.info("d")
+        self.handler.batch_depth -= 1
+        self.handler.flush()
+        self.assertEqual(self.stream.getvalue(), "a\nb\nc\nd\n")
+        self.assertEqual(self.stream.writes, 2)
+
+    def test_warnings_and_errors_go_to_error_sink_in_order(self):
+        errors = io.StringIO()
+        handler = BatchBufferHandler(self.stream, error_stream=errors)
+        self.logger.removeHandler(self.handler)
+        self.logger.addHandler(handler)
+        try:
+            handler.batch_depth += 1
+            self.logger.info("a")
+            self.logger.error("broken")
+            self.logger.info("b")
+            handler.batch_depth -= 1
+            handler.flush()
+        finally:
+            self.logger.removeHandler(handler)
+        self.assertEqual(self.stream.getvalue(), "a\nb\n")
+        self.assertEqual(errors.getvalue(), "broken\n")
+
+    def test_errors_use_unreal_severity_when_loaded(self):
+        with mock.patch.object(unreal, "log_error") as log_error, mock.patch.object(unreal, "log_warning") as log_warning:
+            self.logger.error("broken")
+            self.logger.warning("odd")
+        log_error.assert_called_once_with("broken")
+        log_warning.assert_called_once_with("odd")
+        self.assertEqual(self.stream.getvalue(), "")
+
+
+class TestConfiguratorLogging(unittest.TestCase):
+    def setUp(self):
+        unreal_stub.install([TEX_A, TEX_BAD])
+        self.compiled = CompiledConfig.compile(Config.load(THIS_FILE.parent / "assets" / "Config.json"))
+        self._level = texture_logging.get_verbosity()
+
+    def tearDown(self):
+        texture_logging.set_verbosity(self._level)
+
+    def _run(self):
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            apply_texture_property_from_config([TEX_A, TEX_BAD], self.compiled)
+        return out.getvalue().splitlines()
+
+    def test_default_is_summary_and_problems_only(self):
+        texture_logging.set_verbosity("INFO")
+        lines = self._run()
+        self.assertEqual(len(lines), 1)
+        self.assertIn("1 applied", lines[0])
+        # 警告は stdout ではなく unreal.log_warning へ渡る（Output Log の重大度を保つ）
+        self.assertEqual(len(unreal.stub_logs), 1)
+        self.assertIn("Suffix Error", unreal.stub_logs[0])
+
+    def test_debug_includes_per_texture_detail(self):
+        texture_logging.set_verbosity("DEBUG")
+        lines = self._run()
+        self.assertTrue(any(f"---import begin  {TEX_A} ---" in line for line in lines))
+
+    def test_nested_batches_flush_at_outermost(self):
+        texture_logging.set_verbosity("INFO")
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            with log_batch():
+                get_logger("nested").info("first")
+                with log_batch():
+                    get_logger("nested").info("second")
+                self.assertEqual(out.getvalue(), "")
+        self.assertEqual(out.getvalue().splitlines(), ["[INFO] first", "[INFO] second"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import io
+import json
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+THIS_FILE = Path(__file__).resolve()
+PYTHON_DIR = THIS_FILE.parents[1]
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+from texture_naming_audit import audit_paths, iter_source_files, write_report  # noqa: E402
+
+CONFIG_PATH = THIS_FILE.parent / "assets" / "Config.json"
+
+
+class TestTextureNamingAudit(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        for rel in ("a/T_Fire_col_ww.png", "a/T_Smoke_8x8_msk_cc.TGA", "b/T_Bad_col.png", "b/readme.txt"):
+            f = self.root / rel
+            f.parent.mkdir(parents=True, exist_ok=True)
+            f.write_bytes(b"")
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_iter_source_files_filters_extensions(self):
+        names = [Path(p).name for p in iter_source_files([str(self.root)])]
+        self.assertEqual(names, ["T_Fire_col_ww.png", "T_Smoke_8x8_msk_cc.TGA", "T_Bad_col.png"])
+
+    def test_audit_records(self):
+        records = {Path(r["path"]).name: r for r in audit_paths(iter_source_files([str(self.root)]), CONFIG_PATH, jobs=1)}
+        fire = records["T_Fire_col_ww.png"]
+        self.assertTrue(fire["ok"])
+        self.assertEqual(fire["texture_type"], "col")
+        self.assertEqual(fire["params"]["compression"], "BC7")
+        self.assertTrue(records["T_Smoke_8x8_msk_cc.TGA"]["subuv"])
+        bad = records["T_Bad_col.png"]
+        self.assertFalse(bad["ok"])
+        self.assertIn("error", bad)
+
+    def test_probe_adds_source_header_info(self):
+        png = self.root / "a" / "T_Fire_col_ww.png"
+        png.write_bytes(b"\x89PNG\r\n\x1a\n" + struct.pack(">I4sIIBBBBB", 13, b"IHDR", 256, 128, 8, 6, 0, 0, 0))
+        records = {Path(r["path"]).name: r for r in audit_paths(iter_source_files([str(self.root)]), CONFIG_PATH, jobs=1, probe=True)}
+        source = records["T_Fire_col_ww.png"]["source"]
+        self.assertEqual((source["width"], source["height"], source["has_alpha"]), (256, 128, True))
+        self.assertIn("error", records["T_Bad_col.png"]["source"])
+
+    def test_failures_only_report(self):
+        out = io.StringIO()
+        counts = write_report(audit_paths(iter_source_files([str(self.root)]), CONFIG_PATH, jobs=1), out, failures_only=True)
+        self.assertEqual(counts, {"total": 3, "ok": 2, "failed": 1})
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([Path(r["path"]).name for r in lines], ["T_Bad_col.png"])
+
+    def test_cli_with_process_pool_does_not_need_unreal(self):
+        out_file = self.root / "audit.jsonl"
+        proc = subprocess.run(
+            [sys.executable, str(PYTHON_DIR / "texture_naming_audit.py"), str(CONFIG_PATH), str(self.root),
+             "--jobs", "2", "--output", str(out_file)],
+            capture_output=True, text=True,
+        )
+        self.assertEqual(proc.returncode, 1, proc.stderr)
+        self.assertEqual(len(out_file.read_text(encoding="utf-8").splitlines()), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+THIS_FILE = Path(__file__).resolve()
+PYTHON_DIR = THIS_FILE.parents[1]
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+import unreal_stub  # noqa: E402
+
+unreal = unreal_stub.install()
+
+from config import CompiledConfig, Config  # noqa: E402
+from detail_unreal import adapter  # noqa: E402
+from error_report import ErrorReport  # noqa: E402
+from texture_configurator import apply_texture_property_from_config, prepare_texture  # noqa: E402
+from texture_pipeline import DEFAULT_APPLY_CHUNK, PreparePool  # noqa: E402
+
+
+class TestPreparePool(unittest.TestCase):
+    def test_results_keep_input_order(self):
+        with PreparePool(workers=4) as pool:
+            self.assertTrue(pool.parallel)
+            self.assertEqual(list(pool.map_ordered(lambda x: x * x, range(50))), [x * x for x in range(50)])
+
+    def test_input_is_read_ahead_only_up_to_max_pending(self):
+        consumed = []
+
+        def items():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        with PreparePool(workers=2, max_pending=5) as pool:
+            results = pool.map_ordered(lambda x: x, items())
+            self.assertEqual(next(results), 0)
+            self.assertLessEqual(len(consumed), 6)
+
+    def test_worker_exception_is_raised_to_consumer(self):
+        def fail(x):
+            if x == 3:
+                raise ValueError("bad")
+            return x
+
+        with PreparePool(workers=2) as pool:
+            with self.assertRaises(ValueError):
+                list(pool.map_ordered(fail, range(10)))
+
+    def test_single_worker_runs_inline(self):
+        with PreparePool(workers=1) as pool:
+            self.assertFalse(pool.parallel)
+            threads = list(pool.map_ordered(lambda _x: threading.current_thread(), range(3)))
+            self.assertEqual(set(threads), {threading.current_thread()})
+            self.assertEqual(pool.submit(len, "abc").result(), 3)
+
+
+class TestParallelApply(unittest.TestCase):
+    PATHS = [f"/Game/VFX/T_N{i:03d}_col_cc.T_N{i:03d}_col_cc" for i in range(DEFAULT_APPLY_CHUNK + 10)]
+    BAD = "/Game/VFX/T_Bad_col.T_Bad_col"
+
+    def setUp(self):
+        unreal_stub.install(self.PATHS + [self.BAD])
+        self.compiled = CompiledConfig.compile(Config.load(THIS_FILE.parent / "assets" / "Config.json"))
+
+    def test_prepare_texture_is_pure(self):
+        prepared = prepare_texture(self.compiled, self.PATHS[0], with_digest=True)
+        self.assertTrue(prepared.ok)
+        self.assertIsNotNone(prepared.digest)
+        self.assertFalse(prepare_texture(self.compiled, self.BAD).ok)
+        self.assertEqual(unreal.stub_loaded, [])
+
+    def test_apply_runs_on_calling_thread_in_chunks(self):
+        original = adapter().TextureConfigurator.apply_many
+        calls = []
+
+        def recording_apply_many(jobs):
+            jobs = list(jobs)
+            calls.append((threading.current_thread(), len(jobs)))
+            return original(jobs)
+
+        errors = ErrorReport()
+        with mock.patch.object(adapter().TextureConfigurator, "apply_many", side_effect=recording_apply_many):
+            apply_texture_property_from_config(self.PATHS + [self.BAD], self.compiled, error_report=errors, workers=4)
+
+        self.assertEqual({t for t, _n in calls}, {threading.current_thread()})
+        self.assertEqual([n for _t, n in calls], [DEFAULT_APPLY_CHUNK, 10])
+        self.assertEqual(errors.counts_by_kind(), {"suffix_error": 1})
+        for path in self.PATHS:
+            self.assertEqual(unreal.stub_assets[path].compression_settings, unreal.TextureCompressionSettings.TC_BC7)
+
+    def test_serial_mode_applies_in_one_transaction(self):
+        with mock.patch.object(adapter().TextureConfigurator, "apply_many", wraps=adapter().TextureConfigurator.apply_many) as apply_many:
+            apply_texture_property_from_config(self.PATHS, self.compiled)
+        self.assertEqual(apply_many.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
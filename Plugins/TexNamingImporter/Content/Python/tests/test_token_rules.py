@@ -0,0 +1,103 @@
+import sys
+import unittest
+from pathlib import Path
+
+THIS_FILE = Path(__file__).resolve()
+PYTHON_DIR = THIS_FILE.parents[1]
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+from config import CompiledConfig, Config  # noqa: E402
+from token_rules import SUBUV_PATTERN, SUBUV_RULE_NAME, TokenRule, TokenRuleSet  # noqa: E402
+from type_define import AddressMode, MipGenKind  # noqa: E402
+
+LOD = TokenRule("lod", r"LOD[0-9]", (("max_in_game", 512),))
+SUBUV = TokenRule(SUBUV_RULE_NAME, SUBUV_PATTERN, (("max_in_game", 2048),))
+UDIM = TokenRule("udim", r"1[0-9]{3}", (("address_u", AddressMode.CLAMP),))
+
+
+class TestTokenRuleSet(unittest.TestCase):
+    def test_single_pass_returns_rules_in_declaration_order(self):
+        rule_set = TokenRuleSet([SUBUV, LOD, UDIM])
+        self.assertEqual(rule_set.match(["T", "Fire", "LOD2", "8x8", "col"]), (SUBUV, LOD))
+        self.assertEqual(rule_set.match(["T", "Fire", "1001", "1002"]), (UDIM,))
+        self.assertEqual(rule_set.match(["T", "Fire", "col"]), ())
+        self.assertEqual(rule_set.match([]), ())
+
+    def test_whole_token_must_match(self):
+        rule_set = TokenRuleSet([LOD])
+        self.assertEqual(rule_set.match(["LOD12"]), ())
+        self.assertEqual(rule_set.match(["xLOD1"]), ())
+
+    def test_first_rule_wins_per_token(self):
+        any_digits = TokenRule("digits", r"[0-9]+")
+        self.assertEqual(TokenRuleSet([UDIM, any_digits]).match(["1001"]), (UDIM,))
+        self.assertEqual(TokenRuleSet([any_digits, UDIM]).match(["1001"]), (any_digits,))
+
+    def test_token_results_are_cached(self):
+        rule_set = TokenRuleSet([SUBUV, LOD])
+        for _ in range(3):
+            rule_set.match(["T", "8x8", "col"])
+        self.assertEqual(len(rule_set._cache), 3)
+
+    def test_inner_groups_do_not_confuse_rule_lookup(self):
+        grouped = TokenRule("grouped", r"(?P<axis>[UV])(\d)")
+        self.assertEqual(TokenRuleSet([LOD, grouped]).match(["U1"]), (grouped,))
+
+    def test_invalid_pattern(self):
+        with self.assertRaises(ValueError):
+            TokenRuleSet([TokenRule("bad", "(")])
+
+
+class TestConfigTokenRules(unittest.TestCase):
+    def setUp(self):
+        self.base = Config.load(THIS_FILE.parent / "assets" / "Config.json").to_dict()
+
+    def _compile(self, **changes):
+        return CompiledConfig.compile(Config.from_dict(dict(self.base, **changes)))
+
+    def test_rules_override_resolved_params(self):
+        compiled = self._compile(token_rules=[
+            {"name": "lod", "pattern": "LOD[0-9]", "override": {"max_in_game": 256, "mip_gen": "NO_MIPMAPS"}},
+        ])
+        path = "/Game/VFX/T_Rock_LOD1_col_cc.T_Rock_LOD1_col_cc"
+        match = compiled.suffix_matcher.match(path)
+        params, rules = compiled.resolve(path, match.suffixes, match.tokens)
+        self.assertEqual([r.name for r in rules], ["lod"])
+        self.assertEqual((params.max_in_game, params.mip_gen), (256, MipGenKind.NO_MIPMAPS))
+
+    def test_legacy_subuv_becomes_first_rule(self):
+        compiled = self._compile(token_rules=[{"name": "lod", "pattern": "LOD[0-9]", "override": {"max_in_game": 256}}])
+        self.assertEqual([r.name for r in compiled.token_rules.rules], [SUBUV_RULE_NAME, "lod"])
+        params, rules = compiled.resolve("/Game/VFX/T_A_8x8_LOD1_col_cc", ["col", "cc"], ["T", "A", "8x8", "LOD1", "col", "cc"])
+        self.assertEqual(len(rules), 2)
+        self.assertEqual(params.max_in_game, 256)  # 後の規則が優先
+
+        explicit = self._compile(token_rules=[{"name": "subuv", "pattern": "[0-9]+x[0-9]+", "override": {"max_in_game": 4096}}])
+        self.assertEqual(len(explicit.token_rules), 1)
+        self.assertEqual(explicit.resolve("/Game/VFX/T", ["col", "cc"], ["T", "8x8", "col", "cc"])[0].max_in_game, 4096)
+
+        disabled = self._compile(enable_subuv_texture_override=False)
+        self.assertEqual(len(disabled.token_rules), 0)
+
+    def test_round_trip_and_shared_compilation(self):
+        rules = [{"name": "udim", "pattern": "1[0-9]{3}", "override": {"address_u": "CLAMP", "address_v": "CLAMP"}}]
+        cfg = Config.from_dict(dict(self.base, token_rules=rules))
+        self.assertEqual(cfg.to_dict()["token_rules"], rules)
+        self.assertIs(CompiledConfig.compile(cfg).token_rules, CompiledConfig.compile(Config.from_dict(cfg.to_dict())).token_rules)
+
+    def test_invalid_rules_rejected(self):
+        for token_rules in (
+            {"name": "x"},
+            [{"name": "", "pattern": "a"}],
+            [{"name": "a", "pattern": "("}],
+            [{"name": "a", "pattern": "a", "override": {"lod_bias": 1}}],
+            [{"name": "a", "pattern": "a", "override": {"compression": "NOPE"}}],
+            [{"name": "a", "pattern": "a"}, {"name": "a", "pattern": "b"}],
+        ):
+            with self.subTest(token_rules=token_rules), self.assertRaises(ValueError):
+                Config.from_dict(dict(self.base, token_rules=token_rules))
+
+
+if __name__ == "__main__":
+    unittest.main()
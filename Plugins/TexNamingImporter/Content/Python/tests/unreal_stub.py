@@ -0,0 +1,393 @@
+"""
+テスト／ベンチマーク用の最小 ``unreal`` スタブ。
+
+Unreal Editor 外で texture_configurator 系モジュールを動かすために、
+本プラグインが利用する API だけを模した偽モジュールを ``sys.modules['unreal']`` に登録する。
+
+使い方:
+    import unreal_stub
+    unreal = unreal_stub.install(["/Game/VFX/T_Fire_col_ww.T_Fire_col_ww"])
+"""
+from __future__ import annotations
+
+import enum
+import itertools
+import os
+import sys
+import tempfile
+import types
+from typing import Dict, Iterable, List, Optional
+
+
+class TextureAddress(enum.Enum):
+    TA_WRAP = 0
+    TA_CLAMP = 1
+    TA_MIRROR = 2
+
+
+class TextureCompressionSettings(enum.Enum):
+    TC_DEFAULT = 0
+    TC_NORMALMAP = 1
+    TC_MASKS = 2
+    TC_GRAYSCALE = 3
+    TC_DISPLACEMENTMAP = 4
+    TC_VECTOR_DISPLACEMENTMAP = 5
+    TC_HDR = 6
+    TC_EDITORICON = 7
+    TC_ALPHA = 8
+    TC_DISTANCE_FIELD_FONT = 9
+    TC_HDR_COMPRESSED = 10
+    TC_BC7 = 11
+
+
+class TextureMipGenSettings(enum.Enum):
+    TMGS_FROM_TEXTURE_GROUP = 0
+    TMGS_SIMPLE_AVERAGE = 1
+    TMGS_SHARPEN0 = 2
+    TMGS_SHARPEN1 = 3
+    TMGS_SHARPEN2 = 4
+    TMGS_SHARPEN3 = 5
+    TMGS_SHARPEN4 = 6
+    TMGS_SHARPEN5 = 7
+    TMGS_SHARPEN6 = 8
+    TMGS_SHARPEN7 = 9
+    TMGS_SHARPEN8 = 10
+    TMGS_NO_MIPMAPS = 11
+
+
+class TextureGroup(enum.Enum):
+    TEXTUREGROUP_WORLD = 0
+    TEXTUREGROUP_WORLD_NORMAL_MAP = 1
+    TEXTUREGROUP_WORLD_SPECULAR = 2
+    TEXTUREGROUP_CHARACTER = 3
+    TEXTUREGROUP_CHARACTER_NORMAL_MAP = 4
+    TEXTUREGROUP_CHARACTER_SPECULAR = 5
+    TEXTUREGROUP_WEAPON = 6
+    TEXTUREGROUP_VEHICLE = 9
+    TEXTUREGROUP_CINEMATIC = 12
+    TEXTUREGROUP_EFFECTS = 13
+    TEXTUREGROUP_SKYBOX = 15
+    TEXTUREGROUP_UI = 16
+    TEXTUREGROUP_LIGHTMAP = 17
+    TEXTUREGROUP_SHADOWMAP = 19
+    TEXTUREGROUP_MEDIA = 30
+
+
+class AppMsgType(enum.Enum):
+    OK = 0
+
+
+class AppReturnType(enum.Enum):
+    OK = 0
+
+
+class _Class:
+    def __init__(self, name: str):
+        self._name = name
+
+    def get_name(self) -> str:
+        return self._name
+
+
+class Object:
+    def __init__(self, path_name: str):
+        self._path_name = path_name
+
+    def get_path_name(self) -> str:
+        return self._path_name
+
+    def get_class(self) -> _Class:
+        return _Class(type(self).__name__)
+
+    def is_a(self, cls) -> bool:
+        return isinstance(self, cls)
+
+
+class Texture(Object):
+    """UTexture の模擬。Python 属性と editor property の両方で読み書きできる。"""
+
+    def __init__(self, path_name: str):
+        super().__init__(path_name)
+        self.address_x = TextureAddress.TA_WRAP
+        self.address_y = TextureAddress.TA_WRAP
+        self.max_texture_size = 0
+        self.compression_settings = TextureCompressionSettings.TC_DEFAULT
+        self.srgb = True
+        self._editor_props: Dict[str, object] = {
+            "LODGroup": TextureGroup.TEXTUREGROUP_WORLD,
+            "MipGenSettings": TextureMipGenSettings.TMGS_FROM_TEXTURE_GROUP,
+        }
+        self.modify_count = 0
+        # パッケージの dirty 状態（modify で立ち、保存で下りる。インポート直後を模す場合はテストで立てる）
+        self.stub_dirty = False
+        # アセットレジストリのタグ（AssetData.get_tag_value で返す値）
+        self.asset_tags: Dict[str, str] = {}
+
+    def modify(self) -> bool:
+        self.modify_count += 1
+        self.stub_dirty = True
+        return True
+
+    def get_outermost(self) -> "Package":
+        return Package(self)
+
+    def get_editor_property(self, name: str):
+        return self._editor_props[name]
+
+    def set_editor_property(self, name: str, value) -> None:
+        self._editor_props[name] = value
+
+
+class Texture2D(Texture):
+    pass
+
+
+class Package:
+    """UPackage の模擬（dirty 状態だけを持つ）。"""
+
+    def __init__(self, asset: Texture):
+        self._asset = asset
+
+    def is_dirty(self) -> bool:
+        return self._asset.stub_dirty
+
+
+class AssetData:
+    def __init__(self, asset: Optional[Texture], loaded: Optional[List[str]] = None):
+        self._asset = asset
+        self._loaded = loaded
+        if asset is not None:
+            self.package_name, _, self.asset_name = asset.get_path_name().partition(".")
+            self.package_path = self.package_name.rsplit("/", 1)[0]
+
+    def is_valid(self) -> bool:
+        return self._asset is not None
+
+    def get_tag_value(self, tag_name: str) -> Optional[str]:
+        return None if self._asset is None else self._asset.asset_tags.get(tag_name)
+
+    def get_asset(self) -> Optional[Texture]:
+        if self._asset is not None and self._loaded is not None:
+            self._loaded.append(self._asset.get_path_name())
+        return self._asset
+
+
+class _AssetRegistry:
+    def __init__(self, assets: Dict[str, Texture], loaded: List[str]):
+        self._assets = assets
+        self._loaded = loaded
+
+    def get_asset_by_object_path(self, path: str) -> AssetData:
+        return AssetData(self._assets.get(path), self._loaded)
+
+    def get_sub_paths(self, base_path: str, recurse: bool) -> List[str]:
+        base = base_path.rstrip("/")
+        subs = set()
+        for path in self._assets:
+            parts = path.split(".", 1)[0].split("/")[:-1]
+            for depth in range(1, len(parts) + 1):
+                candidate = "/".join(parts[:depth])
+                if candidate.startswith(base + "/") and (recurse or candidate.count("/") == base.count("/") + 1):
+                    subs.add(candidate)
+        return sorted(subs)
+
+    def get_assets(self, ar_filter: "ARFilter") -> List[AssetData]:
+        result = []
+        for path, asset in self._assets.items():
+            package_path = path.split(".", 1)[0].rsplit("/", 1)[0]
+            for root in ar_filter.package_paths:
+                root = root.rstrip("/")
+                if package_path == root or (ar_filter.recursive_paths and package_path.startswith(root + "/")):
+                    result.append(AssetData(asset, self._loaded))
+                    break
+        return result
+
+
+class ARFilter:
+    def __init__(self, class_names=(), package_paths=(), recursive_paths=False, recursive_classes=False):
+        self.class_names = list(class_names)
+        self.package_paths = list(package_paths)
+        self.recursive_paths = recursive_paths
+        self.recursive_classes = recursive_classes
+
+
+class ScopedEditorTransaction:
+    def __init__(self, description: str):
+        self.description = description
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+def _build_module(assets: Dict[str, Texture]) -> types.ModuleType:
+    mod = types.ModuleType("unreal")
+    loaded: List[str] = []
+    registry = _AssetRegistry(assets, loaded)
+    saved: List[str] = []
+    save_calls: List[List[str]] = []
+    logs: List[str] = []
+    dialogs: List[str] = []
+    delete_calls: List[List[str]] = []
+    # 参照が残っているなどで削除できないアセット（テストから追加する）
+    undeletable: set = set()
+
+    class AssetRegistryHelpers:
+        @staticmethod
+        def get_asset_registry():
+            return registry
+
+    class EditorAssetLibrary:
+        @staticmethod
+        def load_asset(path: str):
+            # オブジェクトパスとパッケージパスの両方を受け付ける
+            asset = assets.get(path)
+            if asset is None:
+                asset = next((a for p, a in assets.items() if p.split(".", 1)[0] == path), None)
+            if asset is not None:
+                loaded.append(asset.get_path_name())
+            return asset
+
+        @staticmethod
+        def save_loaded_asset(asset, only_if_is_dirty: bool = True) -> bool:
+            return EditorAssetLibrary.save_loaded_assets([asset], only_if_is_dirty)
+
+        @staticmethod
+        def save_loaded_assets(assets_to_save, only_if_is_dirty: bool = True) -> bool:
+            # only_if_is_dirty の場合、dirty でないパッケージは保存しない（成功扱い）
+            to_save = [a for a in assets_to_save if not only_if_is_dirty or getattr(a, "stub_dirty", True)]
+            names = [a.get_path_name() for a in to_save]
+            for a in to_save:
+                a.stub_dirty = False
+            saved.extend(names)
+            save_calls.append(names)
+            return True
+
+        @staticmethod
+        def does_asset_exist(package_path: str) -> bool:
+            return any(p.split(".", 1)[0] == package_path for p in assets)
+
+        @staticmethod
+        def delete_loaded_assets(assets_to_delete) -> bool:
+            names = [a.get_path_name() for a in assets_to_delete]
+            delete_calls.append(names)
+            for name in names:
+                if name not in undeletable:
+                    assets.pop(name, None)
+            return not any(name in undeletable for name in names)
+
+        @staticmethod
+        def delete_asset(package_path: str) -> bool:
+            delete_calls.append([package_path])
+            for p in [p for p in assets if p.split(".", 1)[0] == package_path]:
+                if p in undeletable:
+                    return False
+                del assets[p]
+                return True
+            return False
+
+    class Paths:
+        @staticmethod
+        def project_content_dir() -> str:
+            return mod.stub_content_dir
+
+        @staticmethod
+        def project_saved_dir() -> str:
+            return mod.stub_saved_dir
+
+        @staticmethod
+        def convert_relative_path_to_full(path: str) -> str:
+            return os.path.abspath(path)
+
+    class EditorDialog:
+        @staticmethod
+        def show_message(title, message, message_type, default_value=None):
+            dialogs.append(f"{title}: {message}")
+            return default_value
+
+    # register_slate_post_tick_callback のハンドル → コールバック（stub_tick() で 1 フレーム進める）
+    tick_callbacks: Dict[int, object] = {}
+    tick_handles = itertools.count(1)
+
+    def register_slate_post_tick_callback(callback) -> int:
+        handle = next(tick_handles)
+        tick_callbacks[handle] = callback
+        return handle
+
+    def unregister_slate_post_tick_callback(handle: int) -> None:
+        tick_callbacks.pop(handle, None)
+
+    def stub_tick(delta_seconds: float = 1.0 / 60.0) -> int:
+        """登録済みのコールバックを 1 回ずつ呼び、呼んだ数を返す。"""
+        callbacks = list(tick_callbacks.values())
+        for callback in callbacks:
+            callback(delta_seconds)
+        return len(callbacks)
+
+    mod.register_slate_post_tick_callback = register_slate_post_tick_callback
+    mod.unregister_slate_post_tick_callback = unregister_slate_post_tick_callback
+    mod.stub_tick = stub_tick
+    mod.stub_tick_callbacks = tick_callbacks
+
+    for name, value in {
+        "TextureAddress": TextureAddress,
+        "TextureCompressionSettings": TextureCompressionSettings,
+        "TextureMipGenSettings": TextureMipGenSettings,
+        "TextureGroup": TextureGroup,
+        "AppMsgType": AppMsgType,
+        "AppReturnType": AppReturnType,
+        "Object": Object,
+        "Texture": Texture,
+        "Texture2D": Texture2D,
+        "Package": Package,
+        "AssetData": AssetData,
+        "ARFilter": ARFilter,
+        "AssetRegistryHelpers": AssetRegistryHelpers,
+        "EditorAssetLibrary": EditorAssetLibrary,
+        "EditorDialog": EditorDialog,
+        "Paths": Paths,
+        "ScopedEditorTransaction": ScopedEditorTransaction,
+    }.items():
+        setattr(mod, name, value)
+
+    mod.log = logs.append
+    mod.log_warning = logs.append
+    mod.log_error = logs.append
+
+    # テスト側から状態を確認するための参照
+    mod.stub_assets = assets
+    mod.stub_loaded = loaded
+    mod.stub_saved = saved
+    mod.stub_save_calls = save_calls
+    mod.stub_logs = logs
+    mod.stub_dialogs = dialogs
+    mod.stub_delete_calls = delete_calls
+    mod.stub_undeletable = undeletable
+    mod.stub_content_dir = os.path.join(tempfile.gettempdir(), "unreal_stub", "Content")
+    mod.stub_saved_dir = os.path.join(tempfile.gettempdir(), "unreal_stub", "Saved")
+    return mod
+
+
+def install(texture_paths: Iterable[str] = ()) -> types.ModuleType:
+    """
+    偽の ``unreal`` モジュールを sys.modules に登録して返す。
+
+    既にスタブが登録済みの場合は同じモジュールを再利用し、アセットと記録を初期化する
+    （``import unreal`` 済みのモジュールからも同じ状態が見えるようにするため）。
+    """
+    mod = sys.modules.get("unreal")
+    if mod is None or not hasattr(mod, "stub_assets"):
+        mod = _build_module({})
+        sys.modules["unreal"] = mod
+    for name in ("stub_assets", "stub_loaded", "stub_saved", "stub_save_calls", "stub_logs", "stub_dialogs",
+                 "stub_delete_calls", "stub_undeletable", "stub_tick_callbacks"):
+        getattr(mod, name).clear()
+    mod.stub_assets.update({p: Texture2D(p) for p in texture_paths})
+    return mod
+
+
+def uninstall() -> None:
+    """install() で登録したスタブを取り除く。"""
+    mod = sys.modules.get("unreal")
+    if mod is not None and hasattr(mod, "stub_assets"):
+        del sys.modules["unreal"]
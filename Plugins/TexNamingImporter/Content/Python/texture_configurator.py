@@ -1,28 +1,43 @@
 """
 サフィックスと Config からテクスチャ設定を適用する CLI モジュール。
+
+Unreal への反映（detail_unreal）は実際に適用するときに初めて import するため、
+このモジュール自体は unreal の無い環境（オフラインツール・ワーカープロセス）でも import できる。
 """
 
 import sys, argparse
-import traceback
-from pathlib import Path
-from typing import List, Dict
-
-_THIS_DIR = Path(__file__).resolve().parent
-if str(_THIS_DIR) not in sys.path:
-    sys.path.insert(0, str(_THIS_DIR))
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple, Union
 
+import budget_overrides
+import content_analysis
+import stage_timer
 import validator
-from type_define import AddressMode
-from config import Config, TextureConfigParams, override_address_uv, override_subuv_max_in_game
-from path_utils.path_functions import *
-
-from detail_unreal.texture_configurator_unreal import (
-    TextureConfigurator,
-    delete_texture_asset,
-    show_texture_configurator_dialog,
+from texture_logging import get_logger, log_batch, set_verbosity, verbosity_from_args
+from config import (
+    CompiledConfig,
+    Config,
+    ResolvedTextureParams,
+    TextureConfigParams,
+    get_address_settings_from_suffix,
+    get_texture_settings_from_suffixes,
+    load_compiled_config,
+    override_address_uv,
 )
 
-SUBUV_PATTERN = r'^[1-9]\d*[xX][1-9]\d*$'  # 例: 8x8, 4x4, 1x8
+from error_report import ErrorReport
+from state_manifest import StateManifest, params_hash
+from suffix_matcher import SuffixMatchResult
+from texture_pipeline import DEFAULT_APPLY_CHUNK, PreparePool
+from token_rules import SUBUV_RULE_NAME, TokenRule
+
+from detail_unreal import adapter as _unreal_adapter
+
+SUBUV_PATTERN = validator.SUBUV_PATTERN  # 例: 8x8, 4x4, 1x8（判定は CompiledConfig.token_rules で行う）
+
+logger = get_logger(__name__)
 
 def build_parser() -> argparse.ArgumentParser:
     """
@@ -60,46 +75,31 @@ def build_parser() -> argparse.ArgumentParser:
         help="サフィックスエラーやインポート失敗時にダイアログを表示する場合は --dialog を指定。",
         action="store_true"
     )
+    parser.add_argument(
+        "--error-report",
+        default=None,
+        help="エラーの一覧を JSON で書き出すパス（エラーが無い場合は書き出さない）。",
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="count",
+        default=0,
+        help="テクスチャごとの詳細ログ（DEBUG）を出力します。",
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="count",
+        default=0,
+        help="警告・エラーのみ出力します（-qq でエラーのみ）。",
+    )
+    parser.add_argument(
+        "--timing",
+        default=None,
+        help="段階別の処理時間（テクスチャ別・p50/p95/max）を JSON で書き出すパス。",
+    )
     return parser
 
 
-def get_address_settings_from_suffix(suffixes: List[str], config_data: Config):
-    """
-    サフィックスからアドレスモード（UV/UVW）の設定を決定する。
-
-    Args:
-        suffixes (List[str]): 対象テクスチャから抽出したサフィックス一覧。
-        config_data (Config): サフィックス設定を持つ Config。
-
-    Returns:
-        tuple: (AddressMode, AddressMode) の組。
-    """
-    for suf in suffixes:
-        if config_data.has_suffix_2d(suf):
-            return config_data.get_uv(suf)
-        if config_data.has_suffix_3d(suf):
-            return config_data.get_uvw(suf)
-    return (AddressMode.WRAP, AddressMode.WRAP)
-
-
-def get_texture_settings_from_suffixes(suffixes: List[str],
-                                        texture_settings: Dict[str, TextureConfigParams]):
-    """
-    サフィックスに一致するテクスチャ設定を取得する。
-
-    Args:
-        suffixes (List[str]): 対象テクスチャから抽出したサフィックス一覧。
-        texture_settings (Dict[str, TextureConfigParams]): サフィックス別設定の辞書。
-
-    Returns:
-        TextureConfigParams: 一致した設定。該当がなければデフォルト値。
-    """
-    for suf in suffixes:
-        if suf in texture_settings:
-            return texture_settings[suf]
-    return TextureConfigParams()
-
-
 def build_texture_config_params(suffixes: List[str],
                                 tex_settings_dict: Dict[str, TextureConfigParams],
                                 config_data: Config)-> TextureConfigParams:
@@ -114,100 +114,356 @@ def build_texture_config_params(suffixes: List[str],
     Returns:
         TextureConfigParams: アドレス設定を反映した最終設定。
     """
+    # override_address_uv は複製を返すため、共有された Config 側の設定は変更されない
     base_settings = get_texture_settings_from_suffixes(suffixes, tex_settings_dict)
     # 現状はTex2Dのみ対応
-    print(f"Base settings from suffixes: {base_settings}")
-    address_u, address_v = get_address_settings_from_suffix(suffixes, config_data)
-    return override_address_uv(base_settings, address_u, address_v)
+    logger.debug("Base settings from suffixes: %s", base_settings)
+    uv = get_address_settings_from_suffix(suffixes, config_data)
+    return override_address_uv(base_settings, uv[0], uv[1])
 
 
 def apply_texture_property_from_config(
     texture_list: List[str],
-    config_data: Config,
+    config_data: Union[Config, CompiledConfig],
     delete_on_suffix_error: bool = False,
     show_dialog_on_error: bool = False,
+    manifest: Optional[StateManifest] = None,
+    error_report: Optional[ErrorReport] = None,
+    max_in_game_overrides: Optional[Dict[str, int]] = None,
+    workers: int = 1,
 ) -> int:
     """
     設定を適用し、エラー時は削除やダイアログ表示を行う。
 
     Args:
         texture_list (List[str]): Unreal のテクスチャパス一覧。
-        config_data (Config): サフィックス規則と設定を含む Config。
+        config_data (Config | CompiledConfig): サフィックス規則と設定を含む Config。
+            load_compiled_config() の結果を渡すとサフィックス表の構築を省略できる。
         delete_on_suffix_error (bool): サフィックス不正時に削除を試みるか。
-        show_dialog_on_error (bool): エラー時にダイアログを表示するか。
+        show_dialog_on_error (bool): エラー時にダイアログを表示するか。ダイアログは処理中には出さず、
+            バッチ終了時にエラーをまとめた 1 つのサマリーとして表示する。
+        manifest (StateManifest | None): 増分実行用マニフェスト。指定した場合、前回から
+            パッケージも最終設定も変わっていないテクスチャをスキップし、処理結果を記録する
+            （保存は呼び出し側で行う）。
+        error_report (ErrorReport | None): エラーの集約先。指定した場合はエラーを追加するだけで
+            ダイアログは表示しない（複数バッチをまとめて呼び出し側で表示・保存する場合）。
+        max_in_game_overrides (Dict[str, int] | None): テクスチャごとの max_in_game の上書き
+            （メモリ予算に合わせて下げる場合。memory_estimator.plan_budget_reductions() の結果）。
+            None で budget_action が "lower" の場合は、記録済みの縮小（budget_overrides）を使う。
+        workers (int): サフィックス検証・設定の解決・画素解析を先行実行するスレッド数。
+            1（既定）なら逐次に処理し、全テクスチャを 1 トランザクションで反映する。
+            2 以上では DEFAULT_APPLY_CHUNK 件ごとに反映・保存し、その間に次の準備を進める
+            （Undo も反映単位になる）。unreal の呼び出しは常にこのスレッドで行う。
 
     Returns:
         int: 終了コード。通常は 0。
+
+    ログはバッチ終了時にまとめて書き出す。既定（INFO）ではバッチごとの 1 行サマリーと
+    警告・エラーのみを出力し、テクスチャごとの詳細は DEBUG でのみ出力する。
     """
-    suffix_grid = config_data.build_suffix_grid()
-    #print(f'suffix:{suffix_grid}')
-    all_suffixes = [suf for row in suffix_grid for suf in row]
-    #print(config_data)
-    for tex_path in texture_list:
-        print(f"---import begin  {tex_path} ---")
-        suffixes,tokens = collect_suffixes_from_path(tex_path, all_suffixes)
-        #print(f"collected suffixes: {suffixes}")
-        print(tokens)
-        suffix_result = validator.validate_suffixes(suffixes, suffix_grid)
-        print(suffix_result)  
-        if suffix_result.ok:
-            print("Suffix OK")
-        else:
-            print(f"Suffix Error: {suffix_result.error}")
-            if show_dialog_on_error:
-                show_texture_configurator_dialog(
-                    title="Texture Configurator - Suffix Error",
-                    message=(
-                        f"テクスチャ {tex_path} のサフィックスが不正です。\n"
-                        f"詳細: {suffix_result.error}"
-                    ),
-                )
-            if delete_on_suffix_error:
-                try:
-                    deleted = delete_texture_asset(tex_path)
-                    print(f"Delete Texture ({'Succeeded' if deleted else 'Failed'}): {tex_path}")
-                except Exception as delete_error:
-                    print(f"Delete Texture Error: {delete_error}")
-            continue  # サフィックスエラーならインポートしない
-
-        texture_settings = build_texture_config_params(suffixes, config_data.texture_config, config_data)
-        if config_data.enable_subuv_texture_override: 
-            if validator.regex_any_match(SUBUV_PATTERN, tokens):
-                texture_settings = override_subuv_max_in_game(texture_settings, config_data.subuv_max_in_game)
-                print("suffix override")
-        
-        print(f"import property: {texture_settings}")
-        importer = TextureConfigurator(params=texture_settings)
-        try:
-            import_result_dict = importer.apply(tex_path)
-        except Exception as import_error:
-            tb = traceback.format_exc()
-            print(f"Import Exception: {import_error}\n{tb}")
-            if show_dialog_on_error:
-                show_texture_configurator_dialog(
-                    title="Texture Configurator - Import Exception",
-                    message=(
-                        f"テクスチャ {tex_path} の設定適用中に例外が発生しました。\n"
-                        f"Exception: {import_error}\n"
-                        f"Traceback:\n{tb}"
-                    ),
-                )
+    start = time.perf_counter()
+    counts = dict.fromkeys(("applied", "unchanged", "up_to_date", "suffix_error", "deleted", "failed", "unsaved",
+                            "recommended"), 0)
+    report = error_report if error_report is not None else ErrorReport()
+    with log_batch():
+        _apply_texture_batch(texture_list, config_data, delete_on_suffix_error, manifest, counts, report,
+                             max_in_game_overrides, workers)
+        logger.info(
+            "Texture Configurator: %d textures (%d applied, %d unchanged, %d up to date, %d suffix errors, %d deleted, %d failed) in %.2fs",
+            len(texture_list), counts["applied"], counts["unchanged"], counts["up_to_date"],
+            counts["suffix_error"], counts["deleted"], counts["failed"], time.perf_counter() - start,
+        )
+        if counts["unsaved"]:
+            logger.warning("Texture Configurator: %d textures were applied but could not be saved", counts["unsaved"])
+        if counts["recommended"]:
+            logger.info("Content analysis: %d textures have a better-fitting compression setting", counts["recommended"])
+    if error_report is None and show_dialog_on_error and len(report):
+        show_error_summary_dialog(report)
+    return 0
+
+
+def show_error_summary_dialog(report: ErrorReport, report_path: Optional[str] = None) -> None:
+    """集約したエラーを 1 つのダイアログで表示する。"""
+    message = report.format_summary()
+    if report_path:
+        message += f"\n\n詳細: {report_path}"
+    _unreal_adapter().show_texture_configurator_dialog(title="Texture Configurator - Errors", message=message)
+
+
+def resolve_texture_settings(
+    compiled: CompiledConfig,
+    tex_path: str,
+    suffixes: List[str],
+    tokens: List[str],
+) -> Tuple[ResolvedTextureParams, Tuple[TokenRule, ...]]:
+    """
+    サフィックス検証済みのテクスチャの最終設定を返す。
+
+    directory_overrides を反映した設定（ディレクトリ単位でキャッシュされる）で、トークン規則
+    （SubUV を含む）をトークン列の 1 回の走査で判定する。(サフィックス列, 一致した規則) の
+    組み合わせごとに 1 回だけ解決される。
+
+    Returns:
+        (最終設定, 一致したトークン規則)
+    """
+    return compiled.resolve(tex_path, suffixes, tokens)
+
+
+@dataclass
+class PreparedTexture:
+    """prepare_texture() の結果（unreal を呼ばずに求められる部分）。"""
+    tex_path: str
+    match: SuffixMatchResult
+    # サフィックス検証を通った場合のみ設定される
+    settings: Optional[ResolvedTextureParams] = None
+    # 一致したトークン規則の名前（宣言順）
+    token_rules: Tuple[str, ...] = ()
+    # マニフェスト照合用の最終設定ハッシュ（with_digest=True の場合のみ）
+    digest: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.match.validation.ok
+
+    @property
+    def is_subuv(self) -> bool:
+        return SUBUV_RULE_NAME in self.token_rules
+
+
+def prepare_texture(
+    compiled: CompiledConfig,
+    tex_path: str,
+    *,
+    max_in_game_overrides: Optional[Dict[str, int]] = None,
+    with_digest: bool = False,
+    analyzed: bool = False,
+) -> PreparedTexture:
+    """
+    1 テクスチャの純粋な段階（サフィックス抽出と検証・最終設定の解決・ハッシュ）を行う。
+
+    unreal もロガーも使わないため、texture_pipeline のワーカースレッドから呼べる。
+    analyzed=True（content_analysis="apply"）の場合は、解析の有無でハッシュを区別する。
+    """
+    # サフィックス抽出と検証を 1 回の走査で行う
+    with stage_timer.span("suffix_match", tex_path):
+        match = compiled.suffix_matcher.match(tex_path)
+    prepared = PreparedTexture(tex_path, match)
+    if not match.validation.ok:
+        return prepared
+    with stage_timer.span("resolve", tex_path):
+        settings, rules = resolve_texture_settings(compiled, tex_path, match.suffixes, match.tokens)
+        prepared.token_rules = tuple(rule.name for rule in rules)
+        if max_in_game_overrides and tex_path in max_in_game_overrides:
+            settings = settings.replace(max_in_game=max_in_game_overrides[tex_path])
+        if with_digest:
+            # 解析結果で設定が変わり得るため、モードの切り替えで再処理されるようにする
+            prepared.digest = params_hash(settings) + (":analyzed" if analyzed else "")
+    prepared.settings = settings
+    return prepared
+
+
+def _apply_texture_batch(
+    texture_list: List[str],
+    config_data: Union[Config, CompiledConfig],
+    delete_on_suffix_error: bool,
+    manifest: Optional[StateManifest],
+    counts: Dict[str, int],
+    report: ErrorReport,
+    max_in_game_overrides: Optional[Dict[str, int]] = None,
+    workers: int = 1,
+) -> None:
+    """
+    apply_texture_property_from_config() の本体。結果の件数を counts に加算する。
+
+    純粋な段階（prepare_texture・画素解析）は PreparePool で先行実行し、このスレッドは
+    準備済みの結果を入力順に受け取ってマニフェスト照合・反映・保存・削除だけを行う。
+    並列時は DEFAULT_APPLY_CHUNK 件ごとに反映するため、反映中に次の準備が進む。
+    """
+    compiled = config_data if isinstance(config_data, CompiledConfig) else CompiledConfig.compile(config_data)
+    unreal_adapter = _unreal_adapter()
+    if max_in_game_overrides is None and compiled.config.budget_action == "lower":
+        # 一括実行で記録した縮小をインポート時・部分実行時にも維持する
+        max_in_game_overrides = budget_overrides.load_cached(unreal_adapter.default_budget_overrides_path())
+    analysis_mode = compiled.config.content_analysis
+    if analysis_mode != "off" and not content_analysis.is_available():
+        logger.warning("content_analysis=%s requires numpy and Pillow; skipping analysis", analysis_mode)
+        analysis_mode = "off"
+
+    def prepare(tex_path: str) -> PreparedTexture:
+        return prepare_texture(compiled, tex_path, max_in_game_overrides=max_in_game_overrides,
+                               with_digest=manifest is not None, analyzed=analysis_mode == "apply")
+
+    queued: List[_QueuedApply] = []
+    digests: Dict[str, str] = {}
+    to_delete: List[str] = []
+    with PreparePool(workers) as pool:
+        apply_chunk = DEFAULT_APPLY_CHUNK if pool.parallel else 0
+        for prepared in pool.map_ordered(prepare, texture_list):
+            tex_path = prepared.tex_path
+            suffix_result = prepared.match.validation
+            logger.debug("---import begin  %s ---", tex_path)
+            logger.debug("tokens: %s", prepared.match.tokens)
+            logger.debug("%s", suffix_result)
+            if suffix_result.ok:
+                logger.debug("Suffix OK")
+            else:
+                counts["suffix_error"] += 1
+                logger.warning("Suffix Error: %s: %s", tex_path, suffix_result.error)
+                report.add("suffix_error", tex_path, suffix_result.error)
+                if delete_on_suffix_error:
+                    # 削除はバッチの最後にまとめて行う
+                    to_delete.append(tex_path)
+                if manifest is not None:
+                    manifest.forget(tex_path)
+                continue  # サフィックスエラーならインポートしない
+
+            if prepared.token_rules:
+                logger.debug("token rules: %s", ", ".join(prepared.token_rules))
+            if max_in_game_overrides and tex_path in max_in_game_overrides:
+                logger.debug("max_in_game lowered to %d (memory budget)", max_in_game_overrides[tex_path])
+
+            if manifest is not None:
+                with stage_timer.span("manifest", tex_path):
+                    up_to_date = manifest.is_up_to_date(tex_path, unreal_adapter.get_package_stamp(tex_path), prepared.digest)
+                if up_to_date:
+                    counts["up_to_date"] += 1
+                    logger.debug("Skip (up to date): %s", tex_path)
+                    continue
+                digests[tex_path] = prepared.digest
+
+            analysis = None
+            if analysis_mode != "off":
+                # ソースパスの取得（アセットレジストリ）はこのスレッドで、デコードと解析はワーカーで行う
+                source = unreal_adapter.get_source_file_path(tex_path)
+                analysis = pool.submit(_analyze_source, tex_path, source, prepared.settings)
+            queued.append(_QueuedApply(tex_path, prepared.settings, analysis))
+
+            if apply_chunk and len(queued) >= apply_chunk:
+                _apply_queued(queued, unreal_adapter, manifest, digests, analysis_mode, counts, report)
+                queued = []
+        if queued:
+            # 逐次モードでは検証を通った全テクスチャを 1 トランザクションで反映し、最後にまとめて保存する
+            _apply_queued(queued, unreal_adapter, manifest, digests, analysis_mode, counts, report)
+
+    if to_delete:
+        _delete_invalid_textures(to_delete, counts, report)
+
+
+@dataclass
+class _QueuedApply:
+    """反映待ちのテクスチャ。analysis は content_analysis の解析結果（CompressionRecommendation）の Future。"""
+    tex_path: str
+    settings: ResolvedTextureParams
+    analysis: Optional[Future] = None
+
+
+def _apply_queued(
+    queued: List[_QueuedApply],
+    unreal_adapter,
+    manifest: Optional[StateManifest],
+    digests: Dict[str, str],
+    analysis_mode: str,
+    counts: Dict[str, int],
+    report: ErrorReport,
+) -> None:
+    """反映待ちのテクスチャを 1 回の apply_many で反映し、結果を記録する（メインスレッド）。"""
+    jobs: List[Tuple[str, ResolvedTextureParams]] = []
+    for item in queued:
+        texture_settings = item.settings
+        if item.analysis is not None:
+            try:
+                recommendation = item.analysis.result()
+            except Exception as e:
+                # 解析の失敗はそのテクスチャの提案を諦めるだけにする（反映は続ける）
+                logger.warning("Content analysis failed: %s: %s", item.tex_path, e)
+                recommendation = None
+            texture_settings = _use_recommendation(item.tex_path, texture_settings, recommendation,
+                                                   analysis_mode, counts)
+        logger.debug("import property: %s", texture_settings)
+        jobs.append((item.tex_path, texture_settings))
+
+    reports = unreal_adapter.TextureConfigurator.apply_many(jobs) if jobs else {}
+    for tex_path, _settings in jobs:
+        import_result_dict = reports[tex_path]
+        if manifest is not None:
+            if import_result_dict.get("ok") and not import_result_dict.get("unsaved"):
+                # 保存後のパッケージ状態を記録する
+                manifest.record(tex_path, unreal_adapter.get_package_stamp(tex_path), digests[tex_path])
+            else:
+                manifest.forget(tex_path)
+        import_error = import_result_dict.pop("exception", None)
+        if import_error is not None:
+            tb = import_result_dict.pop("traceback", "")
+            counts["failed"] += 1
+            logger.error("Import Exception: %s: %s\n%s", tex_path, import_error, tb)
+            report.add("import_exception", tex_path, f"Exception: {import_error}", tb)
             continue
-        print(import_result_dict)
-        if import_result_dict.get("ok"):
-            print("Import Succeeded")
+        logger.debug("%s", import_result_dict)
+        if import_result_dict.get("unsaved"):
+            # 設定はエディタ上に反映済み（dirty のまま）。ディスクには書かれていない
+            counts["unsaved"] += 1
+            report.add("save_failed", tex_path, "; ".join(import_result_dict.get("errors") or []))
+        if import_result_dict.get("ok") and import_result_dict.get("unchanged"):
+            counts["unchanged"] += 1
+            logger.debug("Import Succeeded (unchanged)")
+        elif import_result_dict.get("ok"):
+            counts["applied"] += 1
+            logger.debug("Import Succeeded")
         else:
-            print(f"Import Failed: {import_result_dict}")
-            if show_dialog_on_error:
-                show_texture_configurator_dialog(
-                    title="Texture Configurator - Import Failed",
-                    message=(
-                        f"テクスチャ {tex_path} の設定適用に失敗しました。\n"
-                        f"結果: {import_result_dict}"
-                    ),
-                )
-        print(f"---import end  {tex_path} ---")
-    return 0
+            counts["failed"] += 1
+            logger.error("Import Failed: %s: %s", tex_path, import_result_dict)
+            report.add("import_failed", tex_path, "; ".join(import_result_dict.get("errors") or []) or str(import_result_dict))
+        logger.debug("---import end  %s ---", tex_path)
+
+
+def _analyze_source(
+    tex_path: str,
+    source: Optional[str],
+    texture_settings: ResolvedTextureParams,
+) -> Optional[content_analysis.CompressionRecommendation]:
+    """ソース画像を解析して提案を返す（ワーカースレッドで実行される。読めなければ None）。"""
+    with stage_timer.span("analyze", tex_path):
+        stats = content_analysis.analyze_image(source) if source else None
+        if stats is None:
+            return None
+        return content_analysis.recommend(stats, texture_settings)
+
+
+def _use_recommendation(
+    tex_path: str,
+    texture_settings: ResolvedTextureParams,
+    recommendation: Optional[content_analysis.CompressionRecommendation],
+    mode: str,
+    counts: Dict[str, int],
+) -> ResolvedTextureParams:
+    """提案をログに出す（mode="apply" なら設定に反映した結果を返す）。"""
+    if recommendation is None:
+        logger.debug("Content analysis: no change (or source not readable): %s", tex_path)
+        return texture_settings
+    counts["recommended"] += 1
+    logger.info("%s: %s: %s", "Content analysis applied" if mode == "apply" else "Content analysis recommends",
+                tex_path, recommendation.describe(texture_settings))
+    if mode != "apply":
+        return texture_settings
+    return texture_settings.replace(compression=recommendation.compression, srgb=recommendation.srgb)
+
+
+def _delete_invalid_textures(texture_paths: List[str], counts: Dict[str, int], report: ErrorReport) -> None:
+    """サフィックス不正のテクスチャを一括削除し、テクスチャごとの結果を記録する。"""
+    try:
+        results = _unreal_adapter().delete_texture_assets(texture_paths)
+    except Exception as delete_error:
+        logger.error("Delete Texture Error: %s", delete_error)
+        for tex_path in texture_paths:
+            report.add("delete_failed", tex_path, delete_error)
+        return
+    for tex_path in texture_paths:
+        deleted = results.get(tex_path, False)
+        logger.debug("Delete Texture (%s): %s", "Succeeded" if deleted else "Failed", tex_path)
+        if deleted:
+            counts["deleted"] += 1
+        else:
+            report.add("delete_failed", tex_path, "delete failed")
 
 
 if __name__ == "__main__":
@@ -215,14 +471,26 @@ if __name__ == "__main__":
     args = parser.parse_args()
     textures = [args.texture_path]
     # execute_texture_config() 呼び出し（戻り値が int ならそれを終了コードに、そうでなければ 1）
+    set_verbosity(verbosity_from_args(args.verbose, args.quiet))
+    if args.timing:
+        stage_timer.enable()
     try:
-        config_data = Config.load(args.config_path)
+        config_data = load_compiled_config(args.config_path)
+        errors = ErrorReport()
         ret = apply_texture_property_from_config(
             texture_list=textures,
             config_data=config_data,
             delete_on_suffix_error=args.delete,
-            show_dialog_on_error=args.dialog
+            show_dialog_on_error=args.dialog,
+            error_report=errors,
         )
+        if len(errors):
+            if args.error_report:
+                errors.write(args.error_report)
+            if args.dialog:
+                show_error_summary_dialog(errors, args.error_report)
+        if args.timing:
+            stage_timer.dump(args.timing)
         sys.exit(int(ret) if isinstance(ret, int) else 1)
     except SystemExit:
         raise
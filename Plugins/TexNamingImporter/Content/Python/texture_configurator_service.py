@@ -0,0 +1,121 @@
+"""
+Unreal Editor 内に常駐してテクスチャ設定を適用するサービスモジュール。
+
+インポートのたびに texture_configurator.py を runpy で実行し直す代わりに、
+C++ 側（FTexNamingImporterModule）から以下のように直接呼び出す:
+
+    import texture_configurator_service
+    texture_configurator_service.configure_many([object_path, ...], config_path=..., ...)
+
+モジュールは一度 import されれば常駐するため、モジュール import・argparse の
+コストは初回のみとなる。Config とサフィックス表は config.load_compiled_config() で
+(パス, 更新時刻, サイズ) 単位にキャッシュされ、Config.json が変更されるまで再利用される。
+
+C++ 側はインポート直後のテクスチャをキューに溜め、短いデバウンス後に configure_many() で
+まとめて渡す。複数ファイルのドラッグ＆ドロップでも Python 呼び出し・保存は 1 回で済む。
+"""
+from __future__ import annotations
+
+import traceback
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+import stage_timer
+from texture_logging import get_logger
+from config import CompiledConfig, clear_config_cache, load_compiled_config
+from texture_configurator import apply_texture_property_from_config
+
+_default_config_path: Optional[str] = None
+
+logger = get_logger(__name__)
+
+
+def set_default_config_path(config_path: Union[str, Path, None]) -> None:
+    """configure() で config_path を省略したときに使う Config.json のパスを設定する。"""
+    global _default_config_path
+    _default_config_path = None if config_path is None else str(config_path)
+
+
+def load_config(config_path: Union[str, Path]) -> CompiledConfig:
+    """
+    CompiledConfig を読み込む。前回読み込み時からファイルの更新時刻・サイズが
+    変わっていなければキャッシュ済みのものを返す（config.load_compiled_config）。
+    """
+    return load_compiled_config(config_path)
+
+
+def clear_cache() -> None:
+    """キャッシュ済みの Config を破棄する。"""
+    clear_config_cache()
+
+
+def configure(
+    object_path: str,
+    *,
+    config_path: Union[str, Path, None] = None,
+    delete_on_suffix_error: bool = False,
+    show_dialog_on_error: bool = False,
+) -> int:
+    """
+    1 テクスチャに対して設定を適用する（texture_configurator.py の CLI と同じ処理）。
+
+    Args:
+        object_path (str): 対象テクスチャの Unreal アセットパス。例: /Game/VFX/T_Fire_col_ww.T_Fire_col_ww
+        config_path (str | Path | None): Config.json のパス。省略時は set_default_config_path() の値。
+        delete_on_suffix_error (bool): サフィックス不正時に削除を試みるか。
+        show_dialog_on_error (bool): エラー時にダイアログを表示するか。
+
+    Returns:
+        int: 終了コード。正常時 0、Config 読み込み等で失敗した場合 1。
+    """
+    return configure_many(
+        [object_path],
+        config_path=config_path,
+        delete_on_suffix_error=delete_on_suffix_error,
+        show_dialog_on_error=show_dialog_on_error,
+    )
+
+
+def configure_many(
+    object_paths: Sequence[str],
+    *,
+    config_path: Union[str, Path, None] = None,
+    delete_on_suffix_error: bool = False,
+    show_dialog_on_error: bool = False,
+) -> int:
+    """
+    複数テクスチャに対して設定を 1 回の呼び出しで適用する（1 トランザクション・一括保存）。
+
+    Args:
+        object_paths (Sequence[str]): 対象テクスチャの Unreal アセットパス一覧。重複は先勝ちで除去する。
+        その他の引数は configure() と同じ。
+
+    Returns:
+        int: 終了コード。正常時 0、Config 読み込み等で失敗した場合 1。
+    """
+    path = config_path if config_path is not None else _default_config_path
+    if path is None:
+        logger.error("texture_configurator_service: config_path is not set")
+        return 1
+    texture_list = list(dict.fromkeys(object_paths))
+    if not texture_list:
+        return 0
+    # 環境変数 TEXNAMING_TIMING が設定されていれば、呼び出しごとの計測結果を書き出す
+    timing_path = stage_timer.env_output_path()
+    if timing_path:
+        stage_timer.enable()
+    try:
+        config_data = load_config(path)
+        return apply_texture_property_from_config(
+            texture_list=texture_list,
+            config_data=config_data,
+            delete_on_suffix_error=delete_on_suffix_error,
+            show_dialog_on_error=show_dialog_on_error,
+        )
+    except Exception as e:
+        logger.error("%s\n%s", e, traceback.format_exc())
+        return 1
+    finally:
+        if timing_path:
+            stage_timer.dump(timing_path)
+            stage_timer.disable()
@@ -3,18 +3,42 @@
 This script enumerates all texture assets within an Unreal asset directory (e.g.
 /Game/Environments) and reuses the existing ``apply_texture_property_from_config``
 function so that the same validation/override flow is applied to each asset.
+
+Textures are streamed from the Asset Registry one package path at a time and processed
+in bounded chunks, so the first results appear immediately, memory stays flat regardless
+of the directory size, and a run can be cancelled between chunks (Ctrl+C when run as a
+commandlet, or ``should_cancel`` when driven from Python).
+
+Inside the editor, ``--background`` (or :func:`start_time_sliced_run`) processes the
+textures from the Slate post-tick callback under a per-frame time budget instead, so the
+editor stays usable during long runs.
 """
 import argparse
+import itertools
+import signal
 import sys
-from pathlib import Path
-from typing import Iterable, List
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Union
 
-_THIS_DIR = Path(__file__).resolve().parent
-if str(_THIS_DIR) not in sys.path:
-    sys.path.insert(0, str(_THIS_DIR))
+import stage_timer
+from texture_logging import get_logger, log_batch, set_verbosity, verbosity_from_args
+from budget_overrides import BudgetOverrides
+from config import CompiledConfig, Config, load_compiled_config
+from error_report import ErrorReport
+from image_probe import ImageInfo, try_probe_image
+from memory_estimator import MIB, MemoryReport, estimate_from_source, plan_budget_reductions
+from texture_configurator import apply_texture_property_from_config, resolve_texture_settings, show_error_summary_dialog
+from state_manifest import StateManifest
+from texture_pipeline import PreparePool
+from detail_unreal import adapter as _unreal_adapter
 
-from config import Config
-from texture_configurator import apply_texture_property_from_config
+DEFAULT_CHUNK_SIZE = 500
+# Time a background run may spend per editor frame (see TimeSlicedDirectoryRun)
+DEFAULT_FRAME_BUDGET_MS = 8.0
+
+logger = get_logger(__name__)
 
 
 def _require_unreal_module():
@@ -43,34 +67,546 @@ def _normalize_dir_path(dir_path: str) -> str:
     return normalized
 
 
-def collect_texture_asset_paths(dir_path: str, *, recursive: bool = True) -> List[str]:
-    """Collect texture asset paths under ``dir_path`` using the Asset Registry."""
+def iter_texture_asset_paths(dir_path: str, *, recursive: bool = True) -> Iterator[str]:
+    """Yield texture asset paths under ``dir_path`` one package path at a time.
+
+    Each package path is queried separately, so results start flowing before the whole
+    tree has been enumerated. Paths are sorted within a package path, and package paths
+    are visited in sorted order.
+    """
     unreal = _require_unreal_module()
 
     normalized = _normalize_dir_path(dir_path)
 
     registry = unreal.AssetRegistryHelpers.get_asset_registry()
 
-    # ``ARFilter`` collects assets under the directory. ``Texture`` is the root class and
-    # ``recursive_classes`` ensures that Texture2D, TextureCube, etc. are included.
-    ar_filter = unreal.ARFilter(
-        class_names=["Texture"],
-        package_paths=[normalized],
-        recursive_paths=recursive,
-        recursive_classes=True,
-    )
-
-    asset_data_list = registry.get_assets(ar_filter)
-    textures: List[str] = []
-    for asset_data in asset_data_list:
-        package_name = getattr(asset_data, "package_name", None)
-        asset_name = getattr(asset_data, "asset_name", None)
-        if not package_name or not asset_name:
+    package_paths = [normalized]
+    if recursive:
+        package_paths.extend(sorted(str(p) for p in registry.get_sub_paths(normalized, True)))
+
+    for package_path in package_paths:
+        # ``Texture`` is the root class and ``recursive_classes`` ensures that Texture2D,
+        # TextureCube, etc. are included. Sub paths are visited separately.
+        ar_filter = unreal.ARFilter(
+            class_names=["Texture"],
+            package_paths=[package_path],
+            recursive_paths=False,
+            recursive_classes=True,
+        )
+        textures = set()
+        for asset_data in registry.get_assets(ar_filter):
+            package_name = getattr(asset_data, "package_name", None)
+            asset_name = getattr(asset_data, "asset_name", None)
+            if not package_name or not asset_name:
+                continue
+            textures.add(f"{package_name}.{asset_name}")
+        yield from sorted(textures)
+
+
+def collect_texture_asset_paths(dir_path: str, *, recursive: bool = True) -> List[str]:
+    """Collect texture asset paths under ``dir_path`` using the Asset Registry."""
+    return sorted(set(iter_texture_asset_paths(dir_path, recursive=recursive)))
+
+
+def iter_chunks(items: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    """Split ``items`` lazily into lists of at most ``chunk_size`` elements."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+@dataclass
+class TextureSelection:
+    """Result of :func:`select_textures_by_name`. All lists keep the input order."""
+
+    # Names that passed every check and will be loaded and configured
+    targets: List[str] = field(default_factory=list)
+    # (asset path, validation error) for names that failed suffix validation
+    suffix_errors: List[tuple] = field(default_factory=list)
+    # Names outside every ``run_dir`` entry of the config
+    outside_run_dir: List[str] = field(default_factory=list)
+
+
+def select_textures_by_name(
+    texture_paths: Iterable[str],
+    config_data: Union[Config, CompiledConfig],
+    *,
+    check_run_dir: bool = True,
+) -> TextureSelection:
+    """Partition ``texture_paths`` using only their names, without loading any asset.
+
+    Suffix validation and the ``run_dir`` check both work on the object path reported by
+    the Asset Registry, so textures rejected here never reach ``AssetData.get_asset()``.
+    The ``run_dir`` check is skipped when ``check_run_dir`` is False or the config has no
+    ``run_dir`` entries (an explicit directory run then covers everything it was given).
+    """
+    compiled = config_data if isinstance(config_data, CompiledConfig) else CompiledConfig.compile(config_data)
+    # The run_dir trie is built once per compiled config, so each check costs O(path depth)
+    run_dir_index = compiled.run_dir_index if check_run_dir and len(compiled.run_dir_index) else None
+    matcher = compiled.suffix_matcher
+
+    selection = TextureSelection()
+    for tex_path in texture_paths:
+        if run_dir_index is not None and not run_dir_index.contains(tex_path):
+            selection.outside_run_dir.append(tex_path)
             continue
-        asset_path = f"{package_name}.{asset_name}"
-        textures.append(asset_path)
+        result = matcher.match(tex_path).validation
+        if result.ok:
+            selection.targets.append(tex_path)
+        else:
+            selection.suffix_errors.append((tex_path, result.error))
+    return selection
+
+
+@dataclass
+class DirectoryRunSummary:
+    """Counters accumulated by :func:`run_directory`."""
+
+    found: int = 0
+    configured: int = 0
+    suffix_errors: int = 0
+    outside_run_dir: int = 0
+    chunks: int = 0
+    cancelled: bool = False
+
+
+def run_directory(
+    texture_paths: Iterable[str],
+    config_data: Union[Config, CompiledConfig],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    delete_on_suffix_error: bool = False,
+    show_dialog_on_error: bool = False,
+    check_run_dir: bool = True,
+    manifest: Optional[StateManifest] = None,
+    should_cancel: Optional[Callable[[], bool]] = None,
+    error_report: Optional[ErrorReport] = None,
+    max_in_game_overrides: Optional[Dict[str, int]] = None,
+    workers: int = 1,
+) -> DirectoryRunSummary:
+    """Configure ``texture_paths`` chunk by chunk.
+
+    ``texture_paths`` is consumed lazily, so it can be the generator returned by
+    :func:`iter_texture_asset_paths`. Each chunk is filtered by name, applied in a single
+    transaction and saved before the next chunk is read. ``should_cancel`` is polled
+    between chunks, and the manifest (if any) is saved after every chunk so that a
+    cancelled run keeps its progress.
+
+    Errors are collected into ``error_report`` rather than shown as they happen, so the
+    run never waits on a dialog; the caller shows or writes the summary at the end.
+    ``max_in_game_overrides`` (see :func:`enforce_memory_budgets`) replaces ``max_in_game``
+    for the listed textures. When it is ``None`` and ``budget_action`` is ``"lower"``, the
+    reductions recorded in the budget overrides file are used instead.
+
+    With ``workers`` > 1 the Unreal-free stages of each chunk (suffix validation, settings
+    resolution, content analysis) run on a thread pool, and the chunk is applied and saved
+    in sub-batches of ``texture_pipeline.DEFAULT_APPLY_CHUNK`` while the pool prepares the
+    next ones. All Unreal calls stay on the calling thread.
+    """
+    report = error_report if error_report is not None else ErrorReport()
+    summary = DirectoryRunSummary()
+    for chunk in iter_chunks(texture_paths, chunk_size):
+        if should_cancel is not None and should_cancel():
+            summary.cancelled = True
+            break
+        # Logs of one chunk are written to the output in a single flush
+        with log_batch():
+            selection = _process_chunk(
+                chunk,
+                config_data,
+                summary,
+                report,
+                delete_on_suffix_error=delete_on_suffix_error,
+                show_dialog_on_error=show_dialog_on_error,
+                check_run_dir=check_run_dir,
+                manifest=manifest,
+                max_in_game_overrides=max_in_game_overrides,
+                workers=workers,
+            )
+            if manifest is not None:
+                manifest.save()
+            logger.info(
+                "[chunk %d] %d textures: %d configured, %d suffix errors, %d outside run_dir (total %d)",
+                summary.chunks, len(chunk), len(selection.targets), len(selection.suffix_errors),
+                len(selection.outside_run_dir), summary.found,
+            )
+    return summary
+
+
+def _process_chunk(
+    chunk: List[str],
+    config_data: Union[Config, CompiledConfig],
+    summary: DirectoryRunSummary,
+    report: ErrorReport,
+    *,
+    delete_on_suffix_error: bool,
+    show_dialog_on_error: bool,
+    check_run_dir: bool,
+    manifest: Optional[StateManifest],
+    max_in_game_overrides: Optional[Dict[str, int]],
+    workers: int = 1,
+) -> TextureSelection:
+    """Filter ``chunk`` by name, apply the survivors and add the counts to ``summary``."""
+    summary.chunks += 1
+    summary.found += len(chunk)
+
+    # Reject by name first so that only textures that will be modified (or deleted) get loaded
+    selection = select_textures_by_name(chunk, config_data, check_run_dir=check_run_dir)
+    summary.configured += len(selection.targets)
+    summary.suffix_errors += len(selection.suffix_errors)
+    summary.outside_run_dir += len(selection.outside_run_dir)
+
+    textures = list(selection.targets)
+    if delete_on_suffix_error:
+        # Deletion is handled by apply_texture_property_from_config, which also reports the error
+        textures.extend(tex for tex, _error in selection.suffix_errors)
+    else:
+        for tex, error in selection.suffix_errors:
+            logger.warning("Suffix Error: %s: %s", tex, error)
+            report.add("suffix_error", tex, error)
+    if textures:
+        apply_texture_property_from_config(
+            texture_list=textures,
+            config_data=config_data,
+            delete_on_suffix_error=delete_on_suffix_error,
+            show_dialog_on_error=show_dialog_on_error,
+            manifest=manifest,
+            error_report=report,
+            max_in_game_overrides=max_in_game_overrides,
+            workers=workers,
+        )
+    return selection
+
+
+class TimeSlicedDirectoryRun:
+    """Configure textures a slice at a time from the editor's Slate post-tick callback.
+
+    :func:`run_directory` blocks the editor until every texture is done. This runner instead
+    processes one slice per editor frame and returns, so the editor stays usable while a
+    large directory is reconfigured. The slice size is derived from the measured cost per
+    texture so that a slice fits in ``frame_budget_ms`` (at least one texture per frame;
+    a single slow texture can still exceed the budget). Each slice is applied in one
+    transaction and saved before the frame ends.
+
+    ``progress`` selects how progress is shown:
+
+    - ``"log"`` (default): a line in the Output Log every few seconds; the editor stays
+      fully interactive and the run is cancelled with :meth:`cancel` (or
+      :func:`cancel_time_sliced_runs`).
+    - ``"none"``: no progress output.
+
+    No progress dialog is offered: a ``ScopedSlowTask`` kept open across frames would make
+    the editor modal for the whole run, which is what this runner exists to avoid.
+
+    Cancellation is checked between slices, i.e. between assets of consecutive frames. The
+    manifest (if any) is saved every ``manifest_save_interval`` seconds and when the run
+    ends. ``on_finished`` receives the :class:`DirectoryRunSummary` once the run ends,
+    whether it completed, was cancelled or stopped on an unexpected error.
+    """
+
+    PROGRESS_MODES = ("log", "none")
+    # Used to size the first slice, before any texture has been measured
+    INITIAL_SECONDS_PER_TEXTURE = 0.002
+    PROGRESS_LOG_INTERVAL = 2.0
+
+    def __init__(
+        self,
+        texture_paths: Iterable[str],
+        config_data: Union[Config, CompiledConfig],
+        *,
+        frame_budget_ms: float = DEFAULT_FRAME_BUDGET_MS,
+        max_slice_size: int = DEFAULT_CHUNK_SIZE,
+        progress: str = "log",
+        delete_on_suffix_error: bool = False,
+        check_run_dir: bool = True,
+        manifest: Optional[StateManifest] = None,
+        manifest_save_interval: float = 5.0,
+        error_report: Optional[ErrorReport] = None,
+        max_in_game_overrides: Optional[Dict[str, int]] = None,
+        on_finished: Optional[Callable[[DirectoryRunSummary], None]] = None,
+    ) -> None:
+        if frame_budget_ms <= 0:
+            raise ValueError("frame_budget_ms must be positive")
+        if max_slice_size <= 0:
+            raise ValueError("max_slice_size must be positive")
+        if progress not in self.PROGRESS_MODES:
+            raise ValueError(f"progress must be one of {self.PROGRESS_MODES}: {progress!r}")
+        self.config_data = config_data if isinstance(config_data, CompiledConfig) else CompiledConfig.compile(config_data)
+        self.frame_budget = frame_budget_ms / 1000.0
+        self.max_slice_size = max_slice_size
+        self.progress = progress
+        self.delete_on_suffix_error = delete_on_suffix_error
+        self.check_run_dir = check_run_dir
+        self.manifest = manifest
+        self.manifest_save_interval = manifest_save_interval
+        self.error_report = error_report if error_report is not None else ErrorReport()
+        self.max_in_game_overrides = max_in_game_overrides
+        self.on_finished = on_finished
+
+        self.summary = DirectoryRunSummary()
+        # 0 when the input is a lazy iterator of unknown length
+        self.total = len(texture_paths) if hasattr(texture_paths, "__len__") else 0
+        self.seconds_per_texture = self.INITIAL_SECONDS_PER_TEXTURE
+        self._iterator = iter(texture_paths)
+        self._handle = None
+        self._cancel_requested = False
+        self._finished = False
+        self._last_progress_log = 0.0
+        self._last_manifest_save = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._handle is not None
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    def start(self) -> "TimeSlicedDirectoryRun":
+        """Register the tick callback; processing starts on the next editor frame."""
+        if self._handle is not None or self._finished:
+            raise RuntimeError("the run has already been started")
+        unreal = _require_unreal_module()
+        now = time.perf_counter()
+        self._last_progress_log = self._last_manifest_save = now
+        self._handle = unreal.register_slate_post_tick_callback(self._on_tick)
+        _active_runs.add(self)
+        logger.info("Configuring %s textures in the background (%.1f ms per frame)",
+                    self.total or "all", self.frame_budget * 1000.0)
+        return self
+
+    def cancel(self) -> None:
+        """Stop before the next slice. Textures already applied stay applied."""
+        self._cancel_requested = True
+
+    def next_slice_size(self) -> int:
+        """Number of textures that is expected to fit in the frame budget."""
+        return max(1, min(self.max_slice_size, int(self.frame_budget / max(self.seconds_per_texture, 1e-6))))
+
+    def _on_tick(self, delta_seconds: float) -> None:
+        if self._finished:
+            return
+        try:
+            self.tick()
+        except Exception:
+            logger.error("Background texture configuration stopped on an error:\n%s", traceback.format_exc())
+            self.summary.cancelled = True
+            self._finish()
+
+    def tick(self) -> None:
+        """Process one slice (called once per editor frame)."""
+        if self._cancel_requested:
+            self.summary.cancelled = True
+            self._finish()
+            return
+        chunk = list(itertools.islice(self._iterator, self.next_slice_size()))
+        if not chunk:
+            self._finish()
+            return
+
+        start = time.perf_counter()
+        with log_batch():
+            _process_chunk(
+                chunk,
+                self.config_data,
+                self.summary,
+                self.error_report,
+                delete_on_suffix_error=self.delete_on_suffix_error,
+                show_dialog_on_error=False,
+                check_run_dir=self.check_run_dir,
+                manifest=self.manifest,
+                max_in_game_overrides=self.max_in_game_overrides,
+            )
+        now = time.perf_counter()
+        # Exponential moving average, so that one slow texture does not shrink slices for long
+        measured = (now - start) / len(chunk)
+        self.seconds_per_texture = 0.7 * self.seconds_per_texture + 0.3 * measured
+
+        if self.manifest is not None and now - self._last_manifest_save >= self.manifest_save_interval:
+            self.manifest.save()
+            self._last_manifest_save = now
+        self._report_progress(now)
+
+    def _report_progress(self, now: float) -> None:
+        if self.progress == "log" and now - self._last_progress_log >= self.PROGRESS_LOG_INTERVAL:
+            logger.info("%s", self._progress_text())
+            self._last_progress_log = now
+
+    def _progress_text(self) -> str:
+        if self.total:
+            return (f"Configuring textures: {self.summary.found}/{self.total} "
+                    f"({100.0 * self.summary.found / self.total:.0f}%)")
+        return f"Configuring textures: {self.summary.found}"
+
+    def _finish(self) -> None:
+        if self._finished:
+            return
+        self._finished = True
+        if self._handle is not None:
+            _require_unreal_module().unregister_slate_post_tick_callback(self._handle)
+            self._handle = None
+        _active_runs.discard(self)
+        if self.manifest is not None:
+            self.manifest.save()
+        summary = self.summary
+        logger.info(
+            "%s: %d textures in %d slices (%d configured, %d suffix errors, %d outside run_dir)",
+            "Cancelled" if summary.cancelled else "Finished", summary.found, summary.chunks,
+            summary.configured, summary.suffix_errors, summary.outside_run_dir,
+        )
+        if self.on_finished is not None:
+            self.on_finished(summary)
+
+
+# Runs registered with the editor; also keeps them alive while only the tick callback refers to them
+_active_runs: Set[TimeSlicedDirectoryRun] = set()
+
+
+def start_time_sliced_run(
+    texture_paths: Iterable[str],
+    config_data: Union[Config, CompiledConfig],
+    **kwargs,
+) -> TimeSlicedDirectoryRun:
+    """Create and start a :class:`TimeSlicedDirectoryRun` (keyword arguments are passed through)."""
+    return TimeSlicedDirectoryRun(texture_paths, config_data, **kwargs).start()
+
+
+def cancel_time_sliced_runs() -> int:
+    """Cancel every background run before its next slice. Returns the number of runs."""
+    runs = list(_active_runs)
+    for run in runs:
+        run.cancel()
+    return len(runs)
 
-    return sorted(set(textures))
+
+def estimate_directory_memory(
+    texture_paths: Iterable[str],
+    config_data: Union[Config, CompiledConfig],
+    *,
+    check_run_dir: bool = True,
+    workers: int = 1,
+    max_in_game_overrides: Optional[Dict[str, int]] = None,
+) -> MemoryReport:
+    """Estimate the memory every valid texture in ``texture_paths`` will use once configured.
+
+    Settings are resolved exactly as :func:`run_directory` would apply them (including
+    ``max_in_game_overrides``, e.g. reductions recorded by an earlier run), and the source
+    resolution comes from the import source's header (no texture is loaded or decoded).
+    Source paths are looked up in the Asset Registry on the calling thread; with ``workers``
+    > 1 the header reads run on a thread pool.
+    """
+    compiled = config_data if isinstance(config_data, CompiledConfig) else CompiledConfig.compile(config_data)
+    selection = select_textures_by_name(texture_paths, compiled, check_run_dir=check_run_dir)
+    get_source_file_path = _unreal_adapter().get_source_file_path
+    sources = [(tex_path, get_source_file_path(tex_path)) for tex_path in selection.targets]
+
+    report = MemoryReport()
+    with PreparePool(workers) as pool:
+        for (tex_path, source), info in zip(sources, pool.map_ordered(_probe_source, sources)):
+            if source is not None and info is None:
+                logger.debug("Cannot probe source image: %s (%s)", tex_path, source)
+            match = compiled.suffix_matcher.match(tex_path)
+            params, _rules = resolve_texture_settings(compiled, tex_path, match.suffixes, match.tokens)
+            if max_in_game_overrides and tex_path in max_in_game_overrides:
+                params = params.replace(max_in_game=max_in_game_overrides[tex_path])
+            with stage_timer.span("estimate", tex_path):
+                estimate = estimate_from_source(
+                    tex_path,
+                    params,
+                    info,
+                    texture_type=next((s for s in match.suffixes if s in compiled.config.texture_config), None),
+                    run_dir=compiled.run_dir_index.match(tex_path),
+                )
+            if estimate is None:
+                report.unknown.append(tex_path)
+            else:
+                report.add(estimate)
+    return report
+
+
+def _probe_source(item: tuple) -> Optional[ImageInfo]:
+    """Read the header of ``(asset path, source file)``; runs on a pool thread.
+
+    This is the only place that probes import sources; the Unreal side only resolves the
+    source path (``get_source_file_path``) so the header read can run off the main thread.
+    """
+    tex_path, source = item
+    if source is None:
+        return None
+    with stage_timer.span("probe", tex_path):
+        return try_probe_image(source)
+
+
+def enforce_memory_budgets(
+    report: MemoryReport,
+    config: Config,
+    error_report: Optional[ErrorReport] = None,
+) -> Dict[str, int]:
+    """Warn about texture groups over their ``texture_group_budgets`` entry.
+
+    With ``budget_action`` set to ``"lower"`` the largest textures of each such group get a
+    smaller ``max_in_game``; the returned mapping (asset path -> new size) is meant for
+    ``run_directory(max_in_game_overrides=...)``. ``report`` is updated to the reduced sizes.
+    The caller records the mapping in :class:`budget_overrides.BudgetOverrides` so that later
+    imports and partial runs keep the reduced sizes.
+    """
+    budgets = config.texture_group_budget_bytes()
+    overruns = report.check_budgets(budgets)
+    for overrun in overruns:
+        logger.warning("Texture memory budget exceeded: %s", overrun.format())
+        if error_report is not None:
+            error_report.add("memory_budget", overrun.group.name, overrun.format())
+    if not overruns or config.budget_action != "lower":
+        return {}
+
+    reductions = plan_budget_reductions(report, budgets)
+    for overrun in overruns:
+        total = report.by_group().get(overrun.group.name, 0)
+        logger.info(
+            "Lowered max_in_game for %d textures; %s now %.1f MiB (budget %.1f MiB)",
+            sum(1 for p in reductions if report.estimates[p].texture_group == overrun.group),
+            overrun.group.name, total / MIB, overrun.budget_bytes / MIB,
+        )
+    return reductions
+
+
+class _CancelOnInterrupt:
+    """Turn the first Ctrl+C into a cancel request that is honoured between chunks.
+
+    A second Ctrl+C raises ``KeyboardInterrupt`` as usual. Outside the main thread (where
+    signal handlers cannot be installed) this is a no-op.
+    """
+
+    def __init__(self) -> None:
+        self.requested = False
+        self._previous = None
+        self._installed = False
+
+    def __call__(self) -> bool:
+        return self.requested
+
+    def _handle(self, signum, frame) -> None:
+        if self.requested:
+            raise KeyboardInterrupt
+        self.requested = True
+        logger.warning("Cancel requested; stopping after the current chunk (press Ctrl+C again to abort)")
+
+    def __enter__(self) -> "_CancelOnInterrupt":
+        try:
+            self._previous = signal.signal(signal.SIGINT, self._handle)
+            self._installed = True
+        except ValueError:
+            self._installed = False
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._installed:
+            signal.signal(signal.SIGINT, self._previous)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -106,30 +642,209 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="サブディレクトリを探索せず、直下のテクスチャのみを対象にします。",
     )
+    parser.add_argument(
+        "--ignore-run-dir",
+        action="store_true",
+        help="Config の run_dir に含まれないテクスチャも対象にします。",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"1 回のトランザクション・保存でまとめて処理するテクスチャ数（既定: {DEFAULT_CHUNK_SIZE}）。",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "サフィックス検証・設定の解決・ソース画像の読み取りを先行実行するスレッド数（既定: 1 = 逐次）。\n"
+            "2 以上では反映・保存を小分けにし、その間に次のテクスチャを準備します。\n"
+            "--background とは併用できません。"
+        ),
+    )
+    parser.add_argument(
+        "--background",
+        action="store_true",
+        help=(
+            "エディタをブロックせず、毎フレーム --frame-budget-ms の範囲で少しずつ処理します。\n"
+            "コマンドはすぐに戻り、進捗は Output Log に出力されます。\n"
+            "中断: texture_directory_configurator.cancel_time_sliced_runs()"
+        ),
+    )
+    parser.add_argument(
+        "--frame-budget-ms",
+        type=float,
+        default=DEFAULT_FRAME_BUDGET_MS,
+        help=f"--background で 1 フレームに使う処理時間の目安（ミリ秒、既定: {DEFAULT_FRAME_BUDGET_MS:g}）。",
+    )
+    parser.add_argument(
+        "--error-report",
+        default=None,
+        help="エラーの一覧を JSON で書き出すパス（エラーが無い場合は書き出さない）。",
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="count",
+        default=0,
+        help="テクスチャごとの詳細ログ（DEBUG）を出力します。",
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="count",
+        default=0,
+        help="警告・エラーのみ出力します（-qq でエラーのみ）。",
+    )
+    parser.add_argument(
+        "--timing",
+        default=None,
+        help="段階別の処理時間（テクスチャ別・p50/p95/max）を JSON で書き出すパス。",
+    )
+    parser.add_argument(
+        "--memory-report",
+        default=None,
+        help=(
+            "適用後のテクスチャメモリの見積もり（run_dir / TextureGroup / 種類別の集計とテクスチャ別）を\n"
+            "JSON で書き出すパス。Config に texture_group_budgets があれば指定が無くても見積もります。"
+        ),
+    )
+    parser.add_argument(
+        "--reset-budget-overrides",
+        action="store_true",
+        help=(
+            "budget_action: lower で記録した max_in_game の縮小を破棄してから実行します\n"
+            "（{ProjectDir}/Saved/TexNamingImporter/budget_overrides.json）。"
+        ),
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "前回実行時から変更の無いテクスチャをスキップします。\n"
+            "状態は {ProjectDir}/Saved/TexNamingImporter/manifest.json に保存されます。"
+        ),
+    )
+    parser.add_argument(
+        "--manifest",
+        default=None,
+        help="--incremental で使うマニフェストのパス（既定: {ProjectDir}/Saved/TexNamingImporter/manifest.json）。",
+    )
     return parser
 
 
 def main(argv: Iterable[str]) -> int:
     parser = build_parser()
     args = parser.parse_args(list(argv))
+    if args.chunk_size <= 0:
+        parser.error("--chunk-size must be positive")
+    if args.jobs <= 0:
+        parser.error("--jobs must be positive")
+    if args.frame_budget_ms <= 0:
+        parser.error("--frame-budget-ms must be positive")
+    if args.background and args.jobs > 1:
+        # Slices are sized to fit in one frame, too small for a prepare pool to pay off
+        parser.error("--jobs cannot be combined with --background")
+    set_verbosity(verbosity_from_args(args.verbose, args.quiet))
+    if args.timing:
+        stage_timer.enable()
+
+    config_data = load_compiled_config(args.config_path)
+    textures = iter_texture_asset_paths(args.dir_path, recursive=not args.non_recursive)
+
+    errors = ErrorReport()
+    budget_store = None
+    if args.reset_budget_overrides or config_data.config.budget_action == "lower":
+        budget_store = BudgetOverrides.load(_unreal_adapter().default_budget_overrides_path())
+        if args.reset_budget_overrides:
+            logger.info("Discarding %d recorded budget reductions", len(budget_store))
+            budget_store.clear()
+            budget_store.save()
+    # Reductions recorded by earlier runs stay in effect while budget_action is "lower"
+    max_in_game_overrides: Dict[str, int] = {}
+    if budget_store is not None and config_data.config.budget_action == "lower":
+        max_in_game_overrides = dict(budget_store.sizes)
+    if args.memory_report or config_data.config.texture_group_budgets:
+        # Budgets apply to the whole run, so estimate everything before the first chunk is applied
+        textures = collect_texture_asset_paths(args.dir_path, recursive=not args.non_recursive)
+        memory = estimate_directory_memory(textures, config_data, check_run_dir=not args.ignore_run_dir,
+                                           workers=args.jobs, max_in_game_overrides=max_in_game_overrides)
+        reductions = enforce_memory_budgets(memory, config_data.config, errors)
+        if reductions and budget_store is not None:
+            budget_store.merge(reductions)
+            budget_store.save()
+            logger.info("Recorded %d budget reductions in %s", len(budget_store), budget_store.path)
+            max_in_game_overrides = dict(budget_store.sizes)
+        logger.info("%s", memory.format_summary())
+        if args.memory_report:
+            memory.write(args.memory_report)
+            logger.info("Memory report written to %s", args.memory_report)
+
+    manifest = None
+    if args.incremental:
+        manifest = StateManifest.load(args.manifest or _unreal_adapter().default_manifest_path())
+        logger.info("Incremental mode: %d entries in %s", len(manifest), manifest.path)
 
-    config_data = Config.load(args.config_path)
-    textures = collect_texture_asset_paths(args.dir_path, recursive=not args.non_recursive)
+    def finish(summary: Optional[DirectoryRunSummary]) -> None:
+        if args.timing:
+            stage_timer.dump(args.timing)
+            logger.info("Timing written to %s", args.timing)
+        if len(errors):
+            if args.error_report:
+                errors.write(args.error_report)
+                logger.info("Error report written to %s", args.error_report)
+            # Shown once, after all chunks have been processed
+            if args.dialog:
+                show_error_summary_dialog(errors, args.error_report)
+        if summary is not None and summary.found == 0 and not summary.cancelled:
+            logger.info("No textures found under %s", args.dir_path)
 
-    if not textures:
-        print(f"No textures found under {args.dir_path}")
+    if args.background:
+        if not isinstance(textures, list):
+            # A known total lets the progress show a percentage
+            textures = collect_texture_asset_paths(args.dir_path, recursive=not args.non_recursive)
+        # Returns right away; finish() runs from the tick callback once the last slice is done
+        start_time_sliced_run(
+            textures,
+            config_data,
+            frame_budget_ms=args.frame_budget_ms,
+            max_slice_size=args.chunk_size,
+            delete_on_suffix_error=args.delete,
+            check_run_dir=not args.ignore_run_dir,
+            manifest=manifest,
+            error_report=errors,
+            max_in_game_overrides=max_in_game_overrides,
+            on_finished=finish,
+        )
         return 0
 
-    print(f"Found {len(textures)} textures under {args.dir_path}")
-    for tex in textures:
-        print(f"  - {tex}")
+    summary = None
+    try:
+        with _CancelOnInterrupt() as cancel:
+            summary = run_directory(
+                textures,
+                config_data,
+                chunk_size=args.chunk_size,
+                delete_on_suffix_error=args.delete,
+                show_dialog_on_error=args.dialog,
+                check_run_dir=not args.ignore_run_dir,
+                manifest=manifest,
+                should_cancel=cancel,
+                error_report=errors,
+                max_in_game_overrides=max_in_game_overrides,
+                workers=args.jobs,
+            )
+    finally:
+        finish(summary)
+
+    if summary.found == 0 and not summary.cancelled:
+        return 0
 
-    return apply_texture_property_from_config(
-        texture_list=textures,
-        config_data=config_data,
-        delete_on_suffix_error=args.delete,
-        show_dialog_on_error=args.dialog,
+    logger.info(
+        "%s: %d textures under %s in %d chunks (%d configured, %d suffix errors, %d outside run_dir)",
+        "Cancelled" if summary.cancelled else "Finished", summary.found, args.dir_path, summary.chunks,
+        summary.configured, summary.suffix_errors, summary.outside_run_dir,
     )
+    return 0
 
 
 if __name__ == "__main__":  # pragma: no cover - CLI entry
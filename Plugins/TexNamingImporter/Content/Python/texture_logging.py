@@ -0,0 +1,162 @@
+"""
+TexNamingImporter 用のレベル付き・バッファリングされたロガー。
+
+Editor 内では print 1 回ごとに Output Log への書き込みが発生し、大量のテクスチャを
+処理するとそれだけで遅くなるため、バッチ処理中のログはバッファに溜めて
+バッチ終了時に 1 回だけ書き出す。
+
+    from texture_logging import get_logger, log_batch
+    logger = get_logger(__name__)
+    with log_batch():
+        logger.debug("per texture detail")   # 既定では出力されない
+        logger.info("one line summary")
+
+レベルは set_verbosity() か環境変数 TEXNAMING_LOG_LEVEL（DEBUG / INFO / WARNING / ERROR）で変更する。
+既定は INFO（バッチごとの 1 行サマリーと警告・エラーのみ）。
+
+バッファして stdout へまとめて書き出すのは DEBUG / INFO だけ。WARNING 以上は書き出し時に
+unreal.log_warning / unreal.log_error へ渡し、Output Log の重大度・色・Message Log・
+コマンドレットのエラー数を保つ（unreal が import されていない環境では sys.stderr へ書く）。
+"""
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import sys
+from typing import Iterator, List, Optional, TextIO, Tuple, Union
+
+LOGGER_NAME = "TexNamingImporter"
+LEVEL_ENV_VAR = "TEXNAMING_LOG_LEVEL"
+DEFAULT_LEVEL = logging.INFO
+# バッチ中でもこの件数を超えたら途中で書き出す（メモリを一定に保つため）
+DEFAULT_CAPACITY = 5000
+
+
+def _unreal_log_sink(levelno: int, text: str) -> bool:
+    """WARNING 以上を unreal の重大度付きログへ渡す。unreal が読み込まれていなければ False。"""
+    unreal = sys.modules.get("unreal")
+    if unreal is None:
+        return False
+    (unreal.log_error if levelno >= logging.ERROR else unreal.log_warning)(text)
+    return True
+
+
+class BatchBufferHandler(logging.Handler):
+    """
+    整形済みのログ行を溜め、flush() でまとめて書き出すハンドラ。
+
+    log_batch() の外では 1 件ごとに書き出す（単発の実行でもログがすぐ見えるように）。
+    DEBUG / INFO の連続した行は stream（省略時は書き出し時点の sys.stdout）へ 1 回で書き、
+    WARNING 以上は 1 件ずつ unreal.log_warning / log_error（unreal が無ければ error_stream、
+    省略時は sys.stderr）へ渡す。行の順序は保たれる。
+    """
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        capacity: int = DEFAULT_CAPACITY,
+        *,
+        error_stream: Optional[TextIO] = None,
+    ):
+        super().__init__()
+        self._stream = stream
+        self._error_stream = error_stream
+        self.capacity = capacity
+        self.buffer: List[Tuple[int, str]] = []
+        self.batch_depth = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.buffer.append((record.levelno, self.format(record)))
+        except Exception:
+            self.handleError(record)
+            return
+        if self.batch_depth == 0 or len(self.buffer) >= self.capacity:
+            self.flush()
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if not self.buffer:
+                return
+            records, self.buffer = self.buffer, []
+            pending: List[str] = []
+            for levelno, text in records:
+                if levelno < logging.WARNING:
+                    pending.append(text)
+                    continue
+                self._write(self._stream or sys.stdout, pending)
+                pending = []
+                if self._error_stream is not None or not _unreal_log_sink(levelno, text):
+                    self._write(self._error_stream or sys.stderr, [text])
+            self._write(self._stream or sys.stdout, pending)
+        finally:
+            self.release()
+
+    @staticmethod
+    def _write(stream: TextIO, lines: List[str]) -> None:
+        if not lines:
+            return
+        stream.write("\n".join(lines) + "\n")
+        stream.flush()
+
+
+def _level_from_env() -> int:
+    name = os.environ.get(LEVEL_ENV_VAR, "").strip().upper()
+    level = logging.getLevelName(name) if name else DEFAULT_LEVEL
+    return level if isinstance(level, int) else DEFAULT_LEVEL
+
+
+_handler = BatchBufferHandler()
+_handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+
+_root = logging.getLogger(LOGGER_NAME)
+_root.addHandler(_handler)
+_root.setLevel(_level_from_env())
+# Unreal 側のルートロガー設定に依存しないよう伝播させない
+_root.propagate = False
+
+
+def get_logger(name: Optional[str] = None) -> logging.Logger:
+    """TexNamingImporter 配下のロガーを返す。name はモジュール名（__name__）を想定。"""
+    if not name or name == LOGGER_NAME:
+        return _root
+    return _root.getChild(name.rsplit(".", 1)[-1])
+
+
+def set_verbosity(level: Union[int, str]) -> None:
+    """出力レベルを変更する（例: "DEBUG", logging.WARNING）。"""
+    if isinstance(level, str):
+        resolved = logging.getLevelName(level.strip().upper())
+        if not isinstance(resolved, int):
+            raise ValueError(f"unknown log level: {level!r}")
+        level = resolved
+    _root.setLevel(level)
+
+
+def get_verbosity() -> int:
+    return _root.level
+
+
+def verbosity_from_args(verbose: int = 0, quiet: int = 0) -> int:
+    """CLI の -v / -q の回数からレベルを決める（-v: DEBUG, -q: WARNING, -qq: ERROR）。"""
+    if verbose:
+        return logging.DEBUG
+    if quiet >= 2:
+        return logging.ERROR
+    if quiet == 1:
+        return logging.WARNING
+    return _level_from_env()
+
+
+@contextlib.contextmanager
+def log_batch() -> Iterator[None]:
+    """ブロック内のログを溜め、抜けるときに 1 回で書き出す（入れ子可）。"""
+    _handler.batch_depth += 1
+    try:
+        yield
+    finally:
+        _handler.batch_depth -= 1
+        if _handler.batch_depth == 0:
+            _handler.flush()
@@ -0,0 +1,288 @@
+"""
+ソース画像ツリーの命名規則をエディタ外で一括検査する CLI。
+
+外注先から納品されたソースアート（PNG / TGA / EXR / PSD など）をインポート前に検査し、
+サフィックスエラーのファイルと、正常なファイルが解決されるテクスチャ種類・最終設定を
+JSONL で出力する。``unreal`` には依存せず、検査はプロセスプールで並列に行う。
+--probe を付けるとソース画像のヘッダーから解像度・チャンネル情報も出力する（デコードはしない）。
+
+実行例（Content/Python 直下で）:
+    python texture_naming_audit.py Config.json D:/Vendor/Delivery --jobs 8 --output audit.jsonl
+    python texture_naming_audit.py Config.json D:/Vendor/Delivery --failures-only
+    python texture_naming_audit.py Config.json D:/Vendor/Delivery --probe
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from token_rules import SUBUV_RULE_NAME
+from image_probe import ImageProbeError, probe_image
+from config import CompiledConfig, ResolvedTextureParams, load_compiled_config
+
+DEFAULT_EXTENSIONS = (".png", ".tga", ".exr", ".psd")
+# ワーカーへ 1 回に渡すファイル数（プロセス間通信の回数を減らすため）
+DEFAULT_BATCH_SIZE = 512
+
+# ワーカープロセスごとに 1 回だけ読み込む Config
+_worker_config: Optional[CompiledConfig] = None
+_worker_probe = False
+# 最終設定 → to_dict() の結果。組み合わせは少数なので使い回す
+_params_dict_cache: Dict[ResolvedTextureParams, dict] = {}
+
+
+def iter_source_files(roots: Iterable[str], extensions: Sequence[str] = DEFAULT_EXTENSIONS) -> Iterator[str]:
+    """roots 以下を再帰的に走査し、拡張子が一致するファイルのパスを順に返す（大小文字無視）。"""
+    exts = tuple(e.lower() if e.startswith(".") else f".{e.lower()}" for e in extensions)
+    for root in roots:
+        if os.path.isfile(root):
+            if root.lower().endswith(exts):
+                yield root
+            continue
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError as e:
+                print(f"[WARN] cannot read directory {current}: {e}", file=sys.stderr)
+                continue
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.lower().endswith(exts):
+                    yield entry.path
+            # 名前順に処理されるよう逆順で積む
+            stack.extend(reversed(subdirs))
+
+
+def _probe_record(path: str) -> Dict[str, object]:
+    try:
+        return probe_image(path).to_dict()
+    except (OSError, ImageProbeError) as e:
+        return {"error": str(e)}
+
+
+def audit_file(path: str, compiled: CompiledConfig, *, probe: bool = False) -> Dict[str, object]:
+    """
+    1 ファイルのファイル名を検査し、JSON 化できる辞書を返す。
+
+    Returns:
+        dict: path / ok / suffixes に加え、
+            - 失敗時: error, failed_row
+            - 成功時: texture_type, subuv, params（最終設定。to_dict() 形式）、
+              token_rules（SubUV 以外も含む一致したトークン規則の名前。一致が無ければ省略）
+            - probe=True 時: source（ImageInfo.to_dict()、読めなければ {"error": ...}）
+    """
+    match = compiled.suffix_matcher.match(path)
+    result = match.validation
+    record: Dict[str, object] = {"path": path, "ok": result.ok, "suffixes": match.suffixes}
+    if probe:
+        record["source"] = _probe_record(path)
+    if not result.ok:
+        record["error"] = result.error
+        record["failed_row"] = result.failed_row_index
+        return record
+
+    config = compiled.config
+    # ソースツリーのパスは /Game 配下ではないため directory_overrides は適用しない
+    rules = compiled.token_rules.match(match.tokens)
+    params = compiled.param_resolver.resolve(match.suffixes, rules=rules)
+    record["texture_type"] = next((s for s in match.suffixes if s in config.texture_config), None)
+    record["subuv"] = any(rule.name == SUBUV_RULE_NAME for rule in rules)
+    if rules:
+        record["token_rules"] = [rule.name for rule in rules]
+    params_dict = _params_dict_cache.get(params)
+    if params_dict is None:
+        params_dict = _params_dict_cache[params] = params.to_dict()
+    record["params"] = params_dict
+    return record
+
+
+def _init_worker(config_path: str, probe: bool = False) -> None:
+    global _worker_config, _worker_probe
+    _worker_config = load_compiled_config(config_path)
+    _worker_probe = probe
+
+
+def _audit_batch(paths: List[str]) -> List[Dict[str, object]]:
+    assert _worker_config is not None, "worker is not initialized"
+    return [audit_file(p, _worker_config, probe=_worker_probe) for p in paths]
+
+
+def _audit_batch_lines(paths: List[str]) -> List[Tuple[bool, str]]:
+    """JSON 化もワーカー側で行い、(ok, JSONL の 1 行) を返す。"""
+    return [(bool(r["ok"]), json.dumps(r, ensure_ascii=False)) for r in _audit_batch(paths)]
+
+
+def _batched(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    iterator = iter(items)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _run_batches(
+    paths: Iterable[str],
+    config_path: str,
+    batch_fn: Callable[[List[str]], list],
+    jobs: int,
+    batch_size: int,
+    probe: bool = False,
+) -> Iterator:
+    if jobs == 1:
+        _init_worker(str(config_path), probe)
+        for batch in _batched(paths, batch_size):
+            yield from batch_fn(batch)
+        return
+
+    # multiprocessing 一式は並列実行時だけ読み込む（jobs=1 やワーカー側の import を軽くする）
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = jobs if jobs > 0 else (os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(str(config_path), probe)) as pool:
+        # map は入力を先読みするため、一度に投入するバッチ数を抑えてメモリを一定に保つ
+        batches = _batched(paths, batch_size)
+        while True:
+            window = list(itertools.islice(batches, workers * 4))
+            if not window:
+                return
+            for results in pool.map(batch_fn, window):
+                yield from results
+
+
+def audit_paths(
+    paths: Iterable[str],
+    config_path: str,
+    *,
+    jobs: int = 0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    probe: bool = False,
+) -> Iterator[Dict[str, object]]:
+    """
+    paths を検査し、入力順に結果（audit_file() の辞書）を返すジェネレータ。
+
+    Args:
+        paths: 検査するファイルパス（遅延評価される Iterable でよい）。
+        config_path: Config.json のパス。
+        jobs: ワーカープロセス数。0 なら CPU 数、1 ならプロセスを使わずに実行する。
+        batch_size: 1 ワーカー呼び出しあたりのファイル数。
+        probe: True ならソース画像のヘッダー情報も付ける。
+    """
+    return _run_batches(paths, config_path, _audit_batch, jobs, batch_size, probe)
+
+
+def write_report(records: Iterable[Dict[str, object]], out: TextIO, *, failures_only: bool = False) -> Dict[str, int]:
+    """結果を JSONL として書き出し、件数の集計を返す。"""
+    lines = ((bool(r["ok"]), json.dumps(r, ensure_ascii=False)) for r in records)
+    return _write_lines(lines, out, failures_only=failures_only)
+
+
+def _write_lines(lines: Iterable[Tuple[bool, str]], out: TextIO, *, failures_only: bool) -> Dict[str, int]:
+    counts = {"total": 0, "ok": 0, "failed": 0}
+    for ok, line in lines:
+        counts["total"] += 1
+        if ok:
+            counts["ok"] += 1
+            if failures_only:
+                continue
+        else:
+            counts["failed"] += 1
+        out.write(line)
+        out.write("\n")
+    return counts
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="texture_naming_audit",
+        description=(
+            "ソース画像の命名規則チェック CLI（Unreal 不要）\n"
+            "source_dir 以下の画像ファイル名を Config.json で検査し、結果を JSONL で出力します。"
+        ),
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "config_path",
+        help="Config の JSON ファイルパス。例: {ProjectDir}/Config/TexNamingImporter/Config.json",
+    )
+    parser.add_argument(
+        "source_dir",
+        nargs="+",
+        help="検査するディレクトリ（またはファイル）。複数指定可。",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="JSONL の出力先。省略時は標準出力。",
+    )
+    parser.add_argument(
+        "--failures-only",
+        action="store_true",
+        help="サフィックスエラーのファイルのみ出力します。",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="ワーカープロセス数（既定: CPU 数。1 でプロセスを使わずに実行）。",
+    )
+    parser.add_argument(
+        "--probe",
+        action="store_true",
+        help="ソース画像のヘッダーから解像度・ビット深度・チャンネル数・アルファ有無も出力します。",
+    )
+    parser.add_argument(
+        "--extensions",
+        default=",".join(e.lstrip(".") for e in DEFAULT_EXTENSIONS),
+        help="対象とする拡張子（カンマ区切り）。既定: png,tga,exr,psd",
+    )
+    return parser
+
+
+def main(argv: Iterable[str]) -> int:
+    parser = build_parser()
+    args = parser.parse_args(list(argv))
+    if args.jobs < 0:
+        parser.error("--jobs must not be negative")
+
+    # 設定ファイルの不備はワーカー起動前にここで検出する
+    load_compiled_config(args.config_path)
+
+    extensions = [e.strip() for e in args.extensions.split(",") if e.strip()]
+    paths = iter_source_files(args.source_dir, extensions)
+    # CLI では JSON 化までワーカーで行い、メインプロセスは書き出しのみ行う
+    lines = _run_batches(paths, args.config_path, _audit_batch_lines, args.jobs, DEFAULT_BATCH_SIZE, args.probe)
+
+    start = time.perf_counter()
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="\n") as out:
+            counts = _write_lines(lines, out, failures_only=args.failures_only)
+    else:
+        counts = _write_lines(lines, sys.stdout, failures_only=args.failures_only)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"Audited {counts['total']} files in {elapsed:.2f}s: {counts['ok']} ok, {counts['failed']} failed",
+        file=sys.stderr,
+    )
+    return 1 if counts["failed"] else 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main(sys.argv[1:]))
+    except SystemExit:
+        raise
+    except Exception as e:
+        print(f"[ERROR] {e}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,103 @@
+"""
+unreal を呼ばない段階（トークン分割・サフィックス検証・最終設定の解決・ハッシュ・ヘッダー読み取り・
+画素解析）をスレッドプールで先行実行し、結果を入力順にメインスレッドへ渡す。
+
+unreal API はエディタのメインスレッドからしか呼べないため、ワーカーでは ``unreal`` に触れる処理・
+ログ出力を行わない。メインスレッドは準備済みの結果を有界キューから順に受け取り、
+TextureConfigurator.apply_many / 保存 / 削除だけを行う。キューの長さを制限しているので、
+準備が反映より速くても先読みは max_pending 件で止まり、メモリは一定に保たれる。
+
+Editor 内の sys.executable はエディタ本体のため、プロセスプールは使わない
+（エディタ外の一括検査は texture_naming_audit がプロセスプールを使う）。
+I/O・Pillow のデコード・NumPy の演算は GIL を解放するので、スレッドでも反映と重ねられる。
+
+workers <= 1 ではプールを作らず呼び出し元のスレッドでその場で実行する（従来の逐次処理と同じ）。
+"""
+from __future__ import annotations
+
+import itertools
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# 並列実行時に、メインスレッドへ渡す前に準備しておく件数（ワーカー 1 つあたり）
+DEFAULT_PENDING_PER_WORKER = 16
+# 並列実行時に 1 回の apply_many（1 トランザクション・1 回の保存）で反映する件数。
+# 反映中もワーカーは次の準備を続けるため、小さく区切るほど準備と反映が重なる
+DEFAULT_APPLY_CHUNK = 64
+
+
+def _completed(fn: Callable[..., R], *args) -> "Future[R]":
+    """fn をその場で実行し、結果（または例外）を持つ完了済みの Future を返す。"""
+    future: "Future[R]" = Future()
+    try:
+        future.set_result(fn(*args))
+    except BaseException as e:
+        future.set_exception(e)
+    return future
+
+
+class PreparePool:
+    """
+    純粋な段階を実行するスレッドプール。``with`` で使い、抜けるときに未実行の仕事を取り消す。
+
+        with PreparePool(workers=4) as pool:
+            for prepared in pool.map_ordered(prepare, texture_paths):
+                ...  # メインスレッドで unreal を呼ぶ
+    """
+
+    def __init__(self, workers: int = 1, *, max_pending: Optional[int] = None):
+        self.workers = max(1, int(workers))
+        self.max_pending = max(1, max_pending if max_pending is not None else self.workers * DEFAULT_PENDING_PER_WORKER)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if self.workers > 1:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="TexNamingPrepare")
+
+    @property
+    def parallel(self) -> bool:
+        return self._executor is not None
+
+    def submit(self, fn: Callable[..., R], *args) -> "Future[R]":
+        """fn(*args) をワーカーで実行する。逐次モードではその場で実行した結果を返す。"""
+        if self._executor is None:
+            return _completed(fn, *args)
+        return self._executor.submit(fn, *args)
+
+    def map_ordered(self, fn: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+        """
+        fn(item) をワーカーで実行し、入力順に結果を返す。
+
+        投入済みで未消費の結果は max_pending 件まで（有界キュー）。items は必要な分だけ読み進める。
+        fn の例外は、その結果を受け取る時点で呼び出し元に送出される。
+        """
+        if self._executor is None:
+            for item in items:
+                yield fn(item)
+            return
+        iterator = iter(items)
+        pending: Deque["Future[R]"] = deque(
+            self._executor.submit(fn, item) for item in itertools.islice(iterator, self.max_pending)
+        )
+        try:
+            while pending:
+                result = pending.popleft().result()
+                for item in itertools.islice(iterator, 1):
+                    pending.append(self._executor.submit(fn, item))
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> "PreparePool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
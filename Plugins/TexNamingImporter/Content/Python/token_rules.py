@@ -0,0 +1,101 @@
+"""
+ファイル名トークンに対する宣言的な規則（Config の ``token_rules``）。
+
+各規則は「トークン全体に一致する正規表現」と「一致したときに最終設定へ重ねる上書き」の組:
+
+    "token_rules": [
+        {"name": "lod_hint", "pattern": "LOD[0-9]", "override": {"max_in_game": 512}},
+        {"name": "udim", "pattern": "1[0-9]{3}", "override": {"address_u": "CLAMP", "address_v": "CLAMP"}}
+    ]
+
+TokenRuleSet は全規則を名前付きグループの選択（``(?P<_r0>...)|(?P<_r1>...)``）として 1 つの
+正規表現にまとめ、トークン列を 1 回だけ走査する。規則が増えても走査は 1 回のままで、
+同じトークン（"col", "8x8" など）の判定結果はキャッシュされる。
+
+- 1 つのトークンは宣言順で最初に一致した規則にだけ割り当てられる
+- 上書きは宣言順に適用される（後の規則が優先）
+- パターンの番号付き後方参照（\\1 など）は結合後に番号がずれるため使えない（(?P=name) を使う）。
+  インラインフラグは (?i:...) のように範囲を限定して書く
+
+Config 側の値の検証（上書きのフィールド名・値）は config.py が行い、ここでは扱わない。
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+# 旧来の enable_subuv_texture_override / subuv_max_in_game から作られる規則の名前
+SUBUV_RULE_NAME = "subuv"
+SUBUV_PATTERN = r'^[1-9]\d*[xX][1-9]\d*$'  # 例: 8x8, 4x4, 1x8
+
+# トークン → 一致した規則の番号 のキャッシュ上限（超えたら作り直す）
+_TOKEN_CACHE_LIMIT = 65536
+_NO_MATCH = -1
+
+
+@dataclass(frozen=True)
+class TokenRule:
+    name: str
+    pattern: str
+    # (フィールド名, 値) の組。値は ResolvedTextureParams に渡せる形（列挙体・int）に変換済み
+    override: Tuple[Tuple[str, Any], ...] = ()
+
+    def apply(self, params):
+        """params（ResolvedTextureParams）に上書きを重ねた複製を返す。"""
+        return params.replace(**dict(self.override)) if self.override else params
+
+
+class TokenRuleSet:
+    """規則をまとめて事前コンパイルし、トークン列を 1 回の走査で判定する。"""
+
+    def __init__(self, rules: Sequence[TokenRule] = ()):
+        self.rules: Tuple[TokenRule, ...] = tuple(rules)
+        self._regex: Optional[re.Pattern] = None
+        self._cache: Dict[str, int] = {}
+        if self.rules:
+            for rule in self.rules:
+                try:
+                    re.compile(rule.pattern)
+                except re.error as e:
+                    raise ValueError(f"token_rules['{rule.name}'] の pattern が不正です: {e}") from e
+            combined = "|".join(f"(?P<_r{i}>{rule.pattern})" for i, rule in enumerate(self.rules))
+            try:
+                self._regex = re.compile(combined)
+            except re.error as e:
+                raise ValueError(f"token_rules のパターンを 1 つの正規表現にまとめられません: {e}") from e
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def _match_token(self, token: str) -> int:
+        cached = self._cache.get(token)
+        if cached is not None:
+            return cached
+        m = self._regex.fullmatch(token)
+        # 外側のグループは内側のグループより後に閉じるため、lastgroup は一致した規則のグループになる
+        index = int(m.lastgroup[2:]) if m is not None else _NO_MATCH
+        if len(self._cache) >= _TOKEN_CACHE_LIMIT:
+            self._cache.clear()
+        self._cache[token] = index
+        return index
+
+    def match(self, tokens: Sequence[str]) -> Tuple[TokenRule, ...]:
+        """トークン列に一致した規則を宣言順で返す（各規則は 1 回まで）。"""
+        if self._regex is None or not tokens:
+            return ()
+        found = 0
+        for token in tokens:
+            index = self._match_token(token)
+            if index != _NO_MATCH:
+                found |= 1 << index
+        if not found:
+            return ()
+        return tuple(rule for i, rule in enumerate(self.rules) if found >> i & 1)
+
+
+@lru_cache(maxsize=32)
+def compile_token_rules(rules: Tuple[TokenRule, ...]) -> TokenRuleSet:
+    """規則の組ごとに 1 回だけ TokenRuleSet を構築する（ディレクトリ別の上書きでも共有される）。"""
+    return TokenRuleSet(rules)
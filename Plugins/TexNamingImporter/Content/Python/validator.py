@@ -1,9 +1,12 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 import re
 from typing import Dict, List, Optional, Iterable
 
+from token_rules import SUBUV_PATTERN  # noqa: F401  例: 8x8, 4x4, 1x8（後方互換のため再公開）
+
 @dataclass
 class SuffixValidationResult:
     ok: bool
@@ -104,23 +107,6 @@ def _extract_dir_from_asset_path(asset_path: str) -> str:
     return s[:last_slash]
 
 
-def _is_under_dir(path_dir: str, allowed_dir: str) -> bool:
-    """
-    ディレクトリ境界を考慮して path_dir が allowed_dir 配下かどうかを判定。
-    同一ディレクトリも True。
-    """
-    pd = _normalize_unreal_path(path_dir)
-    ad = _normalize_unreal_path(allowed_dir)
-
-    if not pd or not ad:
-        return False
-
-    if pd == ad:
-        return True
-    # 境界を厳密にするため、allowed の末尾に '/' を付けて startswith を見る
-    return pd.startswith(ad + "/")
-
-
 def validate_directory(asset_path: str, allowed_dirs: Iterable[str]) -> bool:
     """
     第一引数のテクスチャ（アセット）パスが、第二引数のいずれかのディレクトリ配下にあるか判定する。
@@ -132,16 +118,14 @@ def validate_directory(asset_path: str, allowed_dirs: Iterable[str]) -> bool:
     Returns:
         bool: いずれかの許容ディレクトリの「直下または配下」にあれば True、そうでなければ False
     """
-    if not asset_path:
-        return False
-    path_dir = _extract_dir_from_asset_path(asset_path)
-    if not path_dir:
-        return False
+    # 許容ディレクトリの組ごとにトライを 1 回だけ構築し、判定はパスの深さに比例した時間で行う
+    return _run_dir_index(tuple(allowed_dirs or ())).contains(asset_path)
 
-    for d in allowed_dirs or []:
-        if _is_under_dir(path_dir, d):
-            return True
-    return False
+
+@lru_cache(maxsize=32)
+def _run_dir_index(allowed_dirs: tuple):
+    from directory_index import RunDirIndex  # directory_index は本モジュールの正規化関数を使うため遅延 import
+    return RunDirIndex(allowed_dirs)
 
 
 def regex_any_match(pattern: str, candidates: List[str]) -> bool:
@@ -151,11 +135,12 @@ def regex_any_match(pattern: str, candidates: List[str]) -> bool:
       - 1つもマッチしなければ False
       - パターンが不正（re.error）の場合は False
     ここでの「マッチ」は re.search（部分一致）です。完全一致は ^ と $ を使ってください。
+    トークン由来の規則を複数判定する場合は token_rules.TokenRuleSet（1 回の走査で判定）を使ってください。
     '''
     if not pattern or not candidates:
         return False
     try:
-        reg = re.compile(pattern)
+        reg = _compile_pattern(pattern)
     except re.error:
         return False
     for s in candidates:
@@ -163,4 +148,8 @@ def regex_any_match(pattern: str, candidates: List[str]) -> bool:
             continue
         if reg.search(str(s)):
             return True
-    return False
\ No newline at end of file
+    return False
+
+
+# regex_any_match のパターンは呼び出しごとに同じものが渡されるため、コンパイル結果を使い回す
+_compile_pattern = lru_cache(maxsize=64)(re.compile)
@@ -13,6 +13,8 @@
 #include "IPythonScriptPlugin.h"
 #include "Subsystems/ImportSubsystem.h"
 #include "Misc/Paths.h"
+#include "Misc/CoreDelegates.h"
+#include "HAL/PlatformTime.h"
 #include "Engine/Texture.h"
 
 #include "Misc/FileHelper.h"
@@ -25,6 +27,9 @@
 
 static const FName TexNamingImporterTabName("TexNamingImporter");
 
+/** 最後のインポートからフラッシュまでの待ち時間（秒）。複数ファイルのインポートを 1 回にまとめる */
+static constexpr double PendingTextureDebounceSeconds = 0.25;
+
 #define LOCTEXT_NAMESPACE "FTexNamingImporterModule"
 
 void FTexNamingImporterModule::StartupModule()
@@ -59,11 +64,19 @@ void FTexNamingImporterModule::StartupModule()
 	
 	Listener = TStrongObjectPtr<UTextureImportBridgeListener>(NewObject<UTextureImportBridgeListener>());
 	Listener->Initialize(FOnTextureImported::CreateRaw(this, &FTexNamingImporterModule::HandleTexturePostImport));
-	
+
+	// 終了直前のインポートもデバウンス待ちで捨てずに処理する
+	PreExitHandle = FCoreDelegates::OnPreExit.AddRaw(this, &FTexNamingImporterModule::HandlePreExit);
 }
 
 void FTexNamingImporterModule::ShutdownModule()
 {
+	FCoreDelegates::OnPreExit.Remove(PreExitHandle);
+	PreExitHandle.Reset();
+
+	// 通常は OnPreExit で処理済み。モジュールだけがアンロードされる場合も、Python が使える間に処理する
+	HandlePreExit();
+
 #if WITH_EDITOR
 	if (GEditor)
 	{
@@ -161,7 +174,7 @@ void FTexNamingImporterModule::LoadDirectorySettings()
 
 		if (!Dir.IsEmpty())
 		{
-			RunDirs.AddUnique(Dir);
+			RunDirs.Add(Dir);
 		}
 	}
 
@@ -178,46 +191,116 @@ bool FTexNamingImporterModule::IsUnderRunDir(const FString& LongPackagePath) con
 		return false;
 	}
 
-	for (const FString& Root : RunDirs)
+	// 自身から親ディレクトリへ辿り、いずれかが RunDirs にあれば配下
+	// （run_dir の数によらずパスの深さ分の検索で済む）
+	FString Dir = LongPackagePath;
+	if (Dir.EndsWith(TEXT("/")))
+	{
+		Dir.LeftChopInline(1);
+	}
+	while (!Dir.IsEmpty())
 	{
-		// 同一 or 配下のときに真
-		if (LongPackagePath.Equals(Root, ESearchCase::IgnoreCase))
+		if (RunDirs.Contains(Dir))
 		{
 			return true;
 		}
-		if (LongPackagePath.StartsWith(Root + TEXT("/"), ESearchCase::IgnoreCase))
+		int32 SlashIndex = INDEX_NONE;
+		if (!Dir.FindLastChar(TEXT('/'), SlashIndex) || SlashIndex <= 0)
 		{
-			return true;
+			break;
 		}
+		Dir.LeftInline(SlashIndex);
 	}
 	return false;
 }
 
-void FTexNamingImporterModule::RunPythonForTexture(class UTexture* Texture)
+void FTexNamingImporterModule::EnqueueTextureForPython(class UTexture* Texture)
 {
 	if (!ensure(Texture))
 		return;
-	
-	
-	// Compose a Python one-liner to set cwd/sys.path and call your module function
+
+	// 同じインポートバースト内の重複は 1 回にまとめる
 	const FString ObjectPath = Texture->GetPathName();
-	if (IPythonScriptPlugin::Get() != nullptr)
+	if (!PendingTexturePathSet.Contains(ObjectPath))
 	{
-		const bool bOk = RunPythonFile(TEXT("texture_configurator.py"),
+		PendingTexturePathSet.Add(ObjectPath);
+		PendingTexturePaths.Add(ObjectPath);
+	}
+	LastEnqueueTime = FPlatformTime::Seconds();
+
+	if (ShouldFlushImmediately())
 	{
-				FString::Format(TEXT("{0}"), {FStringFormatArg(ConfigFilePath)}),
-				FString::Format(TEXT("{0}"), {FStringFormatArg(ObjectPath)}),
-				TEXT("--delete"), //suffixエラー時に削除するオプション引数
-				TEXT("--dialog") //エラー時にダイアログを表示するオプション引数
-			});
+		// スクリプト・コマンドレットからのインポートは、ティッカーが回る前に終了し得るため同期で処理する
+		FlushPendingTextures(false);
+		return;
+	}
+
+	if (!PendingTickerHandle.IsValid())
+	{
+		PendingTickerHandle = FTSTicker::GetCoreTicker().AddTicker(
+			FTickerDelegate::CreateRaw(this, &FTexNamingImporterModule::TickPendingTextures));
+	}
+}
+
+bool FTexNamingImporterModule::TickPendingTextures(float DeltaTime)
+{
+	// インポートが続いている間は待つ（最後のインポートからデバウンス時間が経過したらフラッシュ）
+	if (FPlatformTime::Seconds() - LastEnqueueTime < PendingTextureDebounceSeconds)
+	{
+		return true;
+	}
+
+	PendingTickerHandle.Reset();
+	FlushPendingTextures();
+	return false;
+}
+
+bool FTexNamingImporterModule::ShouldFlushImmediately() const
+{
+	return IsRunningCommandlet() || !GIsEditor;
+}
+
+void FTexNamingImporterModule::HandlePreExit()
+{
+	if (PendingTickerHandle.IsValid())
+	{
+		FTSTicker::GetCoreTicker().RemoveTicker(PendingTickerHandle);
+		PendingTickerHandle.Reset();
+	}
+	// 終了処理中はダイアログを出さない（エラーはログとエラーレポートに残る）
+	FlushPendingTextures(false);
+}
+
+void FTexNamingImporterModule::FlushPendingTextures(bool bShowDialogOnError)
+{
+	if (PendingTexturePaths.Num() == 0)
+	{
+		return;
+	}
+
+	TArray<FString> ObjectPaths = MoveTemp(PendingTexturePaths);
+	PendingTexturePaths.Reset();
+	PendingTexturePathSet.Reset();
+
+	// 常駐サービス（texture_configurator_service.py）の configure_many() を 1 回だけ呼び出す
+	IPythonScriptPlugin* PythonPlugin = IPythonScriptPlugin::Get();
+	if (PythonPlugin != nullptr && PythonPlugin->IsPythonAvailable())
+	{
+		UE_LOG(LogTemp, Log, TEXT("Configure %d imported textures"), ObjectPaths.Num());
+		const bool bOk = RunPythonService(ObjectPaths,
+			true, //suffixエラー時に削除する
+			bShowDialogOnError
+		);
 		if (!bOk)
 		{
-			UE_LOG(LogTemp, Warning, TEXT("Python execution failed for %s"), *ObjectPath);
+			UE_LOG(LogTemp, Warning, TEXT("Python execution failed for %d textures (first: %s)"),
+				ObjectPaths.Num(), *ObjectPaths[0]);
 		}
 	}
 	else
 	{
-		UE_LOG(LogTemp, Error, TEXT("PythonScriptPlugin not available. Enable it in your .uplugin"));
+		UE_LOG(LogTemp, Error, TEXT("PythonScriptPlugin not available; %d imported textures were not configured (first: %s)"),
+			ObjectPaths.Num(), *ObjectPaths[0]);
 	}
 }
 
@@ -317,6 +400,40 @@ bool FTexNamingImporterModule::RunPythonFile(const FString& ScriptFileName, cons
 	
 }
 
+bool FTexNamingImporterModule::RunPythonService(const TArray<FString>& ObjectPaths, bool bDeleteOnSuffixError, bool bShowDialogOnError)
+{
+	if (!IPythonScriptPlugin::Get())
+	{
+		UE_LOG(LogTemp, Error, TEXT("PythonScriptPlugin is not available."));
+		return false;
+	}
+
+	FString ImportDirAbs = PythonDir;
+	FPaths::MakeStandardFilename(ImportDirAbs);
+
+	const FString EscImpDir = PyEscape(ImportDirAbs);
+	const FString EscConfig = PyEscape(ConfigFilePath);
+
+	// sys.path への追加は初回のみ。モジュールは一度 import されれば常駐し、
+	// Config のパースも Python 側でキャッシュされる。
+	TStringBuilder<512> SB;
+	SB.Append(TEXT("import sys\n"));
+	SB.Appendf(TEXT("if '%s' not in sys.path:\n"), *EscImpDir);
+	SB.Appendf(TEXT("    sys.path.insert(0, '%s')\n"), *EscImpDir);
+	SB.Append(TEXT("import texture_configurator_service\n"));
+	SB.Append(TEXT("texture_configurator_service.configure_many(["));
+	for (int32 Index = 0; Index < ObjectPaths.Num(); ++Index)
+	{
+		SB.Appendf(TEXT("%s'%s'"), Index == 0 ? TEXT("") : TEXT(", "), *PyEscape(ObjectPaths[Index]));
+	}
+	SB.Appendf(TEXT("], config_path='%s', delete_on_suffix_error=%s, show_dialog_on_error=%s)\n"),
+		*EscConfig,
+		bDeleteOnSuffixError ? TEXT("True") : TEXT("False"),
+		bShowDialogOnError ? TEXT("True") : TEXT("False"));
+
+	return IPythonScriptPlugin::Get()->ExecPythonCommand(SB.ToString());
+}
+
 void FTexNamingImporterModule::PluginButtonClicked()
 {
 	FGlobalTabmanager::Get()->TryInvokeTab(TexNamingImporterTabName);
@@ -340,7 +457,7 @@ void FTexNamingImporterModule::HandleTexturePostImport(class UTexture* Texture)
 		return;
 	}
 	
-	RunPythonForTexture(Texture);
+	EnqueueTextureForPython(Texture);
 }
 
 void FTexNamingImporterModule::RegisterMenus()
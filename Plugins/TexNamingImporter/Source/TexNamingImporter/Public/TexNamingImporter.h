@@ -3,6 +3,7 @@
 #pragma once
 
 #include "Modules/ModuleManager.h"
+#include "Containers/Ticker.h"
 
 class FToolBarBuilder;
 class FMenuBuilder;
@@ -26,8 +27,20 @@ public:
 private:
 	void RegisterMenus();
 
-	/** Runs your python entrypoint with asset context */
-	void RunPythonForTexture(class UTexture* Texture);
+	/** インポートされたテクスチャをキューに積み、デバウンス後にまとめて Python へ渡す */
+	void EnqueueTextureForPython(class UTexture* Texture);
+
+	/** キューに溜まったテクスチャを 1 回の Python 呼び出しで処理する */
+	void FlushPendingTextures(bool bShowDialogOnError = true);
+
+	/** デバウンスせずその場で処理すべきか（コマンドレット・非エディタ実行ではティッカーが回る前に終了し得る） */
+	bool ShouldFlushImmediately() const;
+
+	/** エンジン終了前（Python がまだ使える時点）にキューを処理する */
+	void HandlePreExit();
+
+	/** デバウンス用ティッカー。最後のインポートから一定時間経過したらフラッシュする */
+	bool TickPendingTextures(float DeltaTime);
 
 	/** 設定のロード */
 	void LoadDirectorySettings();
@@ -40,14 +53,27 @@ private:
 	
 	bool RunPythonFile(const FString& ScriptFileName, const TArray<FString>& Args = {});
 
+	/** 常駐サービス texture_configurator_service.configure_many() を呼び出す */
+	bool RunPythonService(const TArray<FString>& ObjectPaths, bool bDeleteOnSuffixError, bool bShowDialogOnError);
+
 private:
 	/** 設定ファイルのフルパス */
 	FString ConfigFilePath;
-	/** 許可ディレクトリ（/Game/… のロングパッケージパス。末尾スラッシュ無しで保持） */
-	TArray<FString> RunDirs;
+	/** 許可ディレクトリ（/Game/… のロングパッケージパス。末尾スラッシュ無しで保持）。
+	 *  FString のハッシュ・比較は大小文字を区別しないため、判定は親ディレクトリを辿るだけで済む */
+	TSet<FString> RunDirs;
 	TSharedRef<class SDockTab> OnSpawnPluginTab(const class FSpawnTabArgs& SpawnTabArgs);
 	/** Strong ref so the UObject listener doesn’t get GC’d */
 	TStrongObjectPtr<UTextureImportBridgeListener> Listener;
+	/** インポート待ちテクスチャのオブジェクトパス（到着順、重複なし） */
+	TArray<FString> PendingTexturePaths;
+	TSet<FString> PendingTexturePathSet;
+	/** 最後にキューへ積んだ時刻（FPlatformTime::Seconds） */
+	double LastEnqueueTime = 0.0;
+	/** フラッシュ待ちのティッカー（未登録なら無効） */
+	FTSTicker::FDelegateHandle PendingTickerHandle;
+	/** FCoreDelegates::OnPreExit の登録 */
+	FDelegateHandle PreExitHandle;
 	/** Absolute path to {Plugin}/Content/Python */
 	FString PythonDir;
 	TSharedPtr<class FUICommandList> PluginCommands;